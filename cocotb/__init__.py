@@ -252,6 +252,9 @@ def _initialise_testbench(argv_):
     global top
     top = cocotb.handle.SimHandle(handle)
 
+    if "COCOTB_HIERARCHY_CACHE" in os.environ:
+        _load_hierarchy_cache(os.environ["COCOTB_HIERARCHY_CACHE"])
+
     # start Regression Manager
     global regression_manager
     regression_manager = RegressionManager.from_discovery(top)
@@ -261,12 +264,47 @@ def _initialise_testbench(argv_):
     return True
 
 
+def _load_hierarchy_cache(filename):
+    """Use the hierarchy cache in *filename* for the design below :data:`top`."""
+    from cocotb._hierarchy_cache import HierarchyCache, cache_key
+    from cocotb.handle import ConstantObject
+
+    sources = os.getenv("VERILOG_SOURCES", "").split() + os.getenv("VHDL_SOURCES", "").split()
+    if not sources and top._def_file:
+        # Without the list of sources, at least notice changes to the toplevel
+        sources = [top._def_file]
+
+    # Parameters and generics can be overridden on the command line
+    arguments = {name: os.getenv(name, "") for name in ("COMPILE_ARGS", "SIM_ARGS", "EXTRA_ARGS")}
+
+    key = cache_key(top._name, SIM_NAME, SIM_VERSION, sources, arguments)
+    cache = HierarchyCache.load(filename, key)
+
+    # Looked up before the cache is in use, so these handles come from the simulator
+    def parameter_value(name):
+        hdl = top._id(name, extended=False)
+        return str(hdl.value) if isinstance(hdl, ConstantObject) else None
+
+    changed = [name for name, value in cache.parameters.items() if parameter_value(name) != value]
+    if changed:
+        cache.discard("parameter %s changed" % ", ".join(changed))
+
+    cocotb.handle._hierarchy_cache = cache
+    if cache.children(top._path) is None:
+        top._discover_all()
+        cache.parameters = {
+            str(key): str(hdl.value) for key, hdl in top._sub_handles.items()
+            if isinstance(hdl, ConstantObject)
+        }
+
+
 def _sim_event(level, message):
     """Function that can be called externally to signal an event."""
     # SIM_INFO = 0
     SIM_TEST_FAIL = 1
     SIM_FAIL = 2
     from cocotb.result import TestFailure, SimFailure
+    from cocotb.log import _flush_handlers
 
     if level is SIM_TEST_FAIL:
         scheduler.log.error("Failing test at simulator request")
@@ -280,6 +318,9 @@ def _sim_event(level, message):
     else:
         scheduler.log.error("Unsupported sim event")
 
+    # The simulator may exit straight away, so the log must be written out now
+    _flush_handlers()
+
     return True
 
 
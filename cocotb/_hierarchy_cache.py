@@ -0,0 +1,131 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""On-disk cache of the design hierarchy, see :envvar:`COCOTB_HIERARCHY_CACHE`."""
+
+import hashlib
+import json
+import os
+
+from cocotb.log import SimLog
+
+# Bumped whenever the layout of the entries changes
+_FORMAT = 2
+
+
+def sources_digest(filenames):
+    """Return a SHA-1 digest of the names and contents of the HDL source files."""
+    digest = hashlib.sha1()
+    for filename in filenames:
+        digest.update(filename.encode())
+        try:
+            with open(filename, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+        except OSError:
+            # Missing sources still change the key, through their name
+            pass
+    return digest.hexdigest()
+
+
+def cache_key(toplevel, sim_name, sim_version, sources, arguments=None):
+    """Return the key which a cache file must match to be used.
+
+    *arguments* maps the names of the variables which hold the compile and
+    simulation arguments to their values, as these can override parameters
+    and generics.
+    """
+    return {
+        "format": _FORMAT,
+        "toplevel": toplevel,
+        "simulator": sim_name,
+        "simulator_version": sim_version,
+        "sources": sources_digest(sources),
+        "arguments": dict(arguments) if arguments is not None else {},
+    }
+
+
+class HierarchyCache:
+    """The children of the hierarchy regions of a design, keyed by region path.
+
+    Each child is recorded as a list
+    ``[key, name, type_string, gpi_type, is_const, length, range]``,
+    where *key* is the key of the child in the ``_sub_handles`` of its parent.
+    *length* and *range* are ``None`` where they do not apply.
+
+    The values of the parameters of the toplevel are stored as well, in :attr:`parameters`,
+    so that a run with different values does not use the cache.
+    """
+
+    def __init__(self, filename, key):
+        self.filename = filename
+        self.key = key
+        self._regions = {}
+        self.parameters = {}
+        self._dirty = False
+        self._stale = False
+        self.log = SimLog("cocotb.hierarchy_cache")
+
+    @classmethod
+    def load(cls, filename, key):
+        """Return the cache stored in *filename*, or an empty one if it is missing or does not match *key*."""
+        cache = cls(filename, key)
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as e:
+            cache.log.warning("Ignoring unreadable hierarchy cache %s: %s", filename, e)
+            return cache
+
+        if data.get("key") != key:
+            cache.log.info("Hierarchy cache %s is out of date, rebuilding it", filename)
+            return cache
+
+        cache._regions = data["regions"]
+        cache.parameters = data["parameters"]
+        cache.log.info("Using hierarchy cache %s (%d regions)", filename, len(cache._regions))
+        return cache
+
+    def discard(self, reason):
+        """Drop the cached hierarchy, so that it is rebuilt during this run."""
+        self.log.info("Hierarchy cache %s is out of date (%s), rebuilding it", self.filename, reason)
+        self._regions = {}
+        self.parameters = {}
+
+    def children(self, path):
+        """Return the cached children of the region at *path*, or ``None`` if it is not cached."""
+        return self._regions.get(path)
+
+    def add_region(self, path, entries):
+        """Record the children of the region at *path*, found by walking the simulator."""
+        if self._stale:
+            return
+        self._regions[path] = entries
+        self._dirty = True
+
+    def invalidate(self, reason):
+        """Stop using the cache, and remove its file so that the next run rebuilds it."""
+        if self._stale:
+            return
+        self.log.warning("Hierarchy cache %s does not match the design (%s), removing it",
+                         self.filename, reason)
+        self._stale = True
+        self._regions = {}
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass
+
+    def save(self):
+        """Write the cache to its file, if regions were added to it during this run."""
+        if not self._dirty or self._stale:
+            return
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, "w") as f:
+            json.dump({"key": self.key, "parameters": self.parameters, "regions": self._regions}, f)
+        # Replaced atomically, so simulations running in parallel never read a partial file
+        os.replace(tmp_filename, self.filename)
+        self._dirty = False
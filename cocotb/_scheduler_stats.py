@@ -0,0 +1,118 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Lightweight scheduler instrumentation, see :envvar:`COCOTB_SCHEDULER_STATS`."""
+
+import collections
+import csv
+import json
+
+
+class SchedulerStats:
+    """Counters collected by the scheduler while a test runs.
+
+    A *crossing* is an entry into the scheduler from a simulator callback.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._tasks = {}            # RunningTask -> [wakes, cpu_s]
+        self._finished_tasks = []
+        self.triggers = collections.Counter()
+        self.crossings = 0
+        self.timesteps = 0
+        self.max_crossings_per_timestep = 0
+        self._timestep = None
+        self._timestep_crossings = 0
+        self.write_flushes = 0
+        self.writes = 0
+        self.write_time_s = 0.0
+
+    def task_woken(self, task, cpu_s):
+        record = self._tasks.get(task)
+        if record is None:
+            record = self._tasks[task] = [0, 0.0]
+        record[0] += 1
+        record[1] += cpu_s
+
+    def task_done(self, task):
+        record = self._tasks.pop(task, None)
+        if record is not None:
+            self._finished_tasks.append((_task_name(task), record[0], record[1]))
+
+    def trigger_fired(self, trigger):
+        self.triggers[type(trigger).__qualname__] += 1
+
+    def crossing(self, sim_time):
+        if sim_time != self._timestep:
+            self._timestep = sim_time
+            self._timestep_crossings = 0
+            self.timesteps += 1
+        self._timestep_crossings += 1
+        self.crossings += 1
+        if self._timestep_crossings > self.max_crossings_per_timestep:
+            self.max_crossings_per_timestep = self._timestep_crossings
+
+    def writes_flushed(self, n_writes, time_s):
+        self.write_flushes += 1
+        self.writes += n_writes
+        self.write_time_s += time_s
+
+    def report(self, test_name):
+        """Return the counters as a JSON-serializable dictionary."""
+        tasks = self._finished_tasks + [
+            (_task_name(task), wakes, cpu_s) for task, (wakes, cpu_s) in self._tasks.items()
+        ]
+        tasks.sort(key=lambda t: t[2], reverse=True)
+        return {
+            'test': test_name,
+            'tasks': [
+                {'name': name, 'wakes': wakes, 'cpu_s': cpu_s}
+                for name, wakes, cpu_s in tasks
+            ],
+            'triggers': dict(self.triggers.most_common()),
+            'crossings': {
+                'total': self.crossings,
+                'timesteps': self.timesteps,
+                'max_per_timestep': self.max_crossings_per_timestep,
+                'mean_per_timestep': self.crossings / self.timesteps if self.timesteps else 0.0,
+            },
+            'writes': {
+                'flushes': self.write_flushes,
+                'values': self.writes,
+                'time_s': self.write_time_s,
+            },
+        }
+
+
+def _task_name(task):
+    return "{} ({})".format(task.__qualname__, task._coro.__qualname__)
+
+
+def write_report(filename, reports):
+    """Write the per-test *reports* to *filename*.
+
+    The file is written as CSV if its name ends in ``.csv``, and as JSON otherwise.
+    """
+    if not filename.lower().endswith('.csv'):
+        with open(filename, 'w') as f:
+            json.dump(reports, f, indent=2)
+        return
+
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['test', 'section', 'name', 'count', 'time_s'])
+        for report in reports:
+            test = report['test']
+            for task in report['tasks']:
+                writer.writerow([test, 'task', task['name'], task['wakes'], task['cpu_s']])
+            for name, count in report['triggers'].items():
+                writer.writerow([test, 'trigger', name, count, ''])
+            for name, count in report['crossings'].items():
+                writer.writerow([test, 'crossings', name, count, ''])
+            writes = report['writes']
+            writer.writerow([test, 'writes', 'flushes', writes['flushes'], writes['time_s']])
+            writer.writerow([test, 'writes', 'values', writes['values'], ''])
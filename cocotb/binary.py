@@ -86,6 +86,15 @@ def resolve(string):
     return string.translate(_resolve_table)
 
 
+# Translation tables that split a binary string into the bits that are ``1``
+# and the bits that are neither ``0`` nor ``1``
+_ones_table = str.maketrans({c: "0" for c in _RESOLVE_TO_0 + _RESOLVE_TO_1 + _RESOLVE_TO_CHOICE})
+_unknown_table = str.maketrans(dict(
+    {"0": "0", "1": "0"},
+    **{c: "1" for c in _RESOLVE_TO_0 + _RESOLVE_TO_1 + _RESOLVE_TO_CHOICE}
+))
+
+
 def _clog2(val):
     if val < 0:
         raise ValueError("_clog2 can't take a negative")
@@ -122,7 +131,15 @@ class BinaryValue:
     >>> print(vec.buff)
     b'*'
 
+    The value is stored as an integer of the ``0`` and ``1`` bits
+    together with a mask of any other bits,
+    and only converted to a string of characters when one is needed.
+
+    .. versionchanged:: 1.5
+        Instances use ``__slots__``, so arbitrary attributes can no longer be set on them.
     """
+    __slots__ = ('_binstr', '_int', '_unknown', '_n_bits', 'big_endian', 'binaryRepresentation')
+
     _permitted_chars  = _RESOLVE_TO_0 +_RESOLVE_TO_1 + _RESOLVE_TO_CHOICE + "01"  # noqa
 
     def __init__(self, value=None, n_bits=None, bigEndian=True,
@@ -141,7 +158,14 @@ class BinaryValue:
                 Defaults to unsigned representation.
             bits (int, optional): Deprecated: Compatibility wrapper for :attr:`n_bits`.
         """
-        self._str = ""
+        # The value is held in _binstr, or in _int and _unknown, or in both.
+        # _int has the bits that are 1, in the order of the binary string,
+        # and _unknown the bits that are neither 0 nor 1.
+        # _int is None while only _binstr is valid,
+        # _binstr is None while only _int is valid, which implies _unknown == 0.
+        self._binstr = ""
+        self._int = None
+        self._unknown = 0
         self.big_endian = bigEndian
         self.binaryRepresentation = binaryRepresentation
 
@@ -157,10 +181,6 @@ class BinaryValue:
 
         self._n_bits = n_bits
 
-        self._convert_to = self._convert_to_map[self.binaryRepresentation].__get__(self, self.__class__)
-
-        self._convert_from = self._convert_from_map[self.binaryRepresentation].__get__(self, self.__class__)
-
         if value is not None:
             self.assign(value)
 
@@ -192,6 +212,42 @@ class BinaryValue:
                 .format(type(value).__qualname__)
             )
 
+    @property
+    def _str(self):
+        """The value as a string of characters, built on demand."""
+        if self._binstr is None:
+            self._binstr = format(self._int, "0{}b".format(self._n_bits))
+        return self._binstr
+
+    @_str.setter
+    def _str(self, string):
+        self._binstr = string
+        self._int = None
+
+    def _set_int(self, value):
+        """Set the value from the integer of its bits, which must all be ``0`` or ``1``."""
+        self._binstr = None
+        self._int = value
+        self._unknown = 0
+
+    def _known_int(self):
+        """Return the integer of the bits, or ``None`` if any bit is not ``0`` or ``1``."""
+        if self._int is None:
+            string = self._binstr
+            if string[:1] in ("0", "1"):
+                try:
+                    self._int = int(string, 2)
+                    self._unknown = 0
+                    return self._int
+                except ValueError:
+                    pass
+            self._int = int("0" + string.translate(_ones_table), 2)
+            # an empty value has no known bits
+            self._unknown = int(string.translate(_unknown_table), 2) if string else -1
+        if self._unknown:
+            return None
+        return self._int
+
     def _convert_to_unsigned(self, x):
         x = bin(x)
         if x[0] == '-':
@@ -319,11 +375,35 @@ class BinaryValue:
     @property
     def integer(self):
         """The integer representation of the underlying vector."""
-        return self._convert_from(self._str)
+        value = self._known_int()
+        if value is not None:
+            if self.binaryRepresentation == BinaryRepresentation.UNSIGNED:
+                return value
+            n_bits = len(self)
+            if self.binaryRepresentation == BinaryRepresentation.TWOS_COMPLEMENT and n_bits > 1:
+                if value >> (n_bits - 1):
+                    return value - (1 << n_bits)
+                return value
+        return self._convert_from_map[self.binaryRepresentation](self, self._str)
 
     @integer.setter
     def integer(self, val):
-        self._str = self._convert_to(val)
+        n_bits = self._n_bits
+        if n_bits and isinstance(val, int):
+            # Shortcuts for the common cases which need no padding or truncation
+            if self.binaryRepresentation == BinaryRepresentation.UNSIGNED:
+                if 0 <= val < (1 << n_bits):
+                    if self.big_endian:
+                        # big-endian values are padded on the right
+                        val <<= n_bits - max(val.bit_length(), 1)
+                    self._set_int(val)
+                    return
+            elif (self.binaryRepresentation == BinaryRepresentation.TWOS_COMPLEMENT
+                    and not self.big_endian):
+                if -(1 << (n_bits - 1)) <= val < (1 << (n_bits - 1)):
+                    self._set_int(val & ((1 << n_bits) - 1))
+                    return
+        self._str = self._convert_to_map[self.binaryRepresentation](self, val)
 
     @property
     def value(self):
@@ -340,6 +420,12 @@ class BinaryValue:
     @property
     def signed_integer(self):
         """The signed integer representation of the underlying vector."""
+        value = self._known_int()
+        if value is not None:
+            n_bits = len(self)
+            if value >> (n_bits - 1):
+                return value - (1 << n_bits)
+            return value
         ival = int(self._str.translate(_resolve_table), 2)
         bits = len(self._str)
         signbit = (1 << (bits - 1))
@@ -365,6 +451,8 @@ class BinaryValue:
         This is similar to the SystemVerilog Assertion ``$isunknown`` system function
         or the VHDL function ``is_x`` (with an inverted meaning).
         """
+        if self._known_int() is not None:
+            return True
         return not any(char in self._str for char in _RESOLVE_TO_CHOICE)
 
     @property
@@ -379,6 +467,11 @@ class BinaryValue:
             Note that for older versions used with Python 2 these types were
             indistinguishable.
         """
+        value = self._known_int()
+        if value is not None:
+            buff = value.to_bytes((len(self) + 7) // 8, "big")
+            return buff if self.big_endian else buff[::-1]
+
         bits = self._str.translate(_resolve_table)
 
         if len(bits) % 8:
@@ -397,6 +490,14 @@ class BinaryValue:
 
     @buff.setter
     def buff(self, val: bytes):
+        n_bits = self._n_bits
+        if n_bits and isinstance(val, (bytes, bytearray)) and 8 * len(val) <= n_bits:
+            if self.big_endian:
+                # big-endian values are padded on the right
+                self._set_int(int.from_bytes(val, "big") << (n_bits - 8 * len(val)))
+            else:
+                self._set_int(int.from_bytes(val, "little"))
+            return
         if not self.big_endian:
             val = reversed(val)
         self._str = ''.join([format(char, "08b") for char in val])
@@ -443,6 +544,13 @@ class BinaryValue:
     def _set_trusted_binstr(self, string):
         self._str = string
 
+    def _set_trusted_int(self, value):
+        """Set the value from the integer of its bits, skipping all checks.
+
+        *value* must be non-negative and fit in :attr:`n_bits` bits.
+        """
+        self._set_int(value)
+
     @property
     def n_bits(self):
         """The number of bits of the binary value."""
@@ -476,10 +584,8 @@ class BinaryValue:
         True
 
         """
-        for char in self._str:
-            if char == "1":
-                return True
-        return False
+        self._known_int()
+        return bool(self._int)
 
     def __eq__(self, other):
         if isinstance(other, BinaryValue):
@@ -648,7 +754,9 @@ class BinaryValue:
         return self.integer
 
     def __len__(self):
-        return len(self.binstr)
+        if self._binstr is None:
+            return self._n_bits
+        return len(self._binstr)
 
     def __getitem__(self, key):
         """BinaryValue uses Verilog/VHDL style slices as opposed to Python
@@ -664,7 +772,7 @@ class BinaryValue:
                 if first > second:
                     raise IndexError('Big Endian indices must be specified '
                                      'low to high')
-                _binstr = self.binstr[first:(second + 1)]
+                low, high = first, second + 1
             else:
                 if first < 0 or second < 0:
                     raise IndexError('BinaryValue does not support negative '
@@ -676,15 +784,29 @@ class BinaryValue:
                                      'high to low')
                 high = self._n_bits - second
                 low = self._n_bits - 1 - first
-                _binstr = self.binstr[low:high]
         else:
             index = key
             if index > self._n_bits - 1:
                 raise IndexError('Index greater than number of bits.')
             if self.big_endian:
-                _binstr = self.binstr[index]
+                low = index
             else:
-                _binstr = self.binstr[self._n_bits-1-index]
+                low = self._n_bits - 1 - index
+            high = low + 1
+
+        value = self._known_int()
+        n_bits = len(self)
+        if value is not None and 0 <= low < high <= n_bits:
+            # Extract the bits without going through the string
+            rv = BinaryValue(n_bits=high - low, bigEndian=self.big_endian,
+                             binaryRepresentation=self.binaryRepresentation)
+            rv._set_int((value >> (n_bits - high)) & ((1 << (high - low)) - 1))
+            return rv
+
+        if isinstance(key, slice):
+            _binstr = self.binstr[low:high]
+        else:
+            _binstr = self.binstr[low]
         rv = BinaryValue(n_bits=len(_binstr), bigEndian=self.big_endian,
                          binaryRepresentation=self.binaryRepresentation)
         rv.binstr = _binstr
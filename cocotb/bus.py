@@ -30,7 +30,8 @@
 """Common bus related functionality.
 A bus is simply defined as a collection of signals.
 """
-from cocotb.handle import _AssignmentResult
+from cocotb import simulator
+from cocotb.handle import _AssignmentResult, _gpi_handle, HierarchyObject, ModifiableObject
 
 
 def _build_sig_attr_dict(signals):
@@ -76,35 +77,75 @@ class Bus:
         self._name = name
         self._signals = {}
 
-        for attr_name, sig_name in _build_sig_attr_dict(signals).items():
-            if name:
-                signame = name + bus_separator + sig_name
-            else:
-                signame = sig_name
-
-            self._add_signal(attr_name, signame, array_idx)
+        def signal_names(signals):
+            for attr_name, sig_name in _build_sig_attr_dict(signals).items():
+                if name:
+                    yield attr_name, name + bus_separator + sig_name
+                else:
+                    yield attr_name, sig_name
 
+        required = list(signal_names(signals))
         # Also support a set of optional signals that don't have to be present
-        for attr_name, sig_name in _build_sig_attr_dict(optional_signals).items():
-            if name:
-                signame = name + bus_separator + sig_name
+        optional = list(signal_names(optional_signals))
+
+        # Look all the signals up with a single call into the simulator
+        if isinstance(entity, HierarchyObject):
+            paths = [
+                signame if array_idx is None else "{}[{}]".format(signame, array_idx)
+                for _, signame in required + optional
+            ]
+            handles = entity._resolve_many(paths)
+        else:
+            handles = [None] * (len(required) + len(optional))
+
+        for (attr_name, signame), handle in zip(required, handles):
+            if handle is not None:
+                self._set_signal(attr_name, handle)
             else:
-                signame = sig_name
+                # Raises the same error as a lookup of the signal on its own
+                self._add_signal(attr_name, signame, array_idx)
 
-            if hasattr(entity, signame):
+        for (attr_name, signame), handle in zip(optional, handles[len(required):]):
+            if handle is not None:
+                self._set_signal(attr_name, handle)
+            elif hasattr(entity, signame):
                 self._add_signal(attr_name, signame, array_idx)
             else:
                 self._entity._log.debug("Ignoring optional missing signal "
-                                        "%s on bus %s" % (sig_name, name))
+                                        "%s on bus %s" % (signame, name))
 
     def _add_signal(self, attr_name, signame, array_idx=None):
         self._entity._log.debug("Signal name {}, idx {}".format(signame, array_idx))
         handle = getattr(self._entity, signame)
         if array_idx is not None:
             handle = handle[array_idx]
+        self._set_signal(attr_name, handle)
+
+    def _set_signal(self, attr_name, handle):
         setattr(self, attr_name, handle)
         self._signals[attr_name] = getattr(self, attr_name)
 
+    def _read_values(self):
+        """Read the values of all the signals of the bus.
+
+        The values of plain logic signals are fetched from the simulator in a
+        single call, other signals are read through their handle.
+
+        Returns:
+            dict: The value of each signal, keyed by attribute name.
+        """
+        bulk = [(attr_name, hdl) for attr_name, hdl in self._signals.items()
+                if type(hdl) is ModifiableObject]
+        binstrs = simulator.get_signal_values([_gpi_handle(hdl) for _, hdl in bulk]) if bulk else []
+        bulk_values = {
+            attr_name: hdl._value_from_binstr(binstr)
+            for (attr_name, hdl), binstr in zip(bulk, binstrs)
+        }
+        return {
+            attr_name: bulk_values[attr_name] if attr_name in bulk_values else hdl.value
+            for attr_name, hdl in self._signals.items()
+        }
+
     def drive(self, obj, strict=False):
         """Drives values onto the bus.
 
@@ -152,11 +193,7 @@ class Bus:
             def __delattr__(self, name):
                 raise RuntimeError('Modifying a bus capture is not supported')
 
-        _capture = _Capture()
-        for attr_name, hdl in self._signals.items():
-            _capture[attr_name] = hdl.value
-
-        return _capture
+        return _Capture(self._read_values())
 
     def sample(self, obj, strict=False):
         """Sample the values from the bus, assigning them to *obj*.
@@ -169,7 +206,8 @@ class Bus:
         Raises:
             AttributeError: If attribute is missing in *obj* when ``strict=True``.
         """
-        for attr_name, hdl in self._signals.items():
+        values = self._read_values()
+        for attr_name in self._signals:
             if not hasattr(obj, attr_name):
                 if strict:
                     msg = ("Unable to sample from {0}.{1} because {2} is missing "
@@ -182,11 +220,12 @@ class Bus:
                     continue
             # Try to use the get/set_binstr methods because they will not clobber the properties
             # of obj.attr_name on assignment.  Otherwise use setattr() to crush whatever type of
-            # object was in obj.attr_name with hdl.value:
+            # object was in obj.attr_name with the value:
+            value = values[attr_name]
             try:
-                getattr(obj, attr_name).set_binstr(hdl.value.get_binstr())
+                getattr(obj, attr_name).set_binstr(value.get_binstr())
             except AttributeError:
-                setattr(obj, attr_name, hdl.value)
+                setattr(obj, attr_name, value)
 
     def __le__(self, value):
         """Overload the less than or equal to operator for value assignment"""
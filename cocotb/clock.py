@@ -30,8 +30,10 @@
 import itertools
 import warnings
 
+from cocotb import simulator
+from cocotb.handle import _gpi_handle
 from cocotb.log import SimLog
-from cocotb.triggers import Timer
+from cocotb.triggers import GPITrigger, Timer, TriggerException
 from cocotb.utils import get_sim_steps, get_time_from_sim_steps, lazy_property
 
 
@@ -48,6 +50,41 @@ class BaseClock:
         ))
 
 
+class _NativeClockWait(GPITrigger):
+    """Fires after *sim_steps* have elapsed, or never if *sim_steps* is ``None``.
+
+    A *sim_steps* of 0 fires in the ReadWrite phase of the current time step,
+    after any edge of the clock scheduled for this time step has been applied.
+
+    Unpriming this trigger before it fires, which happens when the task
+    awaiting it is killed, stops the native clock *clkobj*.
+    """
+
+    def __init__(self, clkobj, sim_steps=None):
+        GPITrigger.__init__(self)
+        self._clkobj = clkobj
+        self._fired = False
+        self.sim_steps = sim_steps
+
+    def prime(self, callback):
+        if self.cbhdl is None and self.sim_steps is not None:
+            def on_fired(trigger):
+                self._fired = True
+                callback(trigger)
+            if self.sim_steps == 0:
+                self.cbhdl = simulator.register_rwsynch_callback(on_fired, self)
+            else:
+                self.cbhdl = simulator.register_timed_callback(self.sim_steps, on_fired, self)
+            if self.cbhdl is None:
+                raise TriggerException("Unable set up %s Trigger" % (str(self)))
+        GPITrigger.prime(self, callback)
+
+    def unprime(self):
+        if self.primed and not self._fired:
+            self._clkobj.stop()
+        GPITrigger.unprime(self)
+
+
 class Clock(BaseClock):
     r"""Simple 50:50 duty cycle clock driver.
 
@@ -70,6 +107,13 @@ class Clock(BaseClock):
             ``'step'``, ``'fs'``, ``'ps'``, ``'ns'``, ``'us'``, ``'ms'``, ``'sec'``.
             When *units* is ``'step'``,
             the timestep is determined by the simulator (see :make:var:`COCOTB_HDL_TIMEPRECISION`).
+        impl (str, optional): One of ``'py'`` or ``'gpi'``.
+            ``'py'``, the default, toggles the signal from a Python coroutine.
+            ``'gpi'`` toggles the signal from recurring timed callbacks in the GPI layer,
+            without entering Python for every edge, which is much faster.
+            The signal is then driven directly at each edge instead of in the ReadWrite phase.
+
+            .. versionadded:: 1.5
 
     If you need more features like a phase shift and an asymmetric duty cycle,
     it is simple to create your own clock generator (that you then :func:`fork`):
@@ -114,25 +158,50 @@ class Clock(BaseClock):
         Using None as the the *units* argument is deprecated, use ``'step'`` instead.
     """
 
-    def __init__(self, signal, period, units="step"):
+    def __init__(self, signal, period, units="step", impl="py"):
         BaseClock.__init__(self, signal)
         if units is None:
             warnings.warn(
                 'Using units=None is deprecated, use units="step" instead.',
                 DeprecationWarning, stacklevel=2)
             units="step"  # don't propagate deprecated value
-        self.period = get_sim_steps(period, units)
-        self.half_period = get_sim_steps(period / 2.0, units)
-        self.frequency = 1.0 / get_time_from_sim_steps(self.period, units='us')
+        if impl not in ("py", "gpi"):
+            raise ValueError("Invalid clock implementation {!r}, must be 'py' or 'gpi'".format(impl))
+        self.impl = impl
+        self._set_period(period, units)
         self.hdl = None
         self.signal = signal
         self.coro = None
         self.mcoro = None
 
+    def _set_period(self, period, units):
+        self.period = get_sim_steps(period, units)
+        self.half_period = get_sim_steps(period / 2.0, units)
+        self.frequency = 1.0 / get_time_from_sim_steps(self.period, units='us')
+        self._timer = Timer(self.half_period)
+
+    def set_period(self, period, units="step"):
+        """Change the period of the clock.
+
+        The new period takes effect at the next edge of the clock.
+
+        Args:
+            period (int): The new clock period. Must convert to an even number of
+                timesteps.
+            units (str, optional): The unit of *period*, as for the constructor.
+
+        .. versionadded:: 1.5
+        """
+        self._set_period(period, units)
+        if self.hdl is not None:
+            self.hdl.set_period(self.period, self.half_period)
+
     async def start(self, cycles=None, start_high=True):
         r"""Clocking coroutine.  Start driving your clock by :func:`fork`\ ing a
         call to this.
 
+        Killing the forked task stops the clock.
+
         Args:
             cycles (int, optional): Cycle the clock *cycles* number of times,
                 or if ``None`` then cycle the clock forever.
@@ -143,7 +212,10 @@ class Clock(BaseClock):
 
                 .. versionadded:: 1.3
         """
-        t = Timer(self.half_period)
+        if self.impl == "gpi":
+            await self._start_gpi(cycles, start_high)
+            return
+
         if cycles is None:
             it = itertools.count()
         else:
@@ -153,15 +225,32 @@ class Clock(BaseClock):
         if start_high:
             for _ in it:
                 self.signal <= 1
-                await t
+                await self._timer
                 self.signal <= 0
-                await t
+                await self._timer
         else:
             for _ in it:
                 self.signal <= 0
-                await t
+                await self._timer
                 self.signal <= 1
-                await t
+                await self._timer
+
+    async def _start_gpi(self, cycles, start_high):
+        if cycles == 0:
+            return
+        if self.hdl is None:
+            self.hdl = simulator.clock_create(_gpi_handle(self.signal))
+        self.hdl.start(self.period, self.half_period, start_high, 0 if cycles is None else cycles)
+        if cycles is None:
+            await _NativeClockWait(self.hdl)
+        else:
+            await _NativeClockWait(self.hdl, cycles * self.period)
+            # the final edge may fire after us in this time step, and the
+            # period may have been changed while the clock was running
+            await _NativeClockWait(self.hdl, 0)
+            while self.hdl.is_running():
+                await _NativeClockWait(self.hdl, self.half_period)
+                await _NativeClockWait(self.hdl, 0)
 
     def __str__(self):
         return type(self).__qualname__ + "(%3.1f MHz)" % self.frequency
@@ -26,17 +26,21 @@
 
 """Drivers for Advanced Microcontroller Bus Architecture."""
 
-import array
 import collections.abc
 import enum
 import itertools
-from typing import Any, List, Optional, Sequence, Tuple, Union
+import random
+import warnings
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cocotb
+from cocotb import outcomes
 from cocotb.binary import BinaryValue
 from cocotb.drivers import BusDriver
+from cocotb.drivers.memory import SparseMemory
 from cocotb.handle import SimHandleBase
-from cocotb.triggers import ClockCycles, Combine, Lock, ReadOnly, RisingEdge
+from cocotb.triggers import ClockCycles, Event, Lock, ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
 
 
 class AXIBurst(enum.IntEnum):
@@ -62,9 +66,211 @@ class AXIReadBurstLengthMismatch(Exception):
     pass
 
 
+class AXITransferStatistics:
+    """Counters of the bursts completed by an :class:`AXI4Master` in one direction.
+
+    Latencies are from the issue of a burst to its response, in simulator steps.
+    """
+
+    def __init__(self):
+        self.transactions = 0
+        self.beats = 0
+        #: Bursts which completed with an error
+        self.errors = 0
+        self.total_latency = 0
+        self.min_latency = None
+        self.max_latency = None
+        #: The largest number of bursts which were in flight at once
+        self.max_outstanding = 0
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        if not self.transactions:
+            return None
+        return self.total_latency / self.transactions
+
+    def _add(self, transaction: "AXITransaction", error: bool) -> None:
+        latency = transaction.latency
+        self.transactions += 1
+        self.beats += transaction.length
+        self.errors += error
+        self.total_latency += latency
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if self.max_latency is None or latency > self.max_latency:
+            self.max_latency = latency
+
+
+class AXI4MasterStatistics:
+    """Statistics of an :class:`AXI4Master`, see :class:`AXITransferStatistics`."""
+
+    def __init__(self):
+        self.reads = AXITransferStatistics()
+        self.writes = AXITransferStatistics()
+
+
+class AXITransaction:
+    """A burst issued by :meth:`AXI4Master.issue_write` or :meth:`AXI4Master.issue_read`.
+
+    Awaiting it waits for the response of the burst, then returns what
+    :meth:`AXI4Master.write` or :meth:`AXI4Master.read` would, or raises the
+    same exceptions.
+    Times are in simulator steps, and are ``None`` until they are reached.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, is_write: bool, address: int, length: int,
+                 burst: AXIBurst, size: int):
+        self.is_write = is_write
+        self.address = address
+        self.length = length
+        self.burst = burst
+        self.size = size
+        #: The AXI ID, allocated when the burst is sent
+        self.id = None
+        #: When the burst was issued
+        self.issue_time = get_sim_time()
+        #: When the slave accepted the address
+        self.address_time = None
+        #: When the response was received
+        self.end_time = None
+
+        self._address_latency = 0
+        self._data_latency = 0
+        self._sync = True
+        self._return_rresp = False
+        # (WDATA, WSTRB) to send or (RDATA, RRESP) received, for each beat
+        self._beats = []
+        self._outcome = None
+        self._done = Event()
+
+    @property
+    def done(self) -> bool:
+        """True once the response has been received."""
+        return self._outcome is not None
+
+    @property
+    def latency(self) -> Optional[int]:
+        """The time from issue to response, in simulator steps."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.issue_time
+
+    def _complete(self, outcome: outcomes.Outcome) -> None:
+        self.end_time = get_sim_time()
+        self._outcome = outcome
+        self._done.set()
+
+    def __await__(self):
+        if self._outcome is None:
+            yield self._done.wait()
+        return self._outcome.get()
+
+    def __repr__(self):
+        return "<{} {} of {} beats at {:#x}, ID {}>".format(
+            type(self).__qualname__, "write" if self.is_write else "read",
+            self.length, self.address, self.id)
+
+
+class _InFlight:
+    """The bursts in flight in one direction, in order of issue for each ID."""
+
+    def __init__(self, name: str, limit: int, id_width: int,
+                 stats: AXITransferStatistics):
+        if limit < 1:
+            raise ValueError("The maximum number of outstanding bursts must "
+                             "be a positive integer")
+        self.limit = limit
+        self.count = 0
+        self.stats = stats
+        self._n_ids = 2**id_width
+        self._by_id = {}
+        # Wake the receiver when a burst is added, and the sender when one is removed
+        self.added = Event(name + "_added")
+        self.removed = Event(name + "_removed")
+
+    def full(self) -> bool:
+        return self.count >= self.limit
+
+    def add(self, transaction: AXITransaction) -> None:
+        # Prefer the lowest ID with nothing in flight, so that the slave may
+        # reorder the responses. One of the first count + 1 IDs is free, if
+        # there are that many.
+        for txn_id in range(min(self._n_ids, self.count + 1)):
+            if not self._by_id.get(txn_id):
+                break
+        else:
+            txn_id = min(range(self._n_ids), key=lambda i: len(self._by_id[i]))
+        transaction.id = txn_id
+        self._by_id.setdefault(txn_id, collections.deque()).append(transaction)
+        self.count += 1
+        self.stats.max_outstanding = max(self.stats.max_outstanding, self.count)
+        self.added.set()
+
+    def first(self, txn_id: int) -> Optional[AXITransaction]:
+        """Return the oldest burst in flight with *txn_id*, which a response is for."""
+        queue = self._by_id.get(txn_id)
+        return queue[0] if queue else None
+
+    def remove(self, transaction: AXITransaction) -> None:
+        self._by_id[transaction.id].popleft()
+        self.count -= 1
+        self.removed.set()
+
+    def remove_all(self) -> List[AXITransaction]:
+        """Remove all the bursts in flight, and return them in order of issue for each ID."""
+        transactions = [t for queue in self._by_id.values() for t in queue]
+        self._by_id.clear()
+        self.count = 0
+        self.removed.set()
+        return transactions
+
+
+def _deprecated_lock(attribute: str) -> property:
+    """A :class:`~cocotb.triggers.Lock` attribute which :class:`AXI4Master` and :class:`AXI4Slave` no longer use."""
+    def get(self):
+        warnings.warn(
+            "{}.{} is deprecated, it is no longer used to serialize the "
+            "accesses to the channel".format(type(self).__name__, attribute),
+            DeprecationWarning, stacklevel=2)
+        try:
+            return self._busy_locks[attribute]
+        except KeyError:
+            lock = self._busy_locks[attribute] = Lock(attribute)
+            return lock
+    return property(get)
+
+
 class AXI4Master(BusDriver):
     """AXI4 Master
 
+    Bursts are pipelined: up to *max_outstanding_reads* reads and
+    *max_outstanding_writes* writes are in flight at once, each with its own
+    ID when the ID signals are wide enough, and the responses are matched to
+    them by ``RID`` and ``BID``, in whichever order the slave sends them.
+    Bursts issued while the limit is reached wait in a queue.
+
+    :meth:`issue_write` and :meth:`issue_read` return at once with an
+    :class:`AXITransaction`, which can be awaited for the response.
+    :meth:`write` and :meth:`read` issue a burst and wait for it.
+    Latencies are counted in :attr:`stats`, an :class:`AXI4MasterStatistics`.
+
+    Args:
+        max_outstanding_reads: The number of read bursts in flight at once.
+        max_outstanding_writes: The number of write bursts in flight at once.
+
+    .. versionchanged:: 1.5
+        Added *max_outstanding_reads* and *max_outstanding_writes*,
+        :meth:`issue_write`, :meth:`issue_read` and :attr:`stats`.
+
+    .. deprecated:: 1.5
+        The locks ``write_address_busy``, ``read_address_busy``,
+        ``write_data_busy``, ``read_data_busy`` and ``write_response_busy``
+        are no longer held while a channel is in use, as each channel is
+        driven by its own coroutine. Acquiring them does not keep the master
+        off the bus.
+
     TODO: Kill all pending transactions if reset is asserted.
     """
 
@@ -79,8 +285,15 @@ class AXI4Master(BusDriver):
                          "WLAST",
                          "ARREGION", "ARLOCK", "ARCACHE", "ARPROT", "ARQOS"]
 
+    write_address_busy = _deprecated_lock("write_address_busy")
+    read_address_busy = _deprecated_lock("read_address_busy")
+    write_data_busy = _deprecated_lock("write_data_busy")
+    read_data_busy = _deprecated_lock("read_data_busy")
+    write_response_busy = _deprecated_lock("write_response_busy")
+
     def __init__(self, entity: SimHandleBase, name: str, clock: SimHandleBase,
-                 **kwargs: Any):
+                 max_outstanding_reads: int = 1,
+                 max_outstanding_writes: int = 1, **kwargs: Any):
         BusDriver.__init__(self, entity, name, clock, **kwargs)
 
         # Drive some sensible defaults (setimmediatevalue to avoid x asserts)
@@ -90,9 +303,8 @@ class AXI4Master(BusDriver):
         self.bus.BREADY.setimmediatevalue(1)
         self.bus.RREADY.setimmediatevalue(1)
 
-        # Set the default value (0) for the unsupported signals, which
-        # translate to:
-        #  * Transaction IDs to 0
+        # Set the default value (0) for the IDs and the unsupported signals,
+        # which translate to:
         #  * Region identifier to 0
         #  * Normal (non-exclusive) access
         #  * Device non-bufferable access
@@ -107,12 +319,32 @@ class AXI4Master(BusDriver):
             except AttributeError:
                 pass
 
-        # Mutex for each channel to prevent contention
-        self.write_address_busy = Lock(name + "_awbusy")
-        self.read_address_busy = Lock(name + "_arbusy")
-        self.write_data_busy = Lock(name + "_wbusy")
-        self.read_data_busy = Lock(name + "_rbusy")
-        self.write_response_busy = Lock(name + "_bbusy")
+        self.stats = AXI4MasterStatistics()
+        self._busy_locks = {}
+
+        def id_width(signal):
+            return len(getattr(self.bus, signal)) if hasattr(self.bus, signal) else 0
+
+        self._reads = _InFlight(name + "_reads", max_outstanding_reads,
+                                id_width("ARID"), self.stats.reads)
+        self._writes = _InFlight(name + "_writes", max_outstanding_writes,
+                                 id_width("AWID"), self.stats.writes)
+
+        # Bursts waiting for each channel
+        self._ar_queue = collections.deque()
+        self._aw_queue = collections.deque()
+        self._w_queue = collections.deque()
+        self._ar_queued = Event(name + "_ar_queued")
+        self._aw_queued = Event(name + "_aw_queued")
+        self._w_queued = Event(name + "_w_queued")
+
+        cocotb.fork(self._send_addresses("AR", self._ar_queue, self._ar_queued,
+                                         self._reads))
+        cocotb.fork(self._send_addresses("AW", self._aw_queue, self._aw_queued,
+                                         self._writes))
+        cocotb.fork(self._send_write_data())
+        cocotb.fork(self._receive_read_data())
+        cocotb.fork(self._receive_write_responses())
 
     @staticmethod
     def _check_length(length: int, burst: AXIBurst) -> None:
@@ -154,45 +386,302 @@ class AXI4Master(BusDriver):
                     .format(address, last_address,
                             (address & ~0xfff) + 0x1000))
 
-    async def _send_write_address(
-        self, address: int, length: int, burst: AXIBurst, size: int,
-        delay: int, sync: bool
+    async def _send_addresses(
+        self, channel: str, queue: collections.deque, queued: Event,
+        in_flight: _InFlight
     ) -> None:
-        """Send the write address, with optional delay (in clocks)"""
-        async with self.write_address_busy:
-            if sync:
-                await RisingEdge(self.clock)
-
-            await ClockCycles(self.clock, delay)
-
-            # Set the address and, if present on the bus, burst, length and
-            # size
-            self.bus.AWADDR <= address
-            self.bus.AWVALID <= 1
-
-            if hasattr(self.bus, "AWBURST"):
-                self.bus.AWBURST <= burst.value
-
-            if hasattr(self.bus, "AWLEN"):
-                self.bus.AWLEN <= length - 1
+        """Send the addresses of the queued bursts on the AR or AW channel."""
+        clock_re = RisingEdge(self.clock)
+        valid = getattr(self.bus, channel + "VALID")
+        ready = getattr(self.bus, channel + "READY")
+        addr = getattr(self.bus, channel + "ADDR")
+        # None for the signals which are not on the bus
+        burst_signal, len_signal, size_signal, id_signal = (
+            getattr(self.bus, channel + signal, None)
+            for signal in ("BURST", "LEN", "SIZE", "ID"))
 
-            if hasattr(self.bus, "AWSIZE"):
-                self.bus.AWSIZE <= size.bit_length() - 1
+        while True:
+            if not queue:
+                valid <= 0
+                queued.clear()
+                await queued.wait()
+                if queue[0]._sync:
+                    await clock_re
+            transaction = queue.popleft()
+
+            if in_flight.full():
+                valid <= 0
+                while in_flight.full():
+                    in_flight.removed.clear()
+                    await in_flight.removed.wait()
+
+            in_flight.add(transaction)
+            if transaction.is_write:
+                # The data may be sent before the address is accepted
+                self._w_queue.append(transaction)
+                self._w_queued.set()
+
+            if transaction._address_latency:
+                valid <= 0
+                await ClockCycles(self.clock, transaction._address_latency)
+
+            # Set the address and, if present on the bus, burst, length, size
+            # and ID
+            addr <= transaction.address
+            valid <= 1
+
+            if burst_signal is not None:
+                burst_signal <= transaction.burst.value
+
+            if len_signal is not None:
+                len_signal <= transaction.length - 1
+
+            if size_signal is not None:
+                size_signal <= transaction.size.bit_length() - 1
+
+            if id_signal is not None:
+                id_signal <= transaction.id
 
             # Wait until acknowledged
             while True:
                 await ReadOnly()
-                if self.bus.AWREADY.value:
+                if ready.value:
                     break
-                await RisingEdge(self.clock)
-            await RisingEdge(self.clock)
-            self.bus.AWVALID <= 0
+                await clock_re
+            await clock_re
+            transaction.address_time = get_sim_time()
 
-    async def _send_write_data(
-        self, address, data: Sequence[int], burst: AXIBurst, size: int,
-        delay: int, byte_enable: Sequence[Optional[int]], sync: bool
-    ) -> None:
-        """Send the write data, with optional delay (in clocks)."""
+    async def _send_write_data(self) -> None:
+        """Send the data of the write bursts, in the order of their addresses."""
+        clock_re = RisingEdge(self.clock)
+        wlast = getattr(self.bus, "WLAST", None)
+
+        while True:
+            if not self._w_queue:
+                self.bus.WVALID <= 0
+                self._w_queued.clear()
+                # Bursts are queued here after the address channel has synced
+                await self._w_queued.wait()
+            transaction = self._w_queue.popleft()
+
+            last_beat = len(transaction._beats) - 1
+            for beat_num, (wdata, wstrb) in enumerate(transaction._beats):
+                if transaction._data_latency:
+                    self.bus.WVALID <= 0
+                    await ClockCycles(self.clock, transaction._data_latency)
+
+                self.bus.WVALID <= 1
+                self.bus.WDATA <= wdata
+                self.bus.WSTRB <= wstrb
+
+                if wlast is not None:
+                    wlast <= int(beat_num == last_beat)
+
+                while True:
+                    await ReadOnly()
+                    if self.bus.WREADY.value:
+                        break
+                    await clock_re
+                await clock_re
+
+    def _response_for(self, in_flight: _InFlight, id_signal, response: AXIxRESP,
+                      channel: str) -> AXITransaction:
+        txn_id = 0 if id_signal is None else id_signal.value.integer
+        transaction = in_flight.first(txn_id)
+        if transaction is None:
+            raise AXIProtocolError(
+                "{} response with ID {:#x}, which has no burst in flight"
+                .format(channel, txn_id), response)
+        return transaction
+
+    async def _receive_write_responses(self) -> None:
+        clock_re = RisingEdge(self.clock)
+        bid = getattr(self.bus, "BID", None)
+
+        while True:
+            if not self._writes.count:
+                self._writes.added.clear()
+                await self._writes.added.wait()
+
+            await ReadOnly()
+            transaction = error = None
+            if self.bus.BVALID.value and self.bus.BREADY.value:
+                result = AXIxRESP(self.bus.BRESP.value.integer)
+                try:
+                    transaction = self._response_for(self._writes, bid, result, "Write")
+                except AXIProtocolError as e:
+                    error = e
+
+            # Complete after the edge, so that the waiting coroutines can drive
+            # the bus
+            await clock_re
+            if transaction is not None:
+                self._writes.remove(transaction)
+                self._complete_write(transaction, result)
+            elif error is not None:
+                self._fail_in_flight(self._writes, error)
+
+    async def _receive_read_data(self) -> None:
+        clock_re = RisingEdge(self.clock)
+        rid = getattr(self.bus, "RID", None)
+        rlast = getattr(self.bus, "RLAST", None)
+
+        while True:
+            if not self._reads.count:
+                self._reads.added.clear()
+                await self._reads.added.wait()
+
+            await ReadOnly()
+            transaction = error = None
+            if self.bus.RVALID.value and self.bus.RREADY.value:
+                rresp = AXIxRESP(self.bus.RRESP.value.integer)
+                try:
+                    beat_transaction = self._response_for(self._reads, rid, rresp, "Read")
+                except AXIProtocolError as e:
+                    error = e
+                else:
+                    beat_transaction._beats.append((self.bus.RDATA.value, rresp))
+                    if rlast is None:
+                        last = len(beat_transaction._beats) == beat_transaction.length
+                    else:
+                        last = rlast.value
+                    if last:
+                        transaction = beat_transaction
+
+            await clock_re
+            if transaction is not None:
+                self._reads.remove(transaction)
+                self._complete_read(transaction)
+            elif error is not None:
+                self._fail_in_flight(self._reads, error)
+
+    def _fail_in_flight(self, in_flight: _InFlight, error: AXIProtocolError) -> None:
+        """Fail all the bursts in flight, after a response which matches none of them.
+
+        The responses cannot be told apart any more, so the master starts
+        afresh with the bursts issued after this.
+        """
+        self.log.error("%s, failing the %d bursts in flight", error, in_flight.count)
+        for transaction in in_flight.remove_all():
+            transaction._complete(outcomes.Error(AXIProtocolError(
+                "{} was aborted: {}".format(transaction, error), error.xresp)))
+            in_flight.stats._add(transaction, True)
+
+    def _complete_write(self, transaction: AXITransaction,
+                        result: AXIxRESP) -> None:
+        if result is AXIxRESP.OKAY:
+            outcome = outcomes.Value(None)
+        else:
+            err_msg = "Write to address {0:#x}"
+            if transaction.length != 1:
+                err_msg += " ({1} beats, {2} burst)"
+            err_msg += " failed with BRESP: {3} ({4})"
+
+            outcome = outcomes.Error(AXIProtocolError(
+                err_msg.format(transaction.address, transaction.length,
+                               transaction.burst.name, result.value,
+                               result.name), result))
+
+        transaction._complete(outcome)
+        self.stats.writes._add(transaction, result is not AXIxRESP.OKAY)
+
+    def _complete_read(self, transaction: AXITransaction) -> None:
+
+        # Helper function for narrow bursts
+        def shift_and_mask(binvalue: BinaryValue, bytes_num: int,
+                           byte_shift: int) -> BinaryValue:
+            start = byte_shift * 8
+            end = (bytes_num + byte_shift) * 8
+            return binvalue[len(binvalue) - end:len(binvalue) - start - 1]
+
+        # [0x221100XX, 0x66554433] --> [0x33221100, 0x665544]
+        def realign_data(
+            data: Sequence[BinaryValue], size_bits: int, shift: int
+        ) -> List[BinaryValue]:
+            binstr_join = "".join([word.binstr[::-1] for word in data])
+            binstr_join = binstr_join[shift:]
+            data_binstr = [binstr_join[i * size_bits:(i + 1) * size_bits][::-1]
+                           for i in range(len(data))]
+            return [BinaryValue(value=binstr, n_bits=len(binstr))
+                    for binstr in data_binstr]
+
+        address = transaction.address
+        length = transaction.length
+        burst = transaction.burst
+        size = transaction.size
+
+        rdata_bytes = len(self.bus.RDATA) // 8
+        byte_offset = (address % rdata_bytes) // size * size
+
+        data = []
+        rresp = []
+        for beat_value, beat_result in transaction._beats:
+            # Shift and mask to correctly handle narrow bursts
+            data.append(shift_and_mask(beat_value, size, byte_offset))
+            rresp.append(beat_result)
+
+            if burst is not AXIBurst.FIXED:
+                byte_offset = (byte_offset + size) % rdata_bytes
+
+        error = None
+        if len(data) != length:
+            error = AXIReadBurstLengthMismatch(
+                "AXI4 slave returned {} data than expected (requested {} "
+                "words, received {})"
+                .format("more" if len(data) > length else "less",
+                        length, len(data)))
+        else:
+            # Re-align the words
+            if address % size != 0:
+                shift = (address % size) * 8
+                if burst is AXIBurst.FIXED:
+                    data = [word[0:size * 8 - shift - 1] for word in data]
+                else:
+                    data = realign_data(data, size * 8, shift)
+
+            if not transaction._return_rresp:
+                for beat_number, beat_result in enumerate(rresp):
+                    if beat_result is not AXIxRESP.OKAY:
+                        err_msg = "Read on address {0:#x}"
+                        if length != 1:
+                            err_msg += " (beat {1} of {2}, {3} burst)"
+                        err_msg += " failed with RRESP: {4} ({5})"
+
+                        err_msg = err_msg.format(
+                            address, beat_number + 1, length, burst,
+                            beat_result.value, beat_result.name)
+
+                        error = AXIProtocolError(err_msg, beat_result)
+                        break
+
+        if error is not None:
+            outcome = outcomes.Error(error)
+        elif transaction._return_rresp:
+            outcome = outcomes.Value(list(zip(data, rresp)))
+        else:
+            outcome = outcomes.Value(data)
+
+        transaction._complete(outcome)
+        self.stats.reads._add(
+            transaction,
+            error is not None or any(r is not AXIxRESP.OKAY for r in rresp))
+
+    def issue_write(
+        self, address: int, value: Union[int, Sequence[int]], *,
+        size: Optional[int] = None, burst: AXIBurst = AXIBurst.INCR,
+        byte_enable: Union[Optional[int], Sequence[Optional[int]]] = None,
+        address_latency: int = 0, data_latency: int = 0, sync: bool = True
+    ) -> AXITransaction:
+        """Issue a write burst, without waiting for it.
+
+        The arguments are those of :meth:`write`, which awaits the returned
+        transaction.
+
+        Raises:
+            ValueError: If any of the input parameters is invalid.
+
+        .. versionadded:: 1.5
+        """
 
         # Helper function for narrow bursts
         def mask_and_shift(value: int, block_size: int, block_num: int) -> int:
@@ -210,19 +699,36 @@ class AXI4Master(BusDriver):
                     (padded_data[i + 1] & low_mask) << shift
                     for i in range(len(data))]
 
+        if not isinstance(value, collections.abc.Sequence):
+            value = (value,)    # If value is not a sequence, make it
+
+        if not isinstance(byte_enable, collections.abc.Sequence):
+            byte_enable = (byte_enable,)    # Same for byte_enable
+
+        wdata_bytes = len(self.bus.WDATA) // 8
+        if size is None:
+            size = wdata_bytes
+        else:
+            AXI4Master._check_size(size, wdata_bytes)
+
+        AXI4Master._check_length(len(value), burst)
+        AXI4Master._check_4kB_boundary_crossing(address, burst, size,
+                                                len(value))
+
         strobes = []
         byte_enable_iterator = iter(byte_enable)
         try:
-            for i in range(len(data)):
+            for i in range(len(value)):
                 current_byte_enable = next(byte_enable_iterator)
                 strobes.append(2**size - 1 if current_byte_enable is None
                                else current_byte_enable)
         except StopIteration:
             # Fill the remaining strobes with the last one if we have reached
             # the end of the iterator
-            strobes += [strobes[-1]] * (len(data) - i)
+            strobes += [strobes[-1]] * (len(value) - i)
 
         # Unalign the words and strobes (if unaligned and not FIXED)
+        data = value
         if address % size != 0:
             shift = (address % size) * 8
             if burst is AXIBurst.FIXED:
@@ -233,36 +739,24 @@ class AXI4Master(BusDriver):
                 data = unalign_data(data, size * 8, shift)
                 strobes = unalign_data(strobes, size, address % size)
 
-        async with self.write_data_busy:
-            if sync:
-                await RisingEdge(self.clock)
+        transaction = AXITransaction(True, address, len(value), burst, size)
+        transaction._address_latency = address_latency
+        transaction._data_latency = data_latency
+        transaction._sync = sync
 
-            wdata_bytes = len(self.bus.WDATA) // 8
-            narrow_block = (address % wdata_bytes) // size
+        # Place each beat on its lanes of the data bus
+        narrow_block = (address % wdata_bytes) // size
+        for word, strobe in zip(data, strobes):
+            transaction._beats.append(
+                (mask_and_shift(word, size * 8, narrow_block),
+                 mask_and_shift(strobe, size, narrow_block)))
 
-            for beat_num, (word, strobe) in enumerate(zip(data, strobes)):
-                await ClockCycles(self.clock, delay)
+            if burst is not AXIBurst.FIXED:
+                narrow_block = (narrow_block + 1) % (wdata_bytes // size)
 
-                self.bus.WVALID <= 1
-                self.bus.WDATA <= mask_and_shift(word, size * 8, narrow_block)
-                self.bus.WSTRB <= mask_and_shift(strobe, size, narrow_block)
-
-                if burst is not AXIBurst.FIXED:
-                    narrow_block = (narrow_block + 1) % (wdata_bytes // size)
-
-                if hasattr(self.bus, "WLAST"):
-                    if beat_num == len(data) - 1:
-                        self.bus.WLAST <= 1
-                    else:
-                        self.bus.WLAST <= 0
-
-                while True:
-                    await RisingEdge(self.clock)
-                    if self.bus.WREADY.value:
-                        break
-
-                if beat_num == len(data) - 1:
-                    self.bus.WVALID <= 0
+        self._aw_queue.append(transaction)
+        self._aw_queued.set()
+        return transaction
 
     @cocotb.coroutine
     async def write(
@@ -289,60 +783,51 @@ class AXI4Master(BusDriver):
                 None (write all bytes).
             address_latency: Delay before setting the address (in clock
                 cycles). Default is no delay.
-            data_latency: Delay before setting the data value (in clock
+            data_latency: Delay before setting each data value (in clock
                 cycles).
                 Default is no delay.
-            sync: Wait for rising edge on clock initially.
-                Defaults to True.
+            sync: Wait for rising edge on clock initially, if no other burst
+                is being sent. Defaults to True.
 
         Raises:
             ValueError: If any of the input parameters is invalid.
             AXIProtocolError: If write response from AXI is not ``OKAY``.
         """
+        await self.issue_write(
+            address, value, size=size, burst=burst, byte_enable=byte_enable,
+            address_latency=address_latency, data_latency=data_latency,
+            sync=sync)
 
-        if not isinstance(value, collections.abc.Sequence):
-            value = (value,)    # If value is not a sequence, make it
+    def issue_read(
+        self, address: int, length: int = 1, *,
+        size: Optional[int] = None, burst: AXIBurst = AXIBurst.INCR,
+        return_rresp: bool = False, sync: bool = True
+    ) -> AXITransaction:
+        """Issue a read burst, without waiting for it.
 
-        if not isinstance(byte_enable, collections.abc.Sequence):
-            byte_enable = (byte_enable,)    # Same for byte_enable
+        The arguments are those of :meth:`read`, which awaits the returned
+        transaction.
 
+        Raises:
+            ValueError: If any of the input parameters is invalid.
+
+        .. versionadded:: 1.5
+        """
         if size is None:
-            size = len(self.bus.WDATA) // 8
+            size = len(self.bus.RDATA) // 8
         else:
-            AXI4Master._check_size(size, len(self.bus.WDATA) // 8)
-
-        AXI4Master._check_length(len(value), burst)
-        AXI4Master._check_4kB_boundary_crossing(address, burst, size,
-                                                len(value))
-
-        write_address = self._send_write_address(address, len(value), burst,
-                                                 size, address_latency, sync)
-
-        write_data = self._send_write_data(address, value, burst, size,
-                                           data_latency, byte_enable, sync)
-
-        await Combine(cocotb.fork(write_address), cocotb.fork(write_data))
-
-        async with self.write_response_busy:
-            # Wait for the response
-            while True:
-                await ReadOnly()
-                if self.bus.BVALID.value and self.bus.BREADY.value:
-                    result = AXIxRESP(self.bus.BRESP.value.integer)
-                    break
-                await RisingEdge(self.clock)
+            AXI4Master._check_size(size, len(self.bus.RDATA) // 8)
 
-            await RisingEdge(self.clock)
+        AXI4Master._check_length(length, burst)
+        AXI4Master._check_4kB_boundary_crossing(address, burst, size, length)
 
-            if result is not AXIxRESP.OKAY:
-                err_msg = "Write to address {0:#x}"
-                if len(value) != 1:
-                    err_msg += " ({1} beats, {2} burst)"
-                err_msg += " failed with BRESP: {3} ({4})"
+        transaction = AXITransaction(False, address, length, burst, size)
+        transaction._return_rresp = return_rresp
+        transaction._sync = sync
 
-                raise AXIProtocolError(
-                    err_msg.format(address, len(value), burst.name,
-                                   result.value, result.name), result)
+        self._ar_queue.append(transaction)
+        self._ar_queued.set()
+        return transaction
 
     @cocotb.coroutine
     async def read(
@@ -368,7 +853,8 @@ class AXI4Master(BusDriver):
                 Defaults to ``INCR``.
             return_rresp: Return the list of RRESP values, instead of raising
                 an AXIProtocolError in case of not OKAY. Defaults to False.
-            sync: Wait for rising edge on clock initially. Defaults to True.
+            sync: Wait for rising edge on clock initially, if no other burst
+                is being sent. Defaults to True.
 
         Returns:
             The read data values or, if *return_rresp* is True, a list of pairs
@@ -381,121 +867,8 @@ class AXI4Master(BusDriver):
             AXIReadBurstLengthMismatch: If the received number of words does
                 not match the requested one.
         """
-
-        # Helper function for narrow bursts
-        def shift_and_mask(binvalue: BinaryValue, bytes_num: int,
-                           byte_shift: int) -> BinaryValue:
-            start = byte_shift * 8
-            end = (bytes_num + byte_shift) * 8
-            return binvalue[len(binvalue) - end:len(binvalue) - start - 1]
-
-        # [0x221100XX, 0x66554433] --> [0x33221100, 0x665544]
-        def realign_data(
-            data: Sequence[BinaryValue], size_bits: int, shift: int
-        ) -> List[BinaryValue]:
-            binstr_join = "".join([word.binstr[::-1] for word in data])
-            binstr_join = binstr_join[shift:]
-            data_binstr = [binstr_join[i * size_bits:(i + 1) * size_bits][::-1]
-                           for i in range(len(data))]
-            return [BinaryValue(value=binstr, n_bits=len(binstr))
-                    for binstr in data_binstr]
-
-        if size is None:
-            size = len(self.bus.RDATA) // 8
-        else:
-            AXI4Master._check_size(size, len(self.bus.RDATA) // 8)
-
-        AXI4Master._check_length(length, burst)
-        AXI4Master._check_4kB_boundary_crossing(address, burst, size, length)
-
-        rdata_bytes = len(self.bus.RDATA) // 8
-        byte_offset = (address % rdata_bytes) // size * size
-
-        async with self.read_address_busy:
-            if sync:
-                await RisingEdge(self.clock)
-
-            self.bus.ARADDR <= address
-            self.bus.ARVALID <= 1
-
-            if hasattr(self.bus, "ARLEN"):
-                self.bus.ARLEN <= length - 1
-
-            if hasattr(self.bus, "ARSIZE"):
-                self.bus.ARSIZE <= size.bit_length() - 1
-
-            if hasattr(self.bus, "ARBURST"):
-                self.bus.ARBURST <= burst.value
-
-            while True:
-                await ReadOnly()
-                if self.bus.ARREADY.value:
-                    break
-                await RisingEdge(self.clock)
-
-            await RisingEdge(self.clock)
-            self.bus.ARVALID <= 0
-
-        async with self.read_data_busy:
-            data = []
-            rresp = []
-
-            for beat_num in itertools.count():
-                while True:
-                    await ReadOnly()
-                    if self.bus.RVALID.value and self.bus.RREADY.value:
-                        # Shift and mask to correctly handle narrow bursts
-                        beat_value = shift_and_mask(self.bus.RDATA.value,
-                                                    size, byte_offset)
-
-                        data.append(beat_value)
-                        rresp.append(AXIxRESP(self.bus.RRESP.value.integer))
-
-                        if burst is not AXIBurst.FIXED:
-                            byte_offset = (byte_offset + size) % rdata_bytes
-
-                        break
-                    await RisingEdge(self.clock)
-
-                if not hasattr(self.bus, "RLAST") or self.bus.RLAST.value:
-                    break
-
-                await RisingEdge(self.clock)
-
-            await RisingEdge(self.clock)
-
-            if len(data) != length:
-                raise AXIReadBurstLengthMismatch(
-                    "AXI4 slave returned {} data than expected (requested {} "
-                    "words, received {})"
-                    .format("more" if len(data) > length else "less",
-                            length, len(data)))
-
-            # Re-align the words
-            if address % size != 0:
-                shift = (address % size) * 8
-                if burst is AXIBurst.FIXED:
-                    data = [word[0:size * 8 - shift - 1] for word in data]
-                else:
-                    data = realign_data(data, size * 8, shift)
-
-            if return_rresp:
-                return list(zip(data, rresp))
-            else:
-                for beat_number, beat_result in enumerate(rresp):
-                    if beat_result is not AXIxRESP.OKAY:
-                        err_msg = "Read on address {0:#x}"
-                        if length != 1:
-                            err_msg += " (beat {1} of {2}, {3} burst)"
-                        err_msg += " failed with RRESP: {4} ({5})"
-
-                        err_msg = err_msg.format(
-                            address, beat_number + 1, length, burst,
-                            beat_result.value, beat_result.name)
-
-                        raise AXIProtocolError(err_msg, beat_result)
-
-                return data
+        return await self.issue_read(address, length, size=size, burst=burst,
+                                     return_rresp=return_rresp, sync=sync)
 
     def __len__(self):
         return 2**len(self.bus.ARADDR)
@@ -571,11 +944,182 @@ class AXI4LiteMaster(AXI4Master):
         return ret[0]
 
 
+def random_latency(min_cycles: int, max_cycles: int,
+                   seed: Optional[int] = None) -> Iterator[int]:
+    """Yield random latencies for :class:`AXI4Slave`, uniformly distributed.
+
+    .. versionadded:: 1.5
+    """
+    rng = random.Random(seed)
+    while True:
+        yield rng.randint(min_cycles, max_cycles)
+
+
+def random_backpressure(max_on: int, max_off: int,
+                        seed: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """Yield random ``(on, off)`` cycle counts for :class:`AXI4Slave`.
+
+    Each is uniformly distributed, from 1 to *max_on* and from 0 to *max_off*.
+
+    .. versionadded:: 1.5
+    """
+    rng = random.Random(seed)
+    while True:
+        yield rng.randint(1, max_on), rng.randint(0, max_off)
+
+
+def load_trace(filename: str) -> List[Union[int, Tuple[int, ...]]]:
+    """Read a latency or backpressure trace for :class:`AXI4Slave` from a file.
+
+    Each line holds a latency, or the ``on`` and ``off`` cycle counts of a
+    backpressure pattern, separated by white space. Empty lines and lines
+    starting with ``#`` are skipped.
+
+    .. versionadded:: 1.5
+    """
+    trace = []
+    with open(filename) as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            values = tuple(int(field) for field in fields)
+            trace.append(values[0] if len(values) == 1 else values)
+    return trace
+
+
+class _OnOff:
+    """Tells whether each cycle is on, following ``(on, off)`` cycle counts.
+
+    Every cycle is on without counts, or once they run out.
+    """
+
+    def __init__(self, pattern: Optional[Iterable[Tuple[int, int]]]):
+        self._pattern = None if pattern is None else iter(pattern)
+        self._on = 0
+        self._off = 0
+
+    def __call__(self) -> bool:
+        if self._pattern is None:
+            return True
+        while not (self._on or self._off):
+            try:
+                self._on, self._off = next(self._pattern)
+            except StopIteration:
+                self._pattern = None
+                return True
+        if self._on:
+            self._on -= 1
+            return True
+        self._off -= 1
+        return False
+
+
+class _SlaveBurst:
+    """A burst accepted by an :class:`AXI4Slave`."""
+
+    __slots__ = ("id", "address", "length", "size", "burst", "beat",
+                 "ready_cycle")
+
+    def __init__(self, txn_id, address, length, size, burst):
+        self.id = txn_id
+        self.address = address
+        self.length = length
+        self.size = size
+        self.burst = burst
+        # The next beat to transfer
+        self.beat = 0
+        # The cycle from which the data, or the write response, can be sent
+        self.ready_cycle = None
+
+    def beat_address(self) -> int:
+        address = self.address
+        if self.beat == 0 or self.burst == AXIBurst.FIXED:
+            return address
+        address = address - address % self.size + self.beat * self.size
+        if self.burst == AXIBurst.WRAP:
+            wrap_size = self.size * self.length
+            base = self.address - self.address % wrap_size
+            address = base + (address - base) % wrap_size
+        return address
+
+
+class AXI4SlaveStatistics:
+    """Counters of an :class:`AXI4Slave`.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self):
+        #: Clock cycles since the slave was created
+        self.cycles = 0
+        self.read_bursts = 0
+        self.write_bursts = 0
+        self.read_beats = 0
+        self.write_beats = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        #: The largest number of read bursts which were accepted and not completed
+        self.max_outstanding_reads = 0
+        #: The largest number of write bursts which were accepted and not completed
+        self.max_outstanding_writes = 0
+
+    @property
+    def read_throughput(self) -> float:
+        """Bytes read per clock cycle."""
+        return self.bytes_read / self.cycles if self.cycles else 0.0
+
+    @property
+    def write_throughput(self) -> float:
+        """Bytes written per clock cycle."""
+        return self.bytes_written / self.cycles if self.cycles else 0.0
+
+
 class AXI4Slave(BusDriver):
     '''
     AXI4 Slave
 
     Monitors an internal memory and handles read and write requests.
+
+    Up to *max_outstanding* read and write bursts are accepted, and queued
+    until they complete. Each burst is answered after a latency, in the order
+    in which they are ready: bursts with different IDs may be answered out of
+    order, bursts with the same ID are answered in order.
+
+    The latencies are given as a number of clock cycles, or as an iterable of
+    them, taken in turn for each burst, such as a list read by
+    :func:`load_trace` or :func:`random_latency`.
+    Backpressure is given for the ``"AR"``, ``"AW"`` and ``"W"`` channels, on
+    which it deasserts the ``READY`` signal, and for the ``"R"`` channel, on
+    which it delays the ``RVALID`` signal. Like the *valid_generator* of
+    :class:`~cocotb.drivers.ValidatedBusDriver`, each is an iterable of
+    ``(on, off)`` cycle counts, such as :func:`random_backpressure`.
+    Once an iterable runs out, the latency is 0 and there is no backpressure.
+
+    Args:
+        memory: The contents of the memory, a :class:`~cocotb.drivers.memory.SparseMemory`,
+            or a buffer such as an :class:`array.array` which is accessed from address 0.
+            By default a new, empty 4 GiB :class:`~cocotb.drivers.memory.SparseMemory`.
+            If this is the name of an image file, the memory is loaded from it
+            with :meth:`SparseMemory.from_image() <cocotb.drivers.memory.SparseMemory.from_image>`.
+        big_endian: If ``True``, byte lane ``i`` of the data buses holds the byte at
+            offset ``n - 1 - i`` of each ``n``-byte bus word, instead of the byte at
+            offset ``i``. Narrow beats and ``WSTRB`` use the lanes of their bytes.
+        max_outstanding: The number of read, and of write, bursts accepted at once.
+        read_latency: The cycles from a read address to its first data.
+        write_latency: The cycles from the last data of a write to its response.
+        backpressure: The ``(on, off)`` cycle counts of each channel.
+
+    .. versionchanged:: 1.5
+        *memory* can be a :class:`~cocotb.drivers.memory.SparseMemory`, and is optional.
+        Added *max_outstanding*, *read_latency*, *write_latency*,
+        *backpressure* and :attr:`stats`.
+
+    .. deprecated:: 1.5
+        The locks ``write_address_busy``, ``read_address_busy`` and
+        ``write_data_busy`` are no longer held while a channel is in use,
+        as several bursts are handled at once. Acquiring them does not keep
+        the slave off the bus.
     '''
     _signals = [
         "ARREADY", "ARVALID", "ARADDR",             # Read address channel
@@ -590,7 +1134,8 @@ class AXI4Slave(BusDriver):
 
     ]
 
-    # Not currently supported by this driver
+    # The IDs, write strobes and write response channel are used when present,
+    # the others are not currently supported by this driver
     _optional_signals = [
         "WLAST",   "WSTRB",
         "BVALID",  "BREADY",  "BRESP",   "RRESP",
@@ -600,129 +1145,256 @@ class AXI4Slave(BusDriver):
         "BID",     "RID",     "WID"
     ]
 
-    def __init__(self, entity, name, clock, memory, callback=None, event=None,
-                 big_endian=False, **kwargs):
+    write_address_busy = _deprecated_lock("write_address_busy")
+    read_address_busy = _deprecated_lock("read_address_busy")
+    write_data_busy = _deprecated_lock("write_data_busy")
+
+    def __init__(self, entity, name, clock, memory=None, callback=None, event=None,
+                 big_endian=False, max_outstanding=8, read_latency=0,
+                 write_latency=0, backpressure=None, **kwargs):
 
         BusDriver.__init__(self, entity, name, clock, **kwargs)
         self.clock = clock
 
         self.big_endian = big_endian
-        self.bus.ARREADY.setimmediatevalue(1)
+        self._byteorder = "big" if big_endian else "little"
+        self.bus.ARREADY.setimmediatevalue(0)
         self.bus.RVALID.setimmediatevalue(0)
         self.bus.RLAST.setimmediatevalue(0)
-        self.bus.AWREADY.setimmediatevalue(1)
+        self.bus.AWREADY.setimmediatevalue(0)
+        self.bus.WREADY.setimmediatevalue(0)
+        for signal in ("BVALID", "BRESP", "RRESP"):
+            if hasattr(self.bus, signal):
+                getattr(self.bus, signal).setimmediatevalue(0)
+        if memory is None:
+            memory = SparseMemory()
+        elif isinstance(memory, str):
+            memory = SparseMemory.from_image(memory)
+        elif not isinstance(memory, SparseMemory):
+            buffer = memory
+            memory = SparseMemory(size=len(memoryview(buffer).cast("B")))
+            memory.map(buffer)
         self._memory = memory
 
-        self.write_address_busy = Lock("%s_wabusy" % name)
-        self.read_address_busy = Lock("%s_rabusy" % name)
-        self.write_data_busy = Lock("%s_wbusy" % name)
+        self.max_outstanding = max_outstanding
+        self.stats = AXI4SlaveStatistics()
+        self._read_latency = self._latencies(read_latency)
+        self._write_latency = self._latencies(write_latency)
+        backpressure = {} if backpressure is None else backpressure
+        unknown = set(backpressure) - {"AR", "AW", "W", "R"}
+        if unknown:
+            raise ValueError("Backpressure is only supported on the AR, AW, W "
+                             "and R channels, not {}".format(", ".join(sorted(unknown))))
+        self._ar_on = _OnOff(backpressure.get("AR"))
+        self._aw_on = _OnOff(backpressure.get("AW"))
+        self._w_on = _OnOff(backpressure.get("W"))
+        self._r_on = _OnOff(backpressure.get("R"))
+
+        self._busy_locks = {}
+        self._cycle = 0
+        # Read bursts, in the order they were accepted
+        self._reads = []
+        # Write bursts waiting for their data, in order, and their data beats
+        # which arrived before them
+        self._write_data = collections.deque()
+        self._write_beats = collections.deque()
+        # Write bursts waiting for their response, in the order of their data
+        self._write_responses = []
+        # The bursts being answered on the R and B channels
+        self._read_burst = None
+        self._response_burst = None
+
+        cocotb.fork(self._run())
+
+    @property
+    def memory(self) -> SparseMemory:
+        """The contents of the memory, for back-door access, or to :meth:`~cocotb.drivers.memory.SparseMemory.dump` them."""
+        return self._memory
 
-        cocotb.fork(self._read_data())
-        cocotb.fork(self._write_data())
+    @staticmethod
+    def _latencies(latency):
+        if isinstance(latency, int):
+            return itertools.repeat(latency)
+        return iter(latency)
 
     def _size_to_bytes_in_beat(self, AxSIZE):
         if AxSIZE < 7:
             return 2 ** AxSIZE
         return None
 
-    async def _write_data(self):
-        clock_re = RisingEdge(self.clock)
+    def _accept(self, channel: str) -> _SlaveBurst:
+        bus = self.bus
+        txn_id = getattr(bus, channel + "ID").value_int \
+            if hasattr(bus, channel + "ID") else 0
+        burst = _SlaveBurst(
+            txn_id, getattr(bus, channel + "ADDR").value_int,
+            getattr(bus, channel + "LEN").value_int + 1,
+            self._size_to_bytes_in_beat(getattr(bus, channel + "SIZE").value_int),
+            getattr(bus, channel + "BURST").value_int)
+
+        if __debug__:
+            self.log.debug(
+                "%sID %d %sADDR %#x %sLEN %d %sSIZE %d %sBURST %d",
+                channel, burst.id, channel, burst.address, channel,
+                burst.length - 1, channel, burst.size.bit_length() - 1,
+                channel, burst.burst)
+        return burst
 
-        while True:
-            while True:
-                self.bus.WREADY <= 0
-                await ReadOnly()
-                if self.bus.AWVALID.value:
-                    self.bus.WREADY <= 1
-                    break
-                await clock_re
-
-            await ReadOnly()
-            _awaddr = int(self.bus.AWADDR)
-            _awlen = int(self.bus.AWLEN)
-            _awsize = int(self.bus.AWSIZE)
-            _awburst = int(self.bus.AWBURST)
-            _awprot = int(self.bus.AWPROT)
-
-            burst_length = _awlen + 1
-            bytes_in_beat = self._size_to_bytes_in_beat(_awsize)
-
-            if __debug__:
-                self.log.debug(
-                    "AWADDR  %d\n" % _awaddr +
-                    "AWLEN   %d\n" % _awlen +
-                    "AWSIZE  %d\n" % _awsize +
-                    "AWBURST %d\n" % _awburst +
-                    "AWPROT %d\n" % _awprot +
-                    "BURST_LENGTH %d\n" % burst_length +
-                    "Bytes in beat %d\n" % bytes_in_beat)
-
-            burst_count = burst_length
-
-            await clock_re
+    @staticmethod
+    def _beat_bytes(address: int, size: int, bus_bytes: int) -> int:
+        """Return the bytes of its bus word which the beat at *address* transfers.
 
-            while True:
-                if self.bus.WVALID.value:
-                    word = self.bus.WDATA.value
-                    word.big_endian = self.big_endian
-                    _burst_diff = burst_length - burst_count
-                    _st = _awaddr + (_burst_diff * bytes_in_beat)  # start
-                    _end = _awaddr + ((_burst_diff + 1) * bytes_in_beat)  # end
-                    self._memory[_st:_end] = array.array('B', word.buff)
-                    burst_count -= 1
-                    if burst_count == 0:
-                        break
-                await clock_re
+        Bit ``i`` of the mask is set for the byte at offset ``i`` in the bus word,
+        from the address of the beat to the end of its size.
+        """
+        offset = address % bus_bytes
+        mask = ((1 << size) - 1) << (offset - offset % size)
+        return mask & ~((1 << offset) - 1)
+
+    def _write_beat(self, burst: _SlaveBurst, wdata: int,
+                    wstrb: Optional[int]) -> None:
+        bus_bytes = len(self.bus.WDATA) // 8
+        address = burst.beat_address()
+        bus_address = address - address % bus_bytes
+        enabled = self._beat_bytes(address, burst.size, bus_bytes)
+        if wstrb is not None:
+            if self.big_endian:
+                # Byte lane i holds the byte at offset bus_bytes - 1 - i
+                wstrb = int("{:0{}b}".format(wstrb, bus_bytes)[::-1], 2)
+            enabled &= wstrb
+        self._memory.write(bus_address, wdata.to_bytes(bus_bytes, self._byteorder),
+                           byteenable=enabled)
+        burst.beat += 1
+        self.stats.write_beats += 1
+        self.stats.bytes_written += bin(enabled).count("1")
+
+    def _read_beat(self, burst: _SlaveBurst) -> int:
+        bus_bytes = len(self.bus.RDATA) // 8
+        address = burst.beat_address()
+        address -= address % burst.size
+        data = int.from_bytes(self._memory.read(address, burst.size),
+                              self._byteorder)
+        # The byte lanes of the beat, which are the same as those written by
+        # a beat with the same address and size
+        if self.big_endian:
+            return data << 8 * (bus_bytes - address % bus_bytes - burst.size)
+        return data << 8 * (address % bus_bytes)
 
-    async def _read_data(self):
+    @staticmethod
+    def _next_ready(bursts: List[_SlaveBurst], cycle: int) -> Optional[_SlaveBurst]:
+        """Return the burst to answer next: the earliest ready of the oldest bursts of each ID."""
+        chosen = None
+        seen_ids = set()
+        for burst in bursts:
+            if burst.id in seen_ids:
+                continue
+            seen_ids.add(burst.id)
+            if burst.ready_cycle <= cycle and (
+                    chosen is None or burst.ready_cycle < chosen.ready_cycle):
+                chosen = burst
+        return chosen
+
+    async def _run(self):
         clock_re = RisingEdge(self.clock)
+        bus = self.bus
+        stats = self.stats
+        wstrb = getattr(bus, "WSTRB", None)
+        rid = getattr(bus, "RID", None)
+        bid = getattr(bus, "BID", None)
+        has_b = hasattr(bus, "BVALID")
 
-        while True:
-            while True:
-                await ReadOnly()
-                if self.bus.ARVALID.value:
-                    break
-                await clock_re
+        # The values driven in this cycle
+        arready = awready = wready = rvalid = bvalid = False
+        r_held = False
 
+        while True:
             await ReadOnly()
-            _araddr = int(self.bus.ARADDR)
-            _arlen = int(self.bus.ARLEN)
-            _arsize = int(self.bus.ARSIZE)
-            _arburst = int(self.bus.ARBURST)
-            _arprot = int(self.bus.ARPROT)
-
-            burst_length = _arlen + 1
-            bytes_in_beat = self._size_to_bytes_in_beat(_arsize)
-
-            word = BinaryValue(n_bits=bytes_in_beat*8, bigEndian=self.big_endian)
 
-            if __debug__:
-                self.log.debug(
-                    "ARADDR  %d\n" % _araddr +
-                    "ARLEN   %d\n" % _arlen +
-                    "ARSIZE  %d\n" % _arsize +
-                    "ARBURST %d\n" % _arburst +
-                    "ARPROT %d\n" % _arprot +
-                    "BURST_LENGTH %d\n" % burst_length +
-                    "Bytes in beat %d\n" % bytes_in_beat)
-
-            burst_count = burst_length
+            if arready and bus.ARVALID.value:
+                burst = self._accept("AR")
+                burst.ready_cycle = self._cycle + next(self._read_latency, 0)
+                self._reads.append(burst)
+                stats.read_bursts += 1
+                stats.max_outstanding_reads = max(stats.max_outstanding_reads,
+                                                  len(self._reads))
+
+            if awready and bus.AWVALID.value:
+                self._write_data.append(self._accept("AW"))
+                stats.write_bursts += 1
+                stats.max_outstanding_writes = max(
+                    stats.max_outstanding_writes,
+                    len(self._write_data) + len(self._write_responses))
+
+            if wready and bus.WVALID.value:
+                self._write_beats.append(
+                    (bus.WDATA.value_int, None if wstrb is None else wstrb.value_int))
+
+            r_held = rvalid
+            if rvalid and bus.RREADY.value:
+                r_held = False
+                burst = self._read_burst
+                burst.beat += 1
+                stats.read_beats += 1
+                stats.bytes_read += burst.size
+                if burst.beat == burst.length:
+                    self._reads.remove(burst)
+                    self._read_burst = None
+
+            if bvalid and bus.BREADY.value:
+                self._write_responses.remove(self._response_burst)
+                self._response_burst = None
+
+            # The data of AXI4 writes is in the order of their addresses
+            while self._write_data and self._write_beats:
+                burst = self._write_data[0]
+                self._write_beat(burst, *self._write_beats.popleft())
+                if burst.beat == burst.length:
+                    self._write_data.popleft()
+                    if has_b:
+                        burst.ready_cycle = self._cycle + next(self._write_latency, 0)
+                        self._write_responses.append(burst)
 
             await clock_re
-
-            while True:
-                self.bus.RVALID <= 1
-                await ReadOnly()
-                if self.bus.RREADY.value:
-                    _burst_diff = burst_length - burst_count
-                    _st = _araddr + (_burst_diff * bytes_in_beat)
-                    _end = _araddr + ((_burst_diff + 1) * bytes_in_beat)
-                    word.buff = self._memory[_st:_end].tobytes()
-                    self.bus.RDATA <= word
-                    if burst_count == 1:
-                        self.bus.RLAST <= 1
-                await clock_re
-                burst_count -= 1
-                self.bus.RLAST <= 0
-                if burst_count == 0:
-                    break
+            self._cycle += 1
+            stats.cycles += 1
+
+            # Only the signals which change are written
+            ready = len(self._reads) < self.max_outstanding and self._ar_on()
+            if ready != arready:
+                arready = ready
+                bus.ARREADY <= int(ready)
+
+            ready = (len(self._write_data) + len(self._write_responses) <
+                     self.max_outstanding and self._aw_on())
+            if ready != awready:
+                awready = ready
+                bus.AWREADY <= int(ready)
+
+            ready = self._w_on()
+            if ready != wready:
+                wready = ready
+                bus.WREADY <= int(ready)
+
+            # VALID stays asserted until the beat is accepted
+            if not r_held:
+                if self._read_burst is None:
+                    self._read_burst = self._next_ready(self._reads, self._cycle)
+                burst = self._read_burst
+                send = burst is not None and self._r_on()
+                if send:
+                    bus.RDATA <= self._read_beat(burst)
+                    bus.RLAST <= int(burst.beat == burst.length - 1)
+                    if rid is not None:
+                        rid <= burst.id
+                if send != rvalid:
+                    rvalid = send
+                    bus.RVALID <= int(send)
+
+            if has_b and self._response_burst is None:
+                self._response_burst = self._next_ready(self._write_responses,
+                                                        self._cycle)
+                if self._response_burst is not None and bid is not None:
+                    bid <= self._response_burst.id
+            if has_b and (self._response_burst is not None) != bvalid:
+                bvalid = self._response_burst is not None
+                bus.BVALID <= int(bvalid)
@@ -33,12 +33,14 @@ NB Currently we only support a very small subset of functionality
 """
 
 import random
-from typing import Iterable, Union, Optional
+import warnings
+from typing import Iterable, List, Optional, Tuple, Union
 
 import cocotb
 from cocotb.decorators import coroutine
 from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly, NextTimeStep, Event
 from cocotb.drivers import BusDriver, ValidatedBusDriver
+from cocotb.drivers.memory import SparseMemory
 from cocotb.utils import hexdump
 from cocotb.binary import BinaryValue
 from cocotb.result import TestError
@@ -231,8 +233,70 @@ class AvalonMaster(AvalonMM):
         self._release_lock()
 
 
+class _DictMemory:
+    """Access a :class:`dict` like a :class:`~cocotb.drivers.memory.SparseMemory`, for :class:`AvalonMemory`.
+
+    The layout is the one :class:`AvalonMemory` used before it had a
+    :class:`~cocotb.drivers.memory.SparseMemory`: a word per key for single-word
+    accesses, keyed by the word address, and a byte per key for bursts.
+    The dict is used in place, so it is shared with its other users.
+    """
+
+    def __init__(self, data, word_bytes, read_words, write_words):
+        self.data = data
+        self.word_bytes = word_bytes
+        self.read_words = read_words
+        self.write_words = write_words
+
+    def is_initialized(self, addr, length=1):
+        if self.read_words:
+            return addr // self.word_bytes in self.data
+        return addr in self.data
+
+    def read_word(self, addr, n_bytes):
+        if self.read_words:
+            return self.data[addr // self.word_bytes]
+        return int.from_bytes(self.view(addr, n_bytes), "little")
+
+    def view(self, addr, length):
+        return bytes(self.data.get(a, 0) & 0xFF for a in range(addr, addr + length))
+
+    def write_word(self, addr, value, n_bytes, byteenable=None):
+        if not self.write_words:
+            for i in range(n_bytes):
+                if byteenable is None or byteenable >> i & 1:
+                    self.data[addr + i] = value >> (8 * i) & 0xFF
+            return
+        key = addr // self.word_bytes
+        if byteenable is not None:
+            mask = 0
+            for i in range(n_bytes):
+                if byteenable >> i & 1:
+                    mask |= 0xFF << (8 * i)
+            value = (value & mask) | (self.data.get(key, 0) & ~mask)
+        self.data[key] = value & ((1 << (8 * n_bytes)) - 1)
+
+
 class AvalonMemory(BusDriver):
-    """Emulate a memory, with back-door access."""
+    """Emulate a memory, with back-door access.
+
+    Args:
+        memory (SparseMemory): The contents of the memory, which can be shared
+            between several instances to model a multi-port RAM.
+            By default a new, empty 4 GiB :class:`~cocotb.drivers.memory.SparseMemory`.
+            If this is the name of an image file, the memory is loaded from it
+            with :meth:`SparseMemory.from_image() <cocotb.drivers.memory.SparseMemory.from_image>`.
+        byte_addressed (bool): If ``True``, the address of single-word accesses is the
+            address of their first byte in *memory*. By default it is a word address,
+            so word ``n`` is stored at byte address ``n`` times the width of the data bus in bytes.
+            Burst accesses always use byte addresses.
+
+    .. versionchanged:: 1.5
+        The memory is a :class:`~cocotb.drivers.memory.SparseMemory` instead of a
+        :class:`dict`. Passing a :class:`dict` is deprecated; it is still used in place,
+        with a word per key for single-word accesses and a byte per key for bursts.
+        Added *byte_addressed*.
+    """
     _signals = ["address"]
     _optional_signals = ["write", "read", "writedata", "readdatavalid",
                          "readdata", "waitrequest", "burstcount", "byteenable"]
@@ -245,7 +309,8 @@ class AvalonMemory(BusDriver):
     }
 
     def __init__(self, entity, name, clock, readlatency_min=1,
-                 readlatency_max=1, memory=None, avl_properties={}, **kwargs):
+                 readlatency_max=1, memory=None, avl_properties={},
+                 byte_addressed=False, **kwargs):
         BusDriver.__init__(self, entity, name, clock, **kwargs)
 
         if avl_properties != {}:
@@ -281,9 +346,26 @@ class AvalonMemory(BusDriver):
         if not self._readable and not self._writeable:
             raise TestError("Attempt to instantiate useless memory")
 
-        # Allow dual port RAMs by referencing the same dictionary
+        if hasattr(self.bus, "burstcount"):
+            self._burstread = hasattr(self.bus, "readdatavalid")
+            self._burstwrite = True
+
+        # Single-word accesses are scaled to a byte address in the memory
+        self._word_scale = 1 if byte_addressed else self.dataByteSize
+
+        # Allow dual port RAMs by referencing the same memory
         if memory is None:
-            self._mem = {}
+            self._mem = SparseMemory()
+        elif isinstance(memory, str):
+            self._mem = SparseMemory.from_image(memory)
+        elif isinstance(memory, dict):
+            warnings.warn(
+                "Passing a dict as the memory of AvalonMemory is deprecated, "
+                "pass a cocotb.drivers.memory.SparseMemory instead.",
+                DeprecationWarning, stacklevel=2)
+            self._mem = _DictMemory(memory, self.dataByteSize,
+                                    read_words=not self._burstread,
+                                    write_words=not self._burstwrite)
         else:
             self._mem = memory
 
@@ -300,9 +382,6 @@ class AvalonMemory(BusDriver):
             self.bus.waitrequest.setimmediatevalue(0)
 
         if hasattr(self.bus, "burstcount"):
-            if hasattr(self.bus, "readdatavalid"):
-                self._burstread = True
-            self._burstwrite = True
             if self._avalon_properties.get("WriteBurstWaitReq", True):
                 self.bus.waitrequest <= 1
             else:
@@ -311,6 +390,14 @@ class AvalonMemory(BusDriver):
         if hasattr(self.bus, "readdatavalid"):
             self.bus.readdatavalid.setimmediatevalue(0)
 
+    @property
+    def memory(self) -> SparseMemory:
+        """The contents of the memory, for back-door access, or to :meth:`~cocotb.drivers.memory.SparseMemory.dump` them.
+
+        If a :class:`dict` was passed as *memory*, this is an object which accesses the dict.
+        """
+        return self._mem
+
     def _pad(self):
         """Pad response queue up to read latency."""
         l = random.randint(self._readlatency_min, self._readlatency_max)
@@ -360,11 +447,7 @@ class AvalonMemory(BusDriver):
     async def _writing_byte_value(self, byteaddr):
         """Writing value in _mem with byteaddr size."""
         await FallingEdge(self.clock)
-        for i in range(self.dataByteSize):
-            data = self.bus.writedata.value.integer
-            addrtmp = byteaddr + i
-            datatmp = (data >> (i*8)) & 0xff
-            self._mem[addrtmp] = datatmp
+        self._mem.write_word(byteaddr, self.bus.writedata.value.integer, self.dataByteSize)
 
     async def _waitrequest(self):
         """Generate waitrequest randomly."""
@@ -392,15 +475,16 @@ class AvalonMemory(BusDriver):
             if self._readable and self.bus.read.value:
                 if not self._burstread:
                     self._pad()
-                    addr = self.bus.address.value.integer
-                    if addr not in self._mem:
+                    addr = self.bus.address.value.integer * self._word_scale
+                    if not self._mem.is_initialized(addr, self.dataByteSize):
                         self.log.warning("Attempt to read from uninitialized "
                                          "address 0x%x", addr)
                         self._responses.append(True)
                     else:
+                        value = self._mem.read_word(addr, self.dataByteSize)
                         self.log.debug("Read from address 0x%x returning 0x%x",
-                                       addr, self._mem[addr])
-                        self._responses.append(self._mem[addr])
+                                       addr, value)
+                        self._responses.append(value)
                 else:
                     addr = self.bus.address.value.integer
                     if addr % self.dataByteSize != 0:
@@ -429,17 +513,17 @@ class AvalonMemory(BusDriver):
                     # wait for read data
                     for i in range(self._avalon_properties["readLatency"]):
                         await edge
+                    # The whole burst, without copying it if it is in a single page
+                    burst = self._mem.view(addr * self.dataByteSize, burstcount * self.dataByteSize)
                     for count in range(burstcount):
-                        if (addr + count)*self.dataByteSize not in self._mem:
+                        if not self._mem.is_initialized((addr + count) * self.dataByteSize, self.dataByteSize):
                             self.log.warning("Attempt to burst read from uninitialized "
                                              "address 0x%x (addr 0x%x count 0x%x)",
                                              (addr + count) * self.dataByteSize, addr, count)
                             self._responses.append(True)
                         else:
-                            value = 0
-                            for i in range(self.dataByteSize):
-                                rvalue = self._mem[(addr + count)*self.dataByteSize + i]
-                                value += rvalue << i*8
+                            value = int.from_bytes(
+                                burst[count * self.dataByteSize:(count + 1) * self.dataByteSize], "little")
                             self.log.debug("Read from address 0x%x returning 0x%x",
                                            (addr + count) * self.dataByteSize, value)
                             self._responses.append(value)
@@ -448,34 +532,15 @@ class AvalonMemory(BusDriver):
 
             if self._writeable and self.bus.write.value:
                 if not self._burstwrite:
-                    addr = self.bus.address.value.integer
+                    addr = self.bus.address.value.integer * self._word_scale
                     data = self.bus.writedata.value.integer
+                    byteenable = None
                     if hasattr(self.bus, "byteenable"):
                         byteenable = int(self.bus.byteenable.value)
-                        mask = 0
-                        oldmask = 0
-                        olddata = 0
-                        if addr in self._mem:
-                            olddata = self._mem[addr]
-                        self.log.debug("Old Data  : %x", olddata)
-                        self.log.debug("Data in   : %x", data)
-                        self.log.debug("Width     : %d", self._width)
                         self.log.debug("Byteenable: %x", byteenable)
-                        for i in range(self._width//8):
-                            if byteenable & 2**i:
-                                mask |= 0xFF << (8*i)
-                            else:
-                                oldmask |= 0xFF << (8*i)
-
-                        self.log.debug("Data mask : %x", mask)
-                        self.log.debug("Old mask  : %x", oldmask)
-
-                        data = (data & mask) | (olddata & oldmask)
-
-                        self.log.debug("Data out  : %x", data)
 
                     self.log.debug("Write to address 0x%x -> 0x%x", addr, data)
-                    self._mem[addr] = data
+                    self._mem.write_word(addr, data, self.dataByteSize, byteenable=byteenable)
                 else:
                     self.log.debug("writing burst")
                     # maintain waitrequest high randomly
@@ -664,6 +729,25 @@ class AvalonSTPkts(ValidatedBusDriver):
             await RisingEdge(self.clock)
             await ReadOnly()
 
+    def _pack_words(self, string: bytes) -> List[Tuple[int, int]]:
+        """Pack a packet into the data and empty values of each of its bus words."""
+        # FIXME: buses that aren't an integer numbers of bytes
+        n_bits = len(self.bus.data)
+        bus_width = n_bits // 8
+        first_symbol_high = self.config["firstSymbolInHighOrderBits"]
+
+        view = memoryview(string)
+        words = []
+        for start in range(0, len(view), bus_width):
+            chunk = view[start:start + bus_width]
+            if first_symbol_high:
+                # A short last word is padded in its low order bits
+                data = int.from_bytes(chunk, "big") << (n_bits - 8 * len(chunk))
+            else:
+                data = int.from_bytes(chunk, "little")
+            words.append((data, bus_width - len(chunk)))
+        return words
+
     async def _send_string(self, string: bytes, sync: bool = True, channel: Optional[int] = None) -> None:
         """Args:
             string: A string of bytes to send over the bus.
@@ -673,8 +757,7 @@ class AvalonSTPkts(ValidatedBusDriver):
         clkedge = RisingEdge(self.clock)
         firstword = True
 
-        # FIXME: buses that aren't an integer numbers of bytes
-        bus_width = int(len(self.bus.data) / 8)
+        words = self._pack_words(string)
 
         word = BinaryValue(n_bits=len(self.bus.data),
                            bigEndian=self.config["firstSymbolInHighOrderBits"])
@@ -697,7 +780,7 @@ class AvalonSTPkts(ValidatedBusDriver):
         elif channel is not None:
             raise TestError("%s does not have a channel signal" % self.name)
 
-        while string:
+        for word_num, (data, n_empty) in enumerate(words, 1):
             if not firstword or (firstword and sync):
                 await clkedge
 
@@ -730,19 +813,12 @@ class AvalonSTPkts(ValidatedBusDriver):
             else:
                 self.bus.startofpacket <= 0
 
-            nbytes = min(len(string), bus_width)
-            data = string[:nbytes]
-            word.buff = data
-
-            if len(string) <= bus_width:
+            if word_num == len(words):
                 self.bus.endofpacket <= 1
                 if self.use_empty:
-                    self.bus.empty <= bus_width - len(string)
-                string = b""
-            else:
-                string = string[bus_width:]
+                    self.bus.empty <= n_empty
 
-            self.bus.data <= word
+            self.bus.data <= data
 
             # If this is a bus with a ready signal, wait for this word to
             # be acknowledged
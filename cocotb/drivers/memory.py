@@ -0,0 +1,427 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""A sparse, byte-addressed memory model shared by the memory bus functional models."""
+
+import bisect
+import mmap
+import os
+import struct
+
+_ELF_MAGIC = b"\x7fELF"
+_PT_LOAD = 1
+
+# Layouts of the ELF header after e_ident, and of the program headers, for 32 and 64-bit files.
+# e_phoff, e_phentsize and e_phnum are the fields 4, 8 and 9 of the header in both.
+_elf_header = {1: "HHIIIIIHHHHHH", 2: "HHIQQQIHHHHHH"}
+_elf_program_header = {
+    1: ("IIIIIIII", ("type", "offset", "vaddr", "paddr", "filesz", "memsz", "flags", "align")),
+    2: ("IIQQQQQQ", ("type", "flags", "offset", "vaddr", "paddr", "filesz", "memsz", "align")),
+}
+
+
+def _image_format(filename):
+    """Guess the format of an image file from its name and contents."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in (".hex", ".ihex", ".ihx"):
+        return "ihex"
+    with open(filename, "rb") as f:
+        if f.read(len(_ELF_MAGIC)) == _ELF_MAGIC:
+            return "elf"
+    return "raw"
+
+
+class MemoryStatistics:
+    """Access counters of a :class:`SparseMemory`."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+
+class SparseMemory:
+    """A byte-addressed memory whose pages are only allocated when they are written.
+
+    Reading memory which was never written returns zeros, without allocating it.
+    Buffers, such as a :class:`bytearray`, an :class:`array.array` or an
+    :class:`mmap.mmap`, can be mapped into the address space with :meth:`map`,
+    accesses to them read and write the buffer itself.
+
+    Besides the methods below, bytes can be accessed by indexing and slicing:
+    ``mem[addr]`` is an :class:`int`, and ``mem[start:end]`` is :class:`bytes`.
+
+    Args:
+        size: The size of the address space, in bytes.
+        page_size: The size of the pages, in bytes. Must be a power of two.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, size=1 << 32, page_size=4096):
+        if page_size & (page_size - 1):
+            raise ValueError("page_size must be a power of two, not {}".format(page_size))
+        self.size = size
+        self.page_size = page_size
+        self._page_shift = page_size.bit_length() - 1
+        self._pages = {}
+        self._zeros = memoryview(bytes(page_size))
+        # Mapped buffers, sorted by start address
+        self._region_starts = []
+        self._regions = []
+        # Indices of the pages written to since the last clear_modified()
+        self._modified = set()
+        self.stats = MemoryStatistics()
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def pages_allocated(self):
+        """The number of pages which were allocated."""
+        return len(self._pages)
+
+    def map(self, buffer, base=0):
+        """Map *buffer* into the address space, starting at *base*.
+
+        The memory reads and writes *buffer* directly, without copying it.
+        Mapped buffers must not overlap each other, and replace any pages
+        which were allocated at their addresses.
+
+        Args:
+            buffer: A writable object supporting the buffer protocol.
+            base: The address of the first byte of *buffer*.
+        """
+        view = memoryview(buffer).cast("B")
+        end = base + len(view)
+        if base < 0 or end > self.size:
+            raise ValueError("Buffer at 0x{:x}-0x{:x} is outside of the memory".format(base, end))
+        i = bisect.bisect_right(self._region_starts, base)
+        if (i > 0 and self._regions[i - 1][1] > base) or (i < len(self._regions) and self._regions[i][0] < end):
+            raise ValueError("Buffer at 0x{:x}-0x{:x} overlaps a mapped buffer".format(base, end))
+        self._region_starts.insert(i, base)
+        self._regions.insert(i, (base, end, view))
+
+    def map_file(self, filename, base=0, writable=True):
+        """Map the contents of the file *filename* into the address space with :func:`mmap.mmap`.
+
+        The file is not read: its pages are loaded by the operating system when
+        they are accessed. If *writable*, writes go to the file, otherwise
+        they are only kept in memory.
+
+        Returns:
+            The :class:`mmap.mmap` object of the file.
+        """
+        with open(filename, "r+b" if writable else "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_COPY)
+        self.map(mm, base)
+        return mm
+
+    @classmethod
+    def from_image(cls, filename, format=None, size=1 << 32, page_size=4096, writable=False):
+        """Return a memory with the image in *filename* loaded, see :meth:`load`."""
+        mem = cls(size=size, page_size=page_size)
+        mem.load(filename, format=format, writable=writable)
+        return mem
+
+    def load(self, filename, format=None, base=0, writable=False):
+        """Load the image in the file *filename*.
+
+        Raw binary files and the ``PT_LOAD`` segments of ELF files are mapped
+        with :meth:`map_file`, so loading them does not read them, however large
+        they are. Intel HEX files are parsed, and written to the memory.
+
+        Args:
+            filename: The image file.
+            format: ``"raw"``, ``"elf"`` or ``"ihex"``. By default, files named
+                ``*.hex``, ``*.ihex`` or ``*.ihx`` are Intel HEX, files starting with
+                the ELF magic number are ELF, and others are raw.
+            base: Added to the addresses of the image. A raw image starts at address 0.
+            writable: Whether writes to mapped images change the file, see :meth:`map_file`.
+        """
+        if format is None:
+            format = _image_format(filename)
+        if format == "raw":
+            self.map_file(filename, base=base, writable=writable)
+        elif format == "elf":
+            self._load_elf(filename, base, writable)
+        elif format == "ihex":
+            # Loading is not a modification
+            modified = set(self._modified)
+            self._load_ihex(filename, base)
+            self._modified = modified
+        else:
+            raise ValueError("Unknown image format {!r}".format(format))
+
+    def _load_elf(self, filename, base, writable):
+        with open(filename, "r+b" if writable else "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_COPY)
+        if mm[:len(_ELF_MAGIC)] != _ELF_MAGIC or mm[4] not in _elf_header:
+            raise ValueError("{} is not an ELF file".format(filename))
+        elf_class = mm[4]
+        byteorder = "<" if mm[5] == 1 else ">"
+
+        header = struct.unpack_from(byteorder + _elf_header[elf_class], mm, 16)
+        phoff, phentsize, phnum = header[4], header[8], header[9]
+
+        ph_format, ph_names = _elf_program_header[elf_class]
+        view = memoryview(mm)
+        for i in range(phnum):
+            ph = dict(zip(ph_names, struct.unpack_from(byteorder + ph_format, mm, phoff + i * phentsize)))
+            if ph["type"] != _PT_LOAD or not ph["filesz"]:
+                continue
+            # The rest of the segment, up to memsz, is zero, like unwritten memory
+            self.map(view[ph["offset"]:ph["offset"] + ph["filesz"]], base + ph["paddr"])
+
+    def _load_ihex(self, filename, base):
+        upper = 0
+        with open(filename) as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    if line[0] != ":":
+                        raise ValueError("does not start with ':'")
+                    record = bytes.fromhex(line[1:])
+                    if len(record) < 5 or len(record) != record[0] + 5:
+                        raise ValueError("has the wrong length")
+                    if sum(record) & 0xFF:
+                        raise ValueError("has a bad checksum")
+                except ValueError as e:
+                    raise ValueError("{}:{}: record {}".format(filename, lineno, e)) from None
+
+                rtype = record[3]
+                data = record[4:-1]
+                if rtype == 0x00:
+                    self.write(base + upper + int.from_bytes(record[1:3], "big"), data)
+                elif rtype == 0x01:
+                    break
+                elif rtype == 0x02:
+                    upper = int.from_bytes(data, "big") << 4
+                elif rtype == 0x04:
+                    upper = int.from_bytes(data, "big") << 16
+                # Start addresses (types 0x03 and 0x05) do not change the memory
+
+    def _page_ranges(self, indices):
+        return [(index << self._page_shift, min((index + 1) << self._page_shift, self.size))
+                for index in indices]
+
+    def modified_ranges(self):
+        """Return the ``(start, end)`` address ranges of the pages written since :meth:`clear_modified`."""
+        return _merge_ranges(self._page_ranges(self._modified))
+
+    def clear_modified(self):
+        """Forget which pages were written, for example after a :meth:`dump`."""
+        self._modified.clear()
+
+    def dump(self, filename, format="raw", modified_only=True):
+        """Write the contents of the memory to the file *filename*.
+
+        Args:
+            filename: The file to write.
+            format: ``"raw"`` to write each byte at the offset of its address,
+                the file is sparse where the file system supports it, or ``"ihex"``.
+            modified_only: Write only the pages written since :meth:`clear_modified`,
+                otherwise also the other allocated pages and the mapped buffers.
+        """
+        if modified_only:
+            ranges = self.modified_ranges()
+        else:
+            ranges = _merge_ranges([(start, end) for start, end, _ in self._regions] +
+                                   self._page_ranges(self._pages))
+
+        if format == "raw":
+            with open(filename, "wb") as f:
+                for start, end in ranges:
+                    f.seek(start)
+                    # Straight from the pages, without copying them
+                    for chunk in self._chunks(start, end - start):
+                        f.write(chunk)
+        elif format == "ihex":
+            self._dump_ihex(filename, ranges)
+        else:
+            raise ValueError("Unknown image format {!r}".format(format))
+
+    def _dump_ihex(self, filename, ranges):
+        upper = None
+        with open(filename, "w") as f:
+            for start, end in ranges:
+                for addr in range(start, end, 16):
+                    if addr >> 16 != upper:
+                        upper = addr >> 16
+                        f.write(_ihex_record(0x04, 0, upper.to_bytes(2, "big")))
+                    f.write(_ihex_record(0x00, addr & 0xFFFF, self._read(addr, min(16, end - addr))))
+            f.write(_ihex_record(0x01, 0, b""))
+
+    def _chunks(self, addr, length):
+        """Yield views of the *length* bytes starting at *addr*, one per page or mapped buffer."""
+        while length > 0:
+            chunk, _ = self._chunk(addr, False)
+            chunk = chunk[:length]
+            yield chunk
+            addr += len(chunk)
+            length -= len(chunk)
+
+    def _chunk(self, addr, allocate):
+        """Return a view of the buffer holding *addr*, starting at *addr*, and whether it is initialized."""
+        if self._regions:
+            i = bisect.bisect_right(self._region_starts, addr) - 1
+            if i >= 0:
+                start, end, view = self._regions[i]
+                if addr < end:
+                    return view[addr - start:], True
+            # Up to the next mapped buffer
+            limit = self._region_starts[i + 1] if i + 1 < len(self._regions) else None
+        else:
+            limit = None
+
+        index = addr >> self._page_shift
+        offset = addr & (self.page_size - 1)
+        page = self._pages.get(index)
+        initialized = page is not None
+        if page is None:
+            if allocate:
+                page = self._pages[index] = memoryview(bytearray(self.page_size))
+            else:
+                page = self._zeros
+        chunk = page[offset:]
+        if limit is not None and limit - addr < len(chunk):
+            chunk = chunk[:limit - addr]
+        return chunk, initialized
+
+    def _check(self, addr, length):
+        if addr < 0 or addr + length > self.size:
+            raise IndexError("Access to 0x{:x}-0x{:x} is outside of the memory".format(addr, addr + length))
+
+    def view(self, addr, length):
+        """Return a :class:`memoryview` of *length* bytes starting at *addr*.
+
+        This does not copy the data if it is in a single page or mapped buffer,
+        in which case writing to a view of written memory changes the memory.
+        """
+        self._check(addr, length)
+        self.stats.reads += 1
+        self.stats.bytes_read += length
+        chunk, _ = self._chunk(addr, False)
+        if len(chunk) >= length:
+            return chunk[:length]
+        return memoryview(self._read(addr, length))
+
+    def _read(self, addr, length):
+        data = bytearray()
+        for chunk in self._chunks(addr, length):
+            data += chunk
+        return data
+
+    def read(self, addr, length):
+        """Return *length* bytes starting at *addr*."""
+        return self.view(addr, length).tobytes()
+
+    def write(self, addr, data, byteenable=None):
+        """Write the bytes *data* starting at *addr*.
+
+        Args:
+            addr: The address of the first byte.
+            data: A bytes-like object.
+            byteenable: If given, only the bytes whose bit is set in this
+                integer are written, bit ``i`` enabling the byte at ``addr + i``.
+        """
+        data = memoryview(data).cast("B")
+        length = len(data)
+        self._check(addr, length)
+        self.stats.writes += 1
+
+        if byteenable is not None:
+            all_enabled = (1 << length) - 1
+            if byteenable & all_enabled != all_enabled:
+                # Contiguous runs of enabled bytes are written in one go
+                i = 0
+                while i < length:
+                    if byteenable >> i & 1:
+                        j = i
+                        while j < length and byteenable >> j & 1:
+                            j += 1
+                        self._write(addr + i, data[i:j])
+                        i = j
+                    else:
+                        i += 1
+                return
+
+        self._write(addr, data)
+
+    def _write(self, addr, data):
+        self.stats.bytes_written += len(data)
+        first = addr >> self._page_shift
+        last = (addr + len(data) - 1) >> self._page_shift
+        if first == last:
+            self._modified.add(first)
+        else:
+            self._modified.update(range(first, last + 1))
+        while data:
+            chunk, _ = self._chunk(addr, True)
+            n = min(len(chunk), len(data))
+            chunk[:n] = data[:n]
+            addr += n
+            data = data[n:]
+
+    def read_word(self, addr, n_bytes, byteorder="little"):
+        """Return the *n_bytes* bytes starting at *addr* as an integer."""
+        return int.from_bytes(self.view(addr, n_bytes), byteorder)
+
+    def write_word(self, addr, value, n_bytes, byteorder="little", byteenable=None):
+        """Write the integer *value* as *n_bytes* bytes starting at *addr*.
+
+        *byteenable* is like for :meth:`write`, *value* is truncated to *n_bytes*.
+        """
+        value &= (1 << (8 * n_bytes)) - 1
+        self.write(addr, value.to_bytes(n_bytes, byteorder), byteenable)
+
+    def is_initialized(self, addr, length=1):
+        """Return whether all the pages holding the *length* bytes starting at *addr* were written or mapped.
+
+        Memory is tracked per page, so bytes which were not written themselves
+        count as initialized if another byte of their page was written.
+        """
+        end = addr + length
+        while addr < end:
+            chunk, initialized = self._chunk(addr, False)
+            if not initialized:
+                return False
+            addr += len(chunk)
+        return True
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.size)
+            if step != 1:
+                raise ValueError("Slices of a SparseMemory must be contiguous")
+            return self.read(start, max(0, stop - start))
+        return self.view(key, 1)[0]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.size)
+            if step != 1 or len(memoryview(value).cast("B")) != stop - start:
+                raise ValueError("Slice assignments to a SparseMemory must be contiguous and keep the size")
+            self.write(start, value)
+        else:
+            self.write(key, bytes((value,)))
+
+
+def _ihex_record(rtype, addr, data):
+    record = bytes((len(data), addr >> 8, addr & 0xFF, rtype)) + bytes(data)
+    return ":{}{:02X}\n".format(record.hex().upper(), -sum(record) & 0xFF)
+
+
+def _merge_ranges(ranges):
+    """Return the ``(start, end)`` *ranges* sorted, with the overlapping and adjacent ones merged."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and merged[-1][1] >= start:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
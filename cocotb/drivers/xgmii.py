@@ -27,6 +27,7 @@
 
 import struct
 import zlib
+from typing import List
 
 from cocotb.triggers import RisingEdge
 from cocotb.drivers import Driver
@@ -110,6 +111,28 @@ class _XGMIIBus:
     def __len__(self):
         return self._nbytes
 
+    def pack(self, lanes: bytes, ctrl: int) -> List[int]:
+        """Pack bytes into the integer values of consecutive words of the bus.
+
+        Args:
+            lanes: The bytes, as many as a whole number of words.
+            ctrl: The control bits of the bytes, bit ``i`` for ``lanes[i]``.
+        """
+        nbytes = self._nbytes
+        ctrl_mask = (1 << nbytes) - 1
+        view = memoryview(lanes)
+        words = []
+        for offset in range(0, len(view), nbytes):
+            if self._interleaved:
+                word = 0
+                for i, byte in enumerate(view[offset:offset + nbytes]):
+                    word |= (byte | (ctrl >> (offset + i) & 1) << 8) << (9 * i)
+            else:
+                word = int.from_bytes(view[offset:offset + nbytes], "little")
+                word |= (ctrl >> offset & ctrl_mask) << (nbytes * 8)
+            words.append(word)
+        return words
+
 
 class XGMII(Driver):
     """XGMII (10 Gigabit Media Independent Interface) driver."""
@@ -183,38 +206,20 @@ class XGMII(Driver):
         self.log.debug("Sending packet of length %d bytes" % len(pkt))
         self.log.debug(hexdump(pkt))
 
+        # The start character, the packet and the terminate character, then
+        # idles up to the end of the last word, are all packed up front
+        lanes = bytearray([_XGMII_START]) + pkt + bytes([_XGMII_TERMINATE])
+        n_idle = -len(lanes) % len(self.bus)
+        lanes += bytes([_XGMII_IDLE]) * n_idle
+        ctrl = 1 | ((1 << (n_idle + 1)) - 1) << (len(pkt) + 1)
+        words = self.bus.pack(lanes, ctrl)
+
         clkedge = RisingEdge(self.clock)
         if sync:
             await clkedge
 
-        self.bus[0] = (_XGMII_START, True)
-
-        for i in range(1, len(self.bus)):
-            self.bus[i] = (pkt[i-1], False)
-
-        pkt = pkt[len(self.bus)-1:]
-        self.signal <= self.bus.value
-        await clkedge
-
-        done = False
-
-        while pkt:
-
-            for i in range(len(self.bus)):
-                if i == len(pkt):
-                    self.terminate(i)
-                    pkt = b""
-                    done = True
-                    break
-                self.bus[i] = (pkt[i], False)
-
-            self.signal <= self.bus.value
-            await clkedge
-            pkt = pkt[len(self.bus):]
-
-        if not done:
-            self.terminate(0)
-            self.signal <= self.bus.value
+        for word in words:
+            self.signal <= word
             await clkedge
 
         self.idle()
@@ -30,18 +30,28 @@
 # -*- coding: utf-8 -*-
 
 import ctypes
+import re
 import warnings
 import enum
 from functools import lru_cache
 
 import cocotb
 from cocotb import simulator
-from cocotb.binary import BinaryValue, BinaryRepresentation
+from cocotb.binary import BinaryValue
 from cocotb.log import SimLog
 
 # Only issue a warning for each deprecated attribute access
 _deprecation_warned = set()
 
+# Marks lazily fetched attributes for which ``None`` is a valid value
+_UNSET = object()
+
+# The cocotb._hierarchy_cache.HierarchyCache in use, see COCOTB_HIERARCHY_CACHE
+_hierarchy_cache = None
+
+# A name or an index in a path such as "a.b[3].c"
+_path_component_re = re.compile(r"\.?([^.\[\]]+)|\[(-?\d+)\]")
+
 
 class _Limits(enum.IntEnum):
     SIGNED_NBIT   = 1
@@ -69,6 +79,11 @@ class SimHandleBase:
     """Base class for all simulation objects.
 
     We maintain a handle which we can use for GPI calls.
+
+    .. versionchanged:: 1.5
+        Handles use ``__slots__``, so arbitrary attributes can no longer be set on them;
+        doing so raises :exc:`AttributeError`.
+        Handles can still be weakly referenced.
     """
 
     # For backwards compatibility we support a mapping of old member names
@@ -81,6 +96,19 @@ class SimHandleBase:
         "name"              :       "_name",
     }
 
+    __slots__ = (
+        "_handle", "_len", "_sub_handles", "_invalid_sub_handles", "_path_str",
+        "_name_str", "_type_str", "_def_name_str", "_def_file_str", "_handle_log",
+        "_fullname_str", "__weakref__",
+    )
+
+    _class_log = SimLog("cocotb.handle.SimHandleBase")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Shared by all the handles of a class, so creating a handle does not create a logger
+        cls._class_log = SimLog("cocotb.handle.%s" % cls.__qualname__)
+
     def __init__(self, handle, path):
         """
         .. Constructor. This RST comment works around sphinx-doc/sphinx#6885
@@ -89,34 +117,81 @@ class SimHandleBase:
             handle (int): The GPI handle to the simulator object.
             path (str): Path to this handle, ``None`` if root.
         """
+        # Everything that needs a call into the simulator is only fetched
+        # when it is first used, as large designs have very many handles.
         self._handle = handle
         self._len = None  # type: int
         """The "length" (the number of elements) of the underlying object. For vectors this is the number of bits."""
         self._sub_handles = {}  # type: dict
         """Dictionary of this handle's children."""
-        self._invalid_sub_handles = set()  # type: set
+        self._invalid_sub_handles = None  # type: set
         """Python :class:`set` of invalid queries, for caching purposes."""
-        self._name = self._handle.get_name_string()  # type: str
+        self._path_str = path
+        self._name_str = None
+        self._type_str = None
+        self._def_name_str = None
+        self._def_file_str = None
+        self._handle_log = None
+        self._fullname_str = None
+
+    @property
+    def _name(self) -> str:
         """The name of an object.
 
         :meta public:
         """
-        self._type = self._handle.get_type_string()  # type: str
+        if self._name_str is None:
+            self._name_str = self._handle.get_name_string()
+        return self._name_str
+
+    @_name.setter
+    def _name(self, name):
+        self._name_str = name
+
+    @property
+    def _type(self) -> str:
         """The type of an object as a string.
 
         :meta public:
         """
-        self._fullname = self._name + "(%s)" % self._type  # type: str
+        if self._type_str is None:
+            self._type_str = self._handle.get_type_string()
+        return self._type_str
+
+    @property
+    def _fullname(self) -> str:
         """The name of an object with its type appended in parentheses."""
-        self._path = self._name if path is None else path  # type: str
+        if self._fullname_str is None:
+            self._fullname_str = self._name + "(%s)" % self._type
+        return self._fullname_str
+
+    @_fullname.setter
+    def _fullname(self, fullname):
+        self._fullname_str = fullname
+
+    @property
+    def _path(self) -> str:
         """The path to this handle, or its name if this is the root handle.
 
         :meta public:
         """
-        self._log = SimLog("cocotb.%s" % self._name)
+        if self._path_str is None:
+            self._path_str = self._name
+        return self._path_str
+
+    @property
+    def _log(self):
         """The logging object."""
-        self._log.debug("Created")
-        self._def_name = self._handle.get_definition_name()  # type: str
+        if self._handle_log is None:
+            self._handle_log = SimLog("cocotb.%s" % self._name)
+        return self._handle_log
+
+    @_log.setter
+    def _log(self, log):
+        self._handle_log = log
+
+    @property
+    def _def_name(self) -> str:
         """The name of a GPI object's definition.
 
         This is the value of ``vpiDefName`` for VPI, ``vhpiNameP`` for VHPI,
@@ -125,7 +200,12 @@ class SimHandleBase:
 
         :meta public:
         """
-        self._def_file = self._handle.get_definition_file()  # type: str
+        if self._def_name_str is None:
+            self._def_name_str = self._handle.get_definition_name()
+        return self._def_name_str
+
+    @property
+    def _def_file(self) -> str:
         """The name of the file that sources the object's definition.
 
         This is the value of ``vpiDefFile`` for VPI, ``vhpiFileNameP`` for VHPI,
@@ -134,6 +214,9 @@ class SimHandleBase:
 
         :meta public:
         """
+        if self._def_file_str is None:
+            self._def_file_str = self._handle.get_definition_file()
+        return self._def_file_str
 
     def get_definition_name(self):
         return self._def_name
@@ -209,6 +292,7 @@ class RegionObject(SimHandleBase):
 
     Region objects don't have values, they are effectively scopes or namespaces.
     """
+    __slots__ = ("_discovered",)
 
     def __init__(self, handle, path):
         SimHandleBase.__init__(self, handle, path)
@@ -221,15 +305,15 @@ class RegionObject(SimHandleBase):
 
         for name, handle in self._sub_handles.items():
             if isinstance(handle, list):
-                self._log.debug("Found index list length %d", len(handle))
+                self._class_log.debug("Found index list length %d", len(handle))
                 for subindex, subhdl in enumerate(handle):
                     if subhdl is None:
-                        self._log.warning("Index %d doesn't exist in %s.%s", subindex, self._name, name)
+                        self._class_log.warning("Index %d doesn't exist in %s.%s", subindex, self._name, name)
                         continue
-                    self._log.debug("Yielding index %d from %s (%s)", subindex, name, type(subhdl))
+                    self._class_log.debug("Yielding index %d from %s (%s)", subindex, name, type(subhdl))
                     yield subhdl
             else:
-                self._log.debug("Yielding %s of type %s (%s)", name, type(handle), handle._path)
+                self._class_log.debug("Yielding %s of type %s (%s)", name, type(handle), handle._path)
                 yield handle
 
     def _discover_all(self):
@@ -240,26 +324,52 @@ class RegionObject(SimHandleBase):
         """
         if self._discovered:
             return
-        self._log.debug("Discovering all on %s", self._name)
+        if _hierarchy_cache is not None and self._discover_from_cache():
+            return
+        self._class_log.debug("Discovering all on %s", self._name)
         for thing in self._handle.iterate(simulator.OBJECTS):
             name = thing.get_name_string()
             path = self._child_path(name)
             try:
                 hdl = SimHandle(thing, path)
             except NotImplementedError as e:
-                self._log.debug("%s", e)
+                self._class_log.debug("%s", e)
                 continue
 
             try:
                 key = self._sub_handle_key(name)
             except ValueError:
-                self._log.debug("Unable to translate handle >%s< to a valid _sub_handle key", hdl._name)
+                self._class_log.debug("Unable to translate handle >%s< to a valid _sub_handle key", hdl._name)
                 continue
 
             self._sub_handles[key] = hdl
 
         self._discovered = True
 
+        if _hierarchy_cache is not None:
+            _hierarchy_cache.add_region(self._path, [
+                _cache_entry(key, hdl) for key, hdl in self._sub_handles.items()
+                if isinstance(hdl, SimHandleBase)
+            ])
+
+    def _discover_from_cache(self) -> bool:
+        """Populate the :any:`_sub_handles` mapping from the hierarchy cache.
+
+        The children are created without calling into the simulator, their
+        GPI handles are only looked up when they are first used.
+        Return ``False`` if this region is not in the cache.
+        """
+        entries = _hierarchy_cache.children(self._path)
+        if entries is None:
+            return False
+        self._class_log.debug("Discovering all on %s from the hierarchy cache", self._path)
+        for entry in entries:
+            key = entry[0]
+            if key not in self._sub_handles:
+                self._sub_handles[key] = _handle_from_cache(self, entry)
+        self._discovered = True
+        return True
+
     def _child_path(self, name) -> str:
         """Return a string of the path of the child :any:`SimHandle` for a given *name*."""
         return self._path + "." + name
@@ -276,6 +386,7 @@ class RegionObject(SimHandleBase):
 
 class HierarchyObject(RegionObject):
     """Hierarchy objects are namespace/scope objects."""
+    __slots__ = ()
 
     def __get_sub_handle_by_name(self, name):
         try:
@@ -285,12 +396,21 @@ class HierarchyObject(RegionObject):
 
         # Cache to avoid a call to the simulator if we already know the name is
         # invalid. Unclear if we care, but we had this before.
-        if name in self._invalid_sub_handles:
+        if self._invalid_sub_handles is not None and name in self._invalid_sub_handles:
             return None
 
+        if _hierarchy_cache is not None and not self._discovered and self._discover_from_cache():
+            try:
+                return self._sub_handles[name]
+            except KeyError:
+                # Not every object is found by iterating, so ask the simulator
+                pass
+
         new_handle = self._handle.get_handle_by_name(name)
 
         if not new_handle:
+            if self._invalid_sub_handles is None:
+                self._invalid_sub_handles = set()
             self._invalid_sub_handles.add(name)
             return None
 
@@ -339,6 +459,64 @@ class HierarchyObject(RegionObject):
 
         raise AttributeError("%s contains no object named %s" % (self._name, name))
 
+    def _resolve_many(self, paths):
+        """Return the handles of the objects at several *paths* below this object.
+
+        A path consists of names and indices, such as ``"a.b[3].c"``.
+        The handles are returned in the order of *paths*, with ``None`` for the
+        objects which do not exist.
+
+        This is equivalent to ``getattr``/``[]`` on each component of each path,
+        and the handles are cached in the same way, but all the handles which are
+        not known yet are looked up with a single call into the simulator.
+
+        :meta public:
+
+        .. versionadded:: 1.5
+        """
+        # The lookups of the simulator call are (parent, key) pairs, where the
+        # parent is a GPI handle or the position of an earlier lookup.
+        lookups = []
+        lookup_parents = []  # SimHandleBase or position of the parent lookup, per lookup
+        lookup_positions = {}  # (parent, key) -> position in lookups
+        targets = []  # per path, SimHandleBase or None, or the position of its lookup
+
+        for path in paths:
+            node = self
+            for key in _split_path(path):
+                if node is None:
+                    break
+                if not isinstance(node, int):
+                    child = _known_child(node, key)
+                    if child is not _UNSET:
+                        node = child
+                        continue
+                # Handles are keyed by identity, as comparing signals reads their values
+                lookup_key = (node if isinstance(node, int) else ("handle", id(node)), key)
+                position = lookup_positions.get(lookup_key)
+                if position is None:
+                    position = lookup_positions[lookup_key] = len(lookups)
+                    lookups.append((node if isinstance(node, int) else _gpi_handle(node), key))
+                    lookup_parents.append(node)
+                node = position
+            targets.append(node)
+
+        if not lookups:
+            return targets
+
+        # Create the handles in the order of the lookups, which comes after the
+        # lookups of their parents
+        found = []
+        for (_, key), parent, new_handle in zip(lookups, lookup_parents, simulator.get_handles(lookups)):
+            if isinstance(parent, int):
+                parent = found[parent]
+            child = None if parent is None else _known_child(parent, key)
+            if child is _UNSET:
+                child = _add_child(parent, key, new_handle)
+            found.append(child)
+
+        return [found[t] if isinstance(t, int) else t for t in targets]
+
     def _id(self, name, extended: bool = True):
         """Query the simulator for an object with the specified *name*,
         and cache the result to build a tree of objects.
@@ -360,6 +538,7 @@ class HierarchyObject(RegionObject):
 
 class HierarchyArrayObject(RegionObject):
     """Hierarchy Arrays are containers of Hierarchy Objects."""
+    __slots__ = ()
 
     def _sub_handle_key(self, name):
         """Translate the handle name to a key to use in :any:`_sub_handles` dictionary."""
@@ -394,6 +573,9 @@ class HierarchyArrayObject(RegionObject):
             raise IndexError("Slice indexing is not supported")
         if index in self._sub_handles:
             return self._sub_handles[index]
+        if _hierarchy_cache is not None and not self._discovered and self._discover_from_cache():
+            if index in self._sub_handles:
+                return self._sub_handles[index]
         new_handle = self._handle.get_handle_by_index(index)
         if not new_handle:
             raise IndexError("%s contains no object at index %d" % (self._name, index))
@@ -431,6 +613,7 @@ class _AssignmentResult:
 
 class NonHierarchyObject(SimHandleBase):
     """Common base class for all non-hierarchy objects."""
+    __slots__ = ()
 
     def __iter__(self):
         return iter(())
@@ -504,6 +687,7 @@ class ConstantObject(NonHierarchyObject):
     The value is cached in the class since it is fixed at elaboration
     time and won't change within a simulation.
     """
+    __slots__ = ("_handle_type", "_value")
 
     def __init__(self, handle, path, handle_type):
         """
@@ -515,19 +699,8 @@ class ConstantObject(NonHierarchyObject):
                 ``simulator.REAL``, ``simulator.STRING``).
         """
         NonHierarchyObject.__init__(self, handle, path)
-        if handle_type in [simulator.INTEGER, simulator.ENUM]:
-            self._value = self._handle.get_signal_val_long()
-        elif handle_type == simulator.REAL:
-            self._value = self._handle.get_signal_val_real()
-        elif handle_type == simulator.STRING:
-            self._value = self._handle.get_signal_val_str()
-        else:
-            val = self._handle.get_signal_val_binstr()
-            self._value = BinaryValue(n_bits=len(val))
-            try:
-                self._value.binstr = val
-            except Exception:
-                self._value = val
+        self._handle_type = handle_type
+        self._value = _UNSET
 
     def __int__(self):
         return int(self.value)
@@ -538,6 +711,21 @@ class ConstantObject(NonHierarchyObject):
     @NonHierarchyObject.value.getter
     def value(self):
         """The value of this simulation object."""
+        if self._value is _UNSET:
+            handle_type = self._handle_type
+            if handle_type in [simulator.INTEGER, simulator.ENUM]:
+                self._value = self._handle.get_signal_val_long()
+            elif handle_type == simulator.REAL:
+                self._value = self._handle.get_signal_val_real()
+            elif handle_type == simulator.STRING:
+                self._value = self._handle.get_signal_val_str()
+            else:
+                val = self._handle.get_signal_val_binstr()
+                self._value = BinaryValue(n_bits=len(val))
+                try:
+                    self._value.binstr = val
+                except Exception:
+                    self._value = val
         return self._value
 
     def __str__(self):
@@ -573,10 +761,18 @@ class NonHierarchyIndexableObject(NonHierarchyObject):
         - **Wrong**: ``dut.some_array.value[0] = 1`` (gets value as a list then updates index 0)
         - **Correct**: ``dut.some_array[0].value = 1``
     """
+    __slots__ = ("_range_val",)
 
     def __init__(self, handle, path):
         NonHierarchyObject.__init__(self, handle, path)
-        self._range = self._handle.get_range()
+        self._range_val = _UNSET
+
+    @property
+    def _range(self):
+        """The left and right index of the object, or ``None`` if it is not indexable."""
+        if self._range_val is _UNSET:
+            self._range_val = self._handle.get_range()
+        return self._range_val
 
     def __setitem__(self, index, value):
         """Provide transparent assignment to indexed array handles."""
@@ -600,7 +796,7 @@ class NonHierarchyIndexableObject(NonHierarchyObject):
         if self._range is None:
             return
 
-        self._log.debug("Iterating with range [%d:%d]", self._range[0], self._range[1])
+        self._class_log.debug("Iterating with range [%d:%d]", self._range[0], self._range[1])
         for i in self._range_iter(self._range[0], self._range[1]):
             try:
                 result = self[i]
@@ -643,6 +839,7 @@ class NonHierarchyIndexableObject(NonHierarchyObject):
 
 class NonConstantObject(NonHierarchyIndexableObject):
     """ A non-constant object"""
+    __slots__ = ()
     # FIXME: what is the difference to ModifiableObject? Explain in docstring.
 
     def drivers(self):
@@ -705,6 +902,7 @@ class Release(_SetAction):
 
 class ModifiableObject(NonConstantObject):
     """Base class for simulator objects whose values can be modified."""
+    __slots__ = ()
 
     def _set_value(self, value, call_sim):
         """Set the value of the underlying simulation object to *value*.
@@ -713,7 +911,7 @@ class ModifiableObject(NonConstantObject):
         object, e.g. net, signal or variable.
 
         We determine the library call to make based on the type of the value
-        because assigning integers less than 32 bits is faster.
+        because assigning integers is faster than assigning binary strings.
 
         Args:
             value (cocotb.binary.BinaryValue, int):
@@ -739,10 +937,11 @@ class ModifiableObject(NonConstantObject):
                     call_sim(self, self._handle.set_signal_val_int, set_action, value)
                     return
 
+                # Wider values are passed to the simulator as unsigned integers
                 if value < 0:
-                    value = BinaryValue(value=value, n_bits=len(self), bigEndian=False, binaryRepresentation=BinaryRepresentation.TWOS_COMPLEMENT)
-                else:
-                    value = BinaryValue(value=value, n_bits=len(self), bigEndian=False, binaryRepresentation=BinaryRepresentation.UNSIGNED)
+                    value += 1 << len(self)
+                call_sim(self, self._handle.set_signal_val_vector, set_action, value)
+                return
             else:
                 raise OverflowError(
                     "Int value ({!r}) out of range for assignment of {!r}-bit signal ({!r})"
@@ -781,7 +980,37 @@ class ModifiableObject(NonConstantObject):
 
     @NonConstantObject.value.getter
     def value(self) -> BinaryValue:
-        binstr = self._handle.get_signal_val_binstr()
+        value, unknown, n_bits = self._handle.get_signal_val_vector()
+        if unknown:
+            # Only the binary string distinguishes between X, Z and the other states
+            return self._value_from_binstr(self._handle.get_signal_val_binstr())
+        result = BinaryValue(n_bits=n_bits)
+        result._set_trusted_int(value)
+        return result
+
+    @property
+    def value_int(self) -> int:
+        """The value of the signal as an unsigned integer.
+
+        This is faster than ``int(handle.value)``, especially for wide signals,
+        as the value is read from the simulator as an integer
+        instead of as a :class:`~cocotb.binary.BinaryValue`.
+
+        Raises:
+            ValueError: If any bit of the value is not ``0`` or ``1``.
+
+        .. versionadded:: 1.5
+        """
+        value, unknown, _ = self._handle.get_signal_val_vector()
+        if unknown:
+            raise ValueError(
+                "Value of {} is not a resolvable integer, unknown bits: {:#x}"
+                .format(self._path, unknown))
+        return value
+
+    @staticmethod
+    def _value_from_binstr(binstr):
+        """Build the :attr:`value` of a signal from its binary string as read from the simulator."""
         # Skip BinaryValue.assign() as we know we are using a binstr
         result = BinaryValue(n_bits=len(binstr))
         # Skip the permitted characters check as we trust the simulator
@@ -805,6 +1034,7 @@ class ModifiableObject(NonConstantObject):
 
 class RealObject(ModifiableObject):
     """Specific object handle for Real signals and variables."""
+    __slots__ = ()
 
     def _set_value(self, value, call_sim):
         """Set the value of the underlying simulation object to value.
@@ -840,6 +1070,7 @@ class RealObject(ModifiableObject):
 
 class EnumObject(ModifiableObject):
     """Specific object handle for enumeration signals and variables."""
+    __slots__ = ()
 
     def _set_value(self, value, call_sim):
         """Set the value of the underlying simulation object to *value*.
@@ -878,6 +1109,7 @@ class EnumObject(ModifiableObject):
 
 class IntegerObject(ModifiableObject):
     """Specific object handle for Integer and Enum signals and variables."""
+    __slots__ = ()
 
     def _set_value(self, value, call_sim):
         """Set the value of the underlying simulation object to *value*.
@@ -919,6 +1151,7 @@ class IntegerObject(ModifiableObject):
 
 class StringObject(ModifiableObject):
     """Specific object handle for String variables."""
+    __slots__ = ()
 
     def _set_value(self, value, call_sim):
         """Set the value of the underlying simulation object to *value*.
@@ -973,6 +1206,22 @@ class StringObject(ModifiableObject):
 
 _handle2obj = {}
 
+# The _CachedGpiHandle objects by path, whose objects are not in _handle2obj yet
+_unresolved = {}
+
+_type2cls = {
+    simulator.MODULE:      HierarchyObject,
+    simulator.STRUCTURE:   HierarchyObject,
+    simulator.REG:         ModifiableObject,
+    simulator.NET:         ModifiableObject,
+    simulator.NETARRAY:    NonHierarchyIndexableObject,
+    simulator.REAL:        RealObject,
+    simulator.INTEGER:     IntegerObject,
+    simulator.ENUM:        EnumObject,
+    simulator.STRING:      StringObject,
+    simulator.GENARRAY:    HierarchyArrayObject,
+}
+
 
 def SimHandle(handle, path=None):
     """Factory function to create the correct type of `SimHandle` object.
@@ -987,27 +1236,23 @@ def SimHandle(handle, path=None):
     Raises:
         NotImplementedError: If no matching object for GPI type could be found.
     """
-    _type2cls = {
-        simulator.MODULE:      HierarchyObject,
-        simulator.STRUCTURE:   HierarchyObject,
-        simulator.REG:         ModifiableObject,
-        simulator.NET:         ModifiableObject,
-        simulator.NETARRAY:    NonHierarchyIndexableObject,
-        simulator.REAL:        RealObject,
-        simulator.INTEGER:     IntegerObject,
-        simulator.ENUM:        EnumObject,
-        simulator.STRING:      StringObject,
-        simulator.GENARRAY:    HierarchyArrayObject,
-    }
-
     # Enforce singletons since it's possible to retrieve handles avoiding
     # the hierarchy by getting driver/load information
-    global _handle2obj
     try:
         return _handle2obj[handle]
     except KeyError:
         pass
 
+    # The object may already have been created from the hierarchy cache
+    if _unresolved and path is not None:
+        proxy = _unresolved.get(path)
+        if proxy is not None:
+            proxy._resolve()
+            try:
+                return _handle2obj[handle]
+            except KeyError:
+                pass
+
     t = handle.get_type()
 
     # Special case for constants
@@ -1026,3 +1271,166 @@ def SimHandle(handle, path=None):
     obj = _type2cls[t](handle, path)
     _handle2obj[handle] = obj
     return obj
+
+
+class _CachedGpiHandle:
+    """Stands in for the GPI handle of an object created from the hierarchy cache.
+
+    The real handle is looked up in the simulator, and checked against the
+    cache, the first time it is used. It then replaces this object in the
+    :class:`SimHandleBase` which owns it.
+    """
+    __slots__ = ("_owner", "_parent", "_key", "_gpi_type")
+
+    def __init__(self, parent, key, gpi_type):
+        self._owner = None
+        self._parent = parent
+        self._key = key
+        self._gpi_type = gpi_type
+
+    def _resolve(self):
+        owner = self._owner
+        if owner._handle is not self:
+            return owner._handle
+
+        parent = _gpi_handle(self._parent)
+        if isinstance(self._key, int):
+            handle = parent.get_handle_by_index(self._key)
+        else:
+            handle = parent.get_handle_by_name(self._key)
+
+        if not handle:
+            reason = "%s does not exist" % owner._path
+        elif handle.get_type() != self._gpi_type:
+            reason = "%s is of type %s" % (owner._path, handle.get_type_string())
+        elif owner._len is not None and handle.get_num_elems() != owner._len:
+            reason = "%s has %d elements" % (owner._path, handle.get_num_elems())
+        elif isinstance(owner, NonHierarchyIndexableObject) and _range_of(handle) != owner._range_val:
+            reason = "%s has range %s" % (owner._path, _range_of(handle))
+        else:
+            owner._handle = handle
+            _handle2obj.setdefault(handle, owner)
+            _unresolved.pop(owner._path, None)
+            return handle
+
+        _hierarchy_cache.invalidate(reason)
+        raise RuntimeError("The hierarchy cache %s was out of date (%s) and has been removed, "
+                           "run the simulation again" % (_hierarchy_cache.filename, reason))
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __hash__(self):
+        return hash(self._resolve())
+
+    def __eq__(self, other):
+        return self._resolve() == other
+
+    def __ne__(self, other):
+        return self._resolve() != other
+
+
+def _gpi_handle(hdl):
+    """Return the GPI handle of *hdl*, which is looked up first if it came from the hierarchy cache.
+
+    This must be used where the handle is passed to a :mod:`cocotb.simulator` function.
+    """
+    handle = hdl._handle
+    if type(handle) is _CachedGpiHandle:
+        handle = handle._resolve()
+    return handle
+
+
+def _range_of(handle):
+    """Return the range of the GPI *handle* in the form it is stored in the hierarchy cache."""
+    rng = handle.get_range()
+    return tuple(rng) if rng is not None else None
+
+
+def _handle_from_cache(parent, entry):
+    """Create the child of *parent* described by the hierarchy cache *entry*."""
+    key, name, type_str, gpi_type, is_const, length, rng = entry
+    proxy = _CachedGpiHandle(parent, key, gpi_type)
+    path = parent._child_path(name)
+    _unresolved[path] = proxy
+    if is_const:
+        obj = ConstantObject(proxy, path, gpi_type)
+    else:
+        obj = _type2cls[gpi_type](proxy, path)
+    proxy._owner = obj
+
+    obj._name_str = name
+    obj._type_str = type_str
+    obj._len = length
+    if isinstance(obj, NonHierarchyIndexableObject):
+        obj._range_val = tuple(rng) if rng is not None else None
+    return obj
+
+
+def _cache_entry(key, hdl):
+    """Describe *hdl*, the child *key* of a region, for the hierarchy cache."""
+    length = rng = None
+    if isinstance(hdl, NonHierarchyObject):
+        length = len(hdl)
+    if isinstance(hdl, NonHierarchyIndexableObject):
+        rng = hdl._range
+    is_const = isinstance(hdl, ConstantObject)
+    return [key, hdl._name, hdl._type, hdl._handle.get_type(), is_const, length, rng]
+
+
+def _split_path(path):
+    """Split *path* into a list of names and indices."""
+    keys = []
+    pos = 0
+    while pos < len(path):
+        match = _path_component_re.match(path, pos)
+        if match is None:
+            raise ValueError("Invalid path %r" % path)
+        name, index = match.groups()
+        keys.append(name if name is not None else int(index))
+        pos = match.end()
+    return keys
+
+
+def _known_child(node, key):
+    """Return the child *key* of *node* if it is known without asking the simulator.
+
+    That is the child handle, ``None`` if it cannot exist, and ``_UNSET`` if
+    the simulator has to be asked.
+    """
+    if isinstance(key, str):
+        if not isinstance(node, HierarchyObject):
+            return None
+        if node._invalid_sub_handles is not None and key in node._invalid_sub_handles:
+            return None
+    elif isinstance(node, NonHierarchyIndexableObject):
+        if node._range is None:
+            return None
+    elif not isinstance(node, HierarchyArrayObject):
+        return None
+
+    try:
+        return node._sub_handles[key]
+    except KeyError:
+        pass
+    if _hierarchy_cache is not None and isinstance(node, RegionObject) and not node._discovered:
+        if node._discover_from_cache() and key in node._sub_handles:
+            return node._sub_handles[key]
+    return _UNSET
+
+
+def _add_child(parent, key, new_handle):
+    """Cache the result of looking up the child *key* of *parent*, and return its handle."""
+    if not new_handle:
+        if isinstance(key, str):
+            if parent._invalid_sub_handles is None:
+                parent._invalid_sub_handles = set()
+            parent._invalid_sub_handles.add(key)
+        return None
+
+    if isinstance(key, str):
+        path = parent._child_path(key)
+    else:
+        path = parent._path + "[" + str(key) + "]"
+    child = parent._sub_handles[key] = SimHandle(new_handle, path)
+    return child
@@ -29,13 +29,18 @@
 Everything related to logging
 """
 
+import gzip
+import io
 import os
+import queue
 import sys
 import logging
+import threading
 import warnings
+from functools import lru_cache
 
 from cocotb.utils import (
-    get_sim_time, get_time_from_sim_steps, want_color_output
+    get_time_from_sim_steps, want_color_output, _get_sim_time_cached
 )
 
 import cocotb.ANSI as ANSI
@@ -52,6 +57,11 @@ _FILENAME_CHARS = 20  # noqa
 _LINENO_CHARS   = 4  # noqa
 _FUNCNAME_CHARS = 31  # noqa
 
+# Record prefixes: the simulation time, the level and, unless the reduced
+# format is used, the logger name and source location
+_REDUCED_TEMPLATE = "{} {} "
+_FULL_TEMPLATE = "{} {} {}"
+
 # Default log level if not overwritten by the user.
 _COCOTB_LOG_LEVEL_DEFAULT = "INFO"
 
@@ -68,6 +78,10 @@ def default_config():
     The logging level for cocotb logs is set based on the
     :envvar:`COCOTB_LOG_LEVEL` environment variable, which defaults to ``INFO``.
 
+    If :envvar:`COCOTB_LOG_FILE` or :envvar:`COCOTB_LOG_ASYNC` is set, the
+    log output is written from a background thread by a
+    :class:`SimAsyncLogHandler`.
+
     If desired, this logging configuration can be overwritten by calling
     ``logging.basicConfig(..., force=True)`` (in Python 3.8 onwards), or by
     manually resetting the root logger instance.
@@ -76,9 +90,16 @@ def default_config():
     .. versionadded:: 1.4
     """
     # construct an appropriate handler
-    hdlr = logging.StreamHandler(sys.stdout)
+    filename = os.getenv("COCOTB_LOG_FILE")
+    if filename:
+        max_bytes = int(os.getenv("COCOTB_LOG_FILE_MAX_SIZE", "0"))
+        hdlr = SimAsyncLogHandler(filename, max_bytes=max_bytes)
+    elif os.getenv("COCOTB_LOG_ASYNC"):
+        hdlr = SimAsyncLogHandler()
+    else:
+        hdlr = logging.StreamHandler(sys.stdout)
     hdlr.addFilter(SimTimeContextFilter())
-    if want_color_output():
+    if filename is None and want_color_output():
         hdlr.setFormatter(SimColourLogFormatter())
     else:
         hdlr.setFormatter(SimLogFormatter())
@@ -156,7 +177,9 @@ class SimTimeContextFilter(logging.Filter):
 
     def filter(self, record):
         try:
-            record.created_sim_time = get_sim_time()
+            # Free while the scheduler is reacting, all the records of one
+            # callback share the time fetched for the first of them
+            record.created_sim_time = _get_sim_time_cached()
         except RecursionError:
             # get_sim_time may try to log - if that happens, we can't
             # attach a simulator time to this message.
@@ -164,6 +187,40 @@ class SimTimeContextFilter(logging.Filter):
         return True
 
 
+def _ljust(string, chars):
+    if len(string) > chars:
+        return ".." + string[(chars - 2) * -1:]
+    return string.ljust(chars)
+
+
+def _rjust(string, chars):
+    if len(string) > chars:
+        return ".." + string[(chars - 2) * -1:]
+    return string.rjust(chars)
+
+
+def _format_sim_time(sim_time):
+    if sim_time is None:
+        return "  -.--ns".rjust(11)
+    time_ns = get_time_from_sim_steps(sim_time, 'ns')
+    return "{:6.2f}ns".format(time_ns).rjust(11)
+
+
+@lru_cache(maxsize=None)
+def _justified_level(levelname):
+    return levelname.ljust(_LEVEL_CHARS)
+
+
+@lru_cache(maxsize=4096)
+def _location(name, filename, lineno, funcName):
+    # A handful of call sites produce almost all records, so the justified
+    # logger name and source location are reused rather than rebuilt
+    return _ljust(name, _RECORD_CHARS) + \
+        _rjust(os.path.split(filename)[1], _FILENAME_CHARS) + \
+        ':' + _ljust(str(lineno), _LINENO_CHARS) + \
+        ' in ' + _ljust(str(funcName), _FUNCNAME_CHARS) + ' '
+
+
 class SimLogFormatter(logging.Formatter):
     """Log formatter to provide consistent log message handling.
 
@@ -172,6 +229,11 @@ class SimLogFormatter(logging.Formatter):
     attached, which cocotb ensures by default.
     """
 
+    # Consecutive records mostly share a time, so the last one is converted
+    # only when it changes
+    _last_sim_time = None
+    _last_sim_time_str = _format_sim_time(None)
+
     # Removes the arguments from the base class. Docstring needed to make
     # sphinx happy.
     def __init__(self):
@@ -179,31 +241,21 @@ class SimLogFormatter(logging.Formatter):
         super().__init__()
 
     # Justify and truncate
-    @staticmethod
-    def ljust(string, chars):
-        if len(string) > chars:
-            return ".." + string[(chars - 2) * -1:]
-        return string.ljust(chars)
-
-    @staticmethod
-    def rjust(string, chars):
-        if len(string) > chars:
-            return ".." + string[(chars - 2) * -1:]
-        return string.rjust(chars)
+    ljust = staticmethod(_ljust)
+    rjust = staticmethod(_rjust)
 
     def _format(self, level, record, msg, coloured=False):
         sim_time = getattr(record, 'created_sim_time', None)
-        if sim_time is None:
-            sim_time_str = "  -.--ns"
+        if sim_time != self._last_sim_time:
+            self._last_sim_time_str = _format_sim_time(sim_time)
+            self._last_sim_time = sim_time
+
+        if _suppress:
+            prefix = _REDUCED_TEMPLATE.format(self._last_sim_time_str, level)
         else:
-            time_ns = get_time_from_sim_steps(sim_time, 'ns')
-            sim_time_str = "{:6.2f}ns".format(time_ns)
-        prefix = sim_time_str.rjust(11) + ' ' + level + ' '
-        if not _suppress:
-            prefix += self.ljust(record.name, _RECORD_CHARS) + \
-                self.rjust(os.path.split(record.filename)[1], _FILENAME_CHARS) + \
-                ':' + self.ljust(str(record.lineno), _LINENO_CHARS) + \
-                ' in ' + self.ljust(str(record.funcName), _FUNCNAME_CHARS) + ' '
+            prefix = _FULL_TEMPLATE.format(
+                self._last_sim_time_str, level,
+                _location(record.name, record.filename, record.lineno, record.funcName))
 
         # these lines are copied from the builtin logger
         if record.exc_info:
@@ -216,6 +268,9 @@ class SimLogFormatter(logging.Formatter):
                 msg = msg + "\n"
             msg = msg + record.exc_text
 
+        if "\n" not in msg:
+            return prefix + msg
+
         prefix_len = len(prefix)
         if coloured:
             prefix_len -= (len(level) - _LEVEL_CHARS)
@@ -226,7 +281,7 @@ class SimLogFormatter(logging.Formatter):
         """Prettify the log output, annotate with simulation time"""
 
         msg = record.getMessage()
-        level = record.levelname.ljust(_LEVEL_CHARS)
+        level = _justified_level(record.levelname)
 
         return self._format(level, record, msg)
 
@@ -246,15 +301,171 @@ class SimColourLogFormatter(SimLogFormatter):
         """Prettify the log output, annotate with simulation time"""
 
         msg = record.getMessage()
+        colour = SimColourLogFormatter.loglevel2colour[record.levelno]
 
         # Need to colour each line in case coloring is applied in the message
-        msg = '\n'.join([SimColourLogFormatter.loglevel2colour[record.levelno] % line for line in msg.split('\n')])
-        level = (SimColourLogFormatter.loglevel2colour[record.levelno] %
-                 record.levelname.ljust(_LEVEL_CHARS))
+        if "\n" in msg:
+            msg = '\n'.join([colour % line for line in msg.split('\n')])
+        else:
+            msg = colour % msg
+        level = _coloured_level(colour, record.levelname)
 
         return self._format(level, record, msg, coloured=True)
 
 
+@lru_cache(maxsize=None)
+def _coloured_level(colour, levelname):
+    return colour % _justified_level(levelname)
+
+
+class SimAsyncLogHandler(logging.Handler):
+    """A handler which formats records straight away, but writes them from a background thread.
+
+    The simulator does not wait for slow terminals or network file systems
+    while the records are written. They are written in order, in batches of
+    everything that was logged since the previous batch.
+
+    :meth:`flush` waits until all the records logged so far are written, it is
+    called by cocotb when the simulator reports a failure and on shutdown.
+
+    Args:
+        filename: The file to write to, or ``None`` for standard output.
+            The file is compressed with gzip if its name ends in ``.gz``.
+        max_bytes: If non-zero, the file is rotated once this many characters
+            of log text are written to it.
+            The rotated files are named like :class:`logging.handlers.RotatingFileHandler`
+            names them, with ``.1`` inserted before a ``.gz`` suffix.
+        backup_count: The number of rotated files to keep.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, filename=None, max_bytes=0, backup_count=5):
+        super().__init__()
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._compressed = filename is not None and filename.endswith(".gz")
+        self._stream = self._open()
+        self._size = 0
+        self._failed = False
+        # Items are the formatted records, flush requests as threading.Events,
+        # and None to stop the writer
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_records, name="cocotb log writer", daemon=True)
+        self._writer.start()
+
+    def _open(self):
+        if self.filename is None:
+            try:
+                # A private, fully buffered copy of stdout, flushed whenever the writer runs out of records
+                return open(os.dup(sys.stdout.fileno()), "w", buffering=1 << 16,
+                            encoding=sys.stdout.encoding, errors=sys.stdout.errors)
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                return sys.stdout
+        if self._compressed:
+            # zlib's default level, the highest one costs far more time for little gain on logs
+            return gzip.open(self.filename, "wt", compresslevel=6)
+        return open(self.filename, "w")
+
+    def _backup_name(self, i):
+        if self._compressed:
+            return "{}.{}.gz".format(self.filename[:-len(".gz")], i)
+        return "{}.{}".format(self.filename, i)
+
+    def _rotate(self):
+        self._stream.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(self._backup_name(i)):
+                os.replace(self._backup_name(i), self._backup_name(i + 1))
+        if self.backup_count > 0:
+            os.replace(self.filename, self._backup_name(1))
+        self._stream = self._open()
+        self._size = 0
+
+    def _write(self, lines):
+        if not lines or self._failed:
+            return
+        text = "\n".join(lines) + "\n"
+        try:
+            if self.max_bytes and self._size and self._size + len(text) > self.max_bytes:
+                self._rotate()
+            self._stream.write(text)
+            self._size += len(text)
+        except Exception as e:
+            # There is nowhere left to log this, and the simulation should carry on
+            self._failed = True
+            print("cocotb: writing the log failed, the rest of it is lost: {!r}".format(e),
+                  file=sys.__stderr__)
+
+    def _flush_stream(self):
+        if not self._failed:
+            try:
+                self._stream.flush()
+            except Exception:
+                pass
+
+    def _write_records(self):
+        idle = object()
+        while True:
+            lines = []
+            item = self._queue.get()
+            # Take everything that is queued already, so it is written in one go
+            try:
+                while isinstance(item, str):
+                    lines.append(item)
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                item = idle
+            self._write(lines)
+
+            if item is idle:
+                # Gzip streams compress worse when flushed often, so they are
+                # only flushed on request
+                if not self._compressed:
+                    self._flush_stream()
+            elif item is None:
+                self._flush_stream()
+                if self._stream is not sys.stdout:
+                    self._stream.close()
+                return
+            else:
+                self._flush_stream()
+                item.set()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._queue.put(msg)
+
+    def flush(self):
+        """Wait until all the records logged so far are written."""
+        if self._writer.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+
+    def close(self):
+        """Write the remaining records and stop the background thread."""
+        self.acquire()
+        try:
+            if self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join()
+        finally:
+            self.release()
+        super().close()
+
+
+def _flush_handlers():
+    """Wait until the records logged so far are written by the handlers of the root logger."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def _filter_from_c(logger_name, level):
     return logging.getLogger(logger_name).isEnabledFor(level)
 
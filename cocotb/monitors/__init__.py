@@ -36,9 +36,11 @@ the transactions.
 from collections import deque
 
 import cocotb
+from cocotb import outcomes
 from cocotb.bus import Bus
-from cocotb.decorators import coroutine
+from cocotb.decorators import coroutine, RunningTask
 from cocotb.log import SimLog
+from cocotb.monitors.recorder import _get_default_recorder
 from cocotb.triggers import Event, Timer, First
 
 
@@ -47,6 +49,48 @@ class MonitorStatistics:
 
     def __init__(self):
         self.received_transactions = 0
+        #: Transactions dropped because the receive queue was full
+        self.dropped_transactions = 0
+        #: The largest number of transactions which were in the receive queue at once
+        self.max_queue_length = 0
+
+
+class MonitorOverflowError(Exception):
+    """Raised by a monitor with ``overflow="raise"`` which receives a transaction while its queue is full.
+
+    .. versionadded:: 1.5
+    """
+
+
+_OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "raise", "block")
+
+
+class _Backpressure:
+    """Runs the coroutine of a monitor, pausing it before each trigger while the receive queue is full."""
+
+    def __init__(self, monitor, coro):
+        self._monitor = monitor
+        self._coro = coro
+
+    def __await__(self):
+        monitor = self._monitor
+        coro = self._coro
+        outcome = outcomes.Value(None)
+        while True:
+            try:
+                trigger = outcome.send(coro)
+            except StopIteration as e:
+                return e.value
+
+            try:
+                while monitor._queue_full():
+                    yield monitor._space_event.wait()
+                outcome = outcomes.Value((yield trigger))
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                outcome = outcomes.Error(e)
 
 
 class Monitor:
@@ -69,24 +113,63 @@ class Monitor:
         event (cocotb.triggers.Event): Event that will be called when a transaction
             is received through the internal :meth:`_recv` method.
             `Event.data` is set to the received transaction.
+        maxlen (int): The number of transactions the queue can hold, unlimited if ``None``.
+        overflow (str): What to do when a transaction is received while the queue is full:
+
+            * ``"drop_oldest"``: remove the oldest transaction from the queue.
+            * ``"drop_newest"``: do not queue the received transaction.
+            * ``"raise"``: raise :exc:`MonitorOverflowError`.
+            * ``"block"``: queue the transaction, but pause the monitor before it
+              awaits its next trigger, until transactions are taken from the queue by
+              iterating over the monitor with :keyword:`async for`.
+
+            Dropped transactions are counted in :attr:`MonitorStatistics.dropped_transactions`.
+
+    Iterating over the monitor with :keyword:`async for` takes the transactions
+    from the queue, waiting for them to arrive when it is empty, until the
+    monitor coroutine ends.
+
+    .. versionchanged:: 1.5
+        Added the *maxlen* and *overflow* arguments, and asynchronous iteration.
     """
 
-    def __init__(self, callback=None, event=None):
+    def __init__(self, callback=None, event=None, maxlen=None, overflow="drop_oldest"):
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of {}, not {!r}".format(
+                ", ".join(repr(p) for p in _OVERFLOW_POLICIES), overflow))
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be at least 1, not {!r}".format(maxlen))
+        self._maxlen = maxlen
+        self._overflow = overflow
         self._event = event
         self._wait_event = Event()
+        self._space_event = Event()
         self._recvQ = deque()
         self._callbacks = []
+        self._recorders = []
         self.stats = MonitorStatistics()
 
         # Sub-classes may already set up logging
         if not hasattr(self, "log"):
             self.log = SimLog("cocotb.monitor.%s" % (type(self).__qualname__))
 
+        recorder = _get_default_recorder()
+        if recorder is not None:
+            self.add_recorder(recorder)
+
         if callback is not None:
             self.add_callback(callback)
 
         # Create an independent coroutine which can receive stuff
-        self._thread = cocotb.scheduler.add(self._monitor_recv())
+        coro = self._monitor_recv()
+        if maxlen is not None and overflow == "block":
+            if isinstance(coro, RunningTask):
+                coro = coro._coro
+            coro = self._monitor_recv_with_backpressure(coro)
+        self._thread = cocotb.scheduler.add(coro)
+
+    async def _monitor_recv_with_backpressure(self, coro):
+        return await _Backpressure(self, coro)
 
     def kill(self):
         """Kill the monitor coroutine."""
@@ -100,6 +183,23 @@ class Monitor:
     def __getitem__(self, idx):
         return self._recvQ[idx]
 
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._recvQ:
+            # Nothing more arrives once the monitor coroutine has ended
+            if not self._thread:
+                raise StopAsyncIteration
+            await First(self._wait_event.wait(), self._thread.join())
+        transaction = self._recvQ.popleft()
+        self._space_event.set()
+        self._space_event.clear()
+        return transaction
+
+    def _queue_full(self):
+        return self._maxlen is not None and len(self._recvQ) >= self._maxlen
+
     def add_callback(self, callback):
         """Add function as a callback.
 
@@ -110,6 +210,19 @@ class Monitor:
                        callback.__qualname__)
         self._callbacks.append(callback)
 
+    def add_recorder(self, recorder):
+        """Record the received transactions with a :class:`~cocotb.monitors.recorder.TransactionRecorder`.
+
+        The transactions are recorded under the name of the logger of the monitor.
+
+        Args:
+            recorder (TransactionRecorder): The recorder to write to.
+
+        .. versionadded:: 1.5
+        """
+        if recorder not in self._recorders:
+            self._recorders.append(recorder)
+
     @coroutine
     async def wait_for_recv(self, timeout=None):
         """With *timeout*, :meth:`.wait` for transaction to arrive on monitor
@@ -147,13 +260,16 @@ class Monitor:
 
         self.stats.received_transactions += 1
 
+        for recorder in self._recorders:
+            recorder.record(self.log.name, transaction)
+
         # either callback based consumer
         for callback in self._callbacks:
             callback(transaction)
 
         # Or queued with a notification
         if not self._callbacks:
-            self._recvQ.append(transaction)
+            self._queue(transaction)
 
         if self._event is not None:
             self._event.set(data=transaction)
@@ -163,6 +279,24 @@ class Monitor:
             self._wait_event.set(data=transaction)
             self._wait_event.clear()
 
+    def _queue(self, transaction):
+        if self._queue_full():
+            if self._overflow == "drop_oldest":
+                self._recvQ.popleft()
+                self.stats.dropped_transactions += 1
+            elif self._overflow == "drop_newest":
+                self.stats.dropped_transactions += 1
+                return
+            elif self._overflow == "raise":
+                raise MonitorOverflowError(
+                    "{} received a transaction while its queue held {} transactions".format(
+                        self.log.name, len(self._recvQ)))
+            # "block" queues it anyway, the monitor pauses before its next trigger
+
+        self._recvQ.append(transaction)
+        if len(self._recvQ) > self.stats.max_queue_length:
+            self.stats.max_queue_length = len(self._recvQ)
+
 
 class BusMonitor(Monitor):
     """Wrapper providing common functionality for monitoring buses."""
@@ -170,7 +304,8 @@ class BusMonitor(Monitor):
     _optional_signals = []
 
     def __init__(self, entity, name, clock, reset=None, reset_n=None,
-                 callback=None, event=None, bus_separator="_", array_idx=None):
+                 callback=None, event=None, bus_separator="_", array_idx=None,
+                 maxlen=None, overflow="drop_oldest"):
         self.log = SimLog("cocotb.%s.%s" % (entity._name, name))
         self.entity = entity
         self.name = name
@@ -180,7 +315,7 @@ class BusMonitor(Monitor):
                        bus_separator=bus_separator, array_idx=array_idx)
         self._reset = reset
         self._reset_n = reset_n
-        Monitor.__init__(self, callback=callback, event=event)
+        Monitor.__init__(self, callback=callback, event=event, maxlen=maxlen, overflow=overflow)
 
     @property
     def in_reset(self):
@@ -0,0 +1,316 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Recording of the transactions received by monitors to a compact binary file.
+
+A file starts with a header::
+
+    magic (8 bytes) | version (u8) | precision (i8) | compression (u8)
+
+followed by blocks, each of which can be decompressed and read on its own::
+
+    stored size (u32) | raw size (u32) | record count (u32) | first time (u64) | last time (u64) | data
+
+The uncompressed data of a block is a sequence of records::
+
+    time (u64) | monitor (u16) | kind (u8) | size (u32) | payload
+
+where *time* is in simulator steps and *monitor* numbers the monitor names in
+the block. A record of kind ``NAME`` gives the name of the next monitor number,
+records of the other kinds hold a transaction.
+All integers are little-endian.
+
+.. versionadded:: 1.5
+"""
+
+import collections
+import os
+import pickle
+import struct
+import zlib
+
+from cocotb.log import SimLog
+from cocotb.utils import _get_log_time_scale, _get_sim_time_cached, _get_simulator_precision
+
+_MAGIC = b"COCOTBTX"
+_VERSION = 1
+
+_header = struct.Struct("<8sBbB")
+_block_header = struct.Struct("<IIIQQ")
+_record_header = struct.Struct("<QHBI")
+
+# Kinds of records
+_NAME = 0
+_BYTES = 1
+_STR = 2
+_PICKLE = 3
+
+_COMPRESSIONS = {None: 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+
+def _codec(compression):
+    """Return the ``(compress, decompress)`` functions of a compression, which are ``None`` without one."""
+    if compression is None:
+        return None, None
+    if compression == "zlib":
+        return zlib.compress, zlib.decompress
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    if compression == "lz4":
+        import lz4.frame
+        return lz4.frame.compress, lz4.frame.decompress
+    raise ValueError("Unknown compression {!r}, expected one of {}".format(
+        compression, ", ".join(repr(c) for c in _COMPRESSIONS)))
+
+
+Transaction = collections.namedtuple("Transaction", ["time", "monitor", "data"])
+Transaction.__doc__ = """A transaction read back by a :class:`TransactionReader`.
+
+The *time* is in simulator steps, *monitor* is the name of the monitor which
+received the transaction and *data* is the transaction itself.
+"""
+
+
+class TransactionRecorder:
+    """Writes the transactions received by monitors to a binary file.
+
+    Records are buffered in memory and written in blocks of about *block_size*
+    bytes, which are compressed when *compression* is given.
+    Transactions which are :class:`bytes` or :class:`str` are stored as they
+    are, others are pickled.
+    Transactions which cannot be pickled are stored as their :func:`repr`,
+    and read back as a :class:`str`; a warning is logged for the first such
+    transaction of each monitor.
+
+    Monitors write to a recorder once it is passed to
+    :meth:`Monitor.add_recorder() <cocotb.monitors.Monitor.add_recorder>`,
+    or to the recorder given by :envvar:`COCOTB_TRANSACTION_LOG`.
+
+    Args:
+        filename: The file to write. It is replaced if it exists.
+        compression: ``None``, ``"zlib"``, or ``"zstd"`` and ``"lz4"``,
+            which need the :mod:`zstandard` and :mod:`lz4` packages.
+        block_size: The uncompressed size of the blocks, in bytes.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, filename, compression=None, block_size=1 << 16):
+        self._compress = _codec(compression)[0]
+        self.filename = filename
+        self.block_size = block_size
+        self.log = SimLog("cocotb.transaction_recorder")
+        # The monitors which were warned about a transaction that cannot be pickled
+        self._unpicklable = set()
+        self._file = open(filename, "wb")
+        self._file.write(_header.pack(_MAGIC, _VERSION, _get_simulator_precision(),
+                                      _COMPRESSIONS[compression]))
+        self._new_block()
+
+    def _new_block(self):
+        self._parts = []
+        self._size = 0
+        self._n_records = 0
+        self._first_time = None
+        self._last_time = 0
+        # Names are numbered per block, so that each block can be read on its own
+        self._monitors = {}
+
+    def record(self, monitor, transaction, time=None):
+        """Record the *transaction* received by the monitor named *monitor*.
+
+        Args:
+            monitor (str): The name of the monitor.
+            transaction: The transaction.
+            time (int): The simulation time in steps, by default the current one.
+        """
+        if time is None:
+            time = _get_sim_time_cached()
+
+        if isinstance(transaction, bytes):
+            kind, payload = _BYTES, transaction
+        elif isinstance(transaction, str):
+            kind, payload = _STR, transaction.encode()
+        else:
+            try:
+                kind, payload = _PICKLE, pickle.dumps(transaction, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                if monitor not in self._unpicklable:
+                    self._unpicklable.add(monitor)
+                    self.log.warning("Recording the transactions of %s which cannot be pickled as their repr(): %s",
+                                     monitor, e)
+                kind, payload = _STR, repr(transaction).encode()
+
+        try:
+            monitor_id = self._monitors[monitor]
+        except KeyError:
+            monitor_id = self._monitors[monitor] = len(self._monitors)
+            name = monitor.encode()
+            self._parts += (_record_header.pack(time, monitor_id, _NAME, len(name)), name)
+            self._size += _record_header.size + len(name)
+
+        self._parts += (_record_header.pack(time, monitor_id, kind, len(payload)), payload)
+        self._size += _record_header.size + len(payload)
+        self._n_records += 1
+        if self._first_time is None:
+            self._first_time = time
+        self._last_time = time
+
+        if self._size >= self.block_size:
+            self._write_block()
+
+    def _write_block(self):
+        if not self._n_records:
+            return
+        data = b"".join(self._parts)
+        stored = data if self._compress is None else self._compress(data)
+        self._file.write(_block_header.pack(len(stored), len(data), self._n_records,
+                                            self._first_time, self._last_time))
+        self._file.write(stored)
+        self._new_block()
+
+    def flush(self):
+        """Write the transactions recorded so far to the file."""
+        self._write_block()
+        self._file.flush()
+
+    def close(self):
+        """Write the remaining transactions and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TransactionReader:
+    """Reads the transactions written by a :class:`TransactionRecorder`.
+
+    Iterating over the reader yields all the :class:`Transaction`\\ s in the file,
+    :meth:`transactions` can skip to a time without decompressing the blocks before it.
+    A block which was cut short, because the simulation did not finish, ends the file.
+
+    Args:
+        filename: The file to read.
+
+    .. versionadded:: 1.5
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, "rb")
+        header = self._file.read(_header.size)
+        if len(header) < _header.size:
+            raise ValueError("{} is not a transaction log".format(filename))
+        magic, version, self.precision, compression_id = _header.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError("{} is not a transaction log".format(filename))
+        if version != _VERSION:
+            raise ValueError("{} has unsupported version {}".format(filename, version))
+        compression = {v: k for k, v in _COMPRESSIONS.items()}[compression_id]
+        self.compression = compression
+        self._decompress = _codec(compression)[1]
+
+    def _steps(self, time, units):
+        if time is None or units == "step":
+            return time
+        # Rounded down, so that a transaction at exactly the time is not missed
+        return int(time * 10 ** (_get_log_time_scale(units) - self.precision))
+
+    def _blocks(self):
+        """Yield the block headers, leaving the file at the start of the data of each block."""
+        self._file.seek(_header.size)
+        while True:
+            header = self._file.read(_block_header.size)
+            if len(header) < _block_header.size:
+                return
+            block = _block_header.unpack(header)
+            start = self._file.tell()
+            yield block
+            self._file.seek(start + block[0])
+
+    def _records(self, stored_size, raw_size):
+        stored = self._file.read(stored_size)
+        if len(stored) < stored_size:
+            return
+        data = stored if self._decompress is None else self._decompress(stored)
+        names = []
+        offset = 0
+        while offset < raw_size:
+            time, monitor_id, kind, size = _record_header.unpack_from(data, offset)
+            offset += _record_header.size
+            payload = data[offset:offset + size]
+            offset += size
+            if kind == _NAME:
+                names.append(payload.decode())
+                continue
+            if kind == _BYTES:
+                transaction = payload
+            elif kind == _STR:
+                transaction = payload.decode()
+            else:
+                transaction = pickle.loads(payload)
+            yield Transaction(time, names[monitor_id], transaction)
+
+    def transactions(self, start=None, end=None, units="step", monitor=None):
+        """Yield the recorded :class:`Transaction`\\ s in order.
+
+        Args:
+            start: Skip the transactions before this time.
+            end: Stop after the transactions at this time.
+            units (str): The units of *start* and *end*, ``"step"`` for simulator steps
+                or one of ``'fs'``, ``'ps'``, ``'ns'``, ``'us'``, ``'ms'``, ``'sec'``.
+            monitor (str): Only yield the transactions of the monitor with this name.
+        """
+        start = self._steps(start, units)
+        end = self._steps(end, units)
+        for stored_size, raw_size, _, first_time, last_time in self._blocks():
+            if start is not None and last_time < start:
+                continue
+            if end is not None and first_time > end:
+                return
+            for transaction in list(self._records(stored_size, raw_size)):
+                if start is not None and transaction.time < start:
+                    continue
+                if end is not None and transaction.time > end:
+                    return
+                if monitor is None or transaction.monitor == monitor:
+                    yield transaction
+
+    def __iter__(self):
+        return self.transactions()
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_default_recorder = None
+
+
+def _get_default_recorder():
+    """Return the recorder given by :envvar:`COCOTB_TRANSACTION_LOG`, or ``None``."""
+    global _default_recorder
+    if _default_recorder is None:
+        filename = os.getenv("COCOTB_TRANSACTION_LOG")
+        if filename:
+            _default_recorder = TransactionRecorder(
+                filename, compression=os.getenv("COCOTB_TRANSACTION_LOG_COMPRESSION") or None)
+    return _default_recorder
+
+
+def _close_default_recorder():
+    if _default_recorder is not None:
+        _default_recorder.close()
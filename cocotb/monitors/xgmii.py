@@ -59,13 +59,15 @@ class XGMII(Monitor):
     """
 
     def __init__(self, signal, clock, interleaved=True, callback=None,
-                 event=None):
+                 event=None, maxlen=None, overflow="drop_oldest"):
         """Args:
             signal (SimHandle): The XGMII data bus.
             clock (SimHandle): The associated clock (assumed to be
                 driven by another coroutine).
             interleaved (bool, optional): Whether control bits are interleaved
                 with the data bytes or not.
+            maxlen (int, optional), overflow (str, optional): The limit of the
+                receive queue, see :class:`~cocotb.monitors.Monitor`.
 
         If interleaved the bus is
             byte0, byte0_control, byte1, byte1_control, ...
@@ -78,7 +80,7 @@ class XGMII(Monitor):
         self.signal = signal
         self.bytes = len(self.signal) // 9
         self.interleaved = interleaved
-        Monitor.__init__(self, callback=callback, event=event)
+        Monitor.__init__(self, callback=callback, event=event, maxlen=maxlen, overflow=overflow)
 
     def _get_bytes(self):
         """Take a value and extract the individual bytes and control bits.
@@ -38,13 +38,14 @@ from typing import Any, Optional, Tuple, Iterable
 
 import cocotb
 import cocotb.ANSI as ANSI
-from cocotb.log import SimLog
+from cocotb.log import SimLog, _flush_handlers
 from cocotb.result import TestSuccess, SimFailure
 from cocotb.utils import get_sim_time, remove_traceback_frames, want_color_output
 from cocotb.xunit_reporter import XUnitReporter
 from cocotb.decorators import test as Test, hook as Hook, RunningTask
 from cocotb.outcomes import Outcome, Error
 from cocotb.handle import SimHandle
+from cocotb._scheduler_stats import write_report
 
 from cocotb import simulator
 
@@ -110,6 +111,12 @@ class RegressionManager:
 
         self.xunit.add_property(name="random_seed", value=str(cocotb.RANDOM_SEED))
 
+        # Setup scheduler statistics
+        ####################
+
+        self._stats_filename = os.getenv('COCOTB_SCHEDULER_STATS')
+        self._stats_reports = []
+
         # Setup Coverage
         ####################
 
@@ -260,6 +267,12 @@ class RegressionManager:
 
         # Generate output reports
         self.xunit.write()
+        if cocotb.handle._hierarchy_cache is not None:
+            cocotb.handle._hierarchy_cache.save()
+        # Transactions can only have been recorded if monitors were imported
+        recorder = sys.modules.get("cocotb.monitors.recorder")
+        if recorder is not None:
+            recorder._close_default_recorder()
         if self._cov:
             self._cov.stop()
             self.log.info("Writing coverage data")
@@ -271,6 +284,7 @@ class RegressionManager:
             cocotb._library_coverage.save()
 
         # Setup simulator finalization
+        _flush_handlers()
         simulator.stop_simulator()
 
     def next_test(self) -> Optional[Test]:
@@ -296,6 +310,8 @@ class RegressionManager:
         # stop capturing log output
         cocotb.log.removeHandler(test.handler)
 
+        self._report_scheduler_stats()
+
         self._record_result(
             test=self._test,
             outcome=self._test_task._outcome,
@@ -304,6 +320,20 @@ class RegressionManager:
 
         self.execute()
 
+    def _report_scheduler_stats(self) -> None:
+        """Add the scheduler counters of the current test to the statistics report."""
+        # the scheduler only collects statistics if COCOTB_SCHEDULER_STATS names a file
+        stats = cocotb.scheduler._stats
+        if stats is None:
+            return
+
+        test_name = '.'.join([self._test.__module__, self._test.__qualname__])
+        self._stats_reports.append(stats.report(test_name))
+        stats.reset()
+
+        # rewritten after every test, so a crashing simulator keeps the earlier results
+        write_report(self._stats_filename, self._stats_reports)
+
     def _init_test(self, test: Test) -> Optional[RunningTask]:
         """Initialize a test.
 
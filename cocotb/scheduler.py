@@ -33,14 +33,15 @@ FIXME: We have a problem here.  If a coroutine schedules a read-only but we
 also have pending writes we have to schedule the ReadWrite callback before
 the ReadOnly (and this is invalid, at least in Modelsim).
 """
-from contextlib import contextmanager
 import os
 import sys
 import logging
 import threading
 import inspect
+import time
 import warnings
 from typing import Any, Union
+from collections import deque
 from collections.abc import Coroutine
 
 import cocotb
@@ -50,8 +51,11 @@ from cocotb.triggers import (Trigger, GPITrigger, Timer, ReadOnly,
                              NextTimeStep, ReadWrite, Event, Join, NullTrigger)
 from cocotb.log import SimLog
 from cocotb.result import TestComplete
-from cocotb.utils import remove_traceback_frames
-from cocotb import outcomes, _py_compat
+from cocotb.utils import (
+    remove_traceback_frames, _freeze_sim_time, _thaw_sim_time, _get_sim_time_cached
+)
+from cocotb import outcomes, _py_compat, simulator
+from cocotb._scheduler_stats import SchedulerStats
 
 
 # Debug mode controlled by environment variables
@@ -61,10 +65,26 @@ if _profiling:
     import pstats
     _profile = cProfile.Profile()
 
+# An empty value disables the statistics, as there is no file to write them to
+_stats = bool(os.getenv("COCOTB_SCHEDULER_STATS"))
+
 # Sadly the Python standard logging module is very slow so it's better not to
 # make any calls by testing a boolean flag first
 _debug = "COCOTB_SCHEDULER_DEBUG" in os.environ
 
+# Used in place of profiling_context, it is reentrant so a single one will do
+_null_context = _py_compat.nullcontext()
+
+# The kind of write passed to simulator.set_signal_values for each of the
+# methods which can be queued with Scheduler._schedule_write
+_write_kinds = {
+    "set_signal_val_int": simulator.SET_INT,
+    "set_signal_val_vector": simulator.SET_VECTOR,
+    "set_signal_val_binstr": simulator.SET_BINSTR,
+    "set_signal_val_str": simulator.SET_STR,
+    "set_signal_val_real": simulator.SET_REAL,
+}
+
 
 class InternalError(RuntimeError):
     """ An error internal to scheduler. If you see this, report a bug! """
@@ -229,6 +249,10 @@ class Scheduler:
         # indexed by trigger
         self._trigger2coros = _py_compat.insertion_ordered_dict()
 
+        # Empty lists of pending coroutines, recycled to avoid allocating a new
+        # list every time a trigger is waited on
+        self._waiter_list_pool = []
+
         # Our main state
         self._mode = Scheduler._MODE_NORMAL
 
@@ -236,10 +260,10 @@ class Scheduler:
         # in a timestep is performed, all the rest are discarded in python.
         self._write_calls = _py_compat.insertion_ordered_dict()
 
-        self._pending_coros = []
-        self._pending_triggers = []
+        self._pending_coros = deque()
+        self._pending_triggers = deque()
         self._pending_threads = []
-        self._pending_events = []   # Events we need to call set on once we've unwound
+        self._pending_events = deque()   # Events we need to call set on once we've unwound
 
         self._terminate = False
         self._test = None
@@ -252,6 +276,9 @@ class Scheduler:
         self._write_coro_inst = None
         self._writes_pending = Event()
 
+        # Counters reported by the regression manager at the end of each test
+        self._stats = SchedulerStats() if _stats else None
+
     async def _do_writes(self):
         """ An internal coroutine that performs pending writes """
         while True:
@@ -261,11 +288,20 @@ class Scheduler:
 
             await self._read_write
 
-            while self._write_calls:
-                handle, (func, args) = self._write_calls.popitem()
-                func(*args)
+            if self._stats is not None:
+                start = time.perf_counter()
+
+            # Apply all the pending writes with a single call into the
+            # simulator, in the order in which they used to be popped.
+            writes = list(self._write_calls.values())
+            writes.reverse()
+            self._write_calls.clear()
+            simulator.set_signal_values(writes)
             self._writes_pending.clear()
 
+            if self._stats is not None:
+                self._stats.writes_flushed(len(writes), time.perf_counter() - start)
+
     def _check_termination(self):
         """
         Handle a termination that causes us to move onto the next test.
@@ -301,7 +337,7 @@ class Scheduler:
             ps.dump_stats("test_profile.pstat")
             ctx = profiling_context()
         else:
-            ctx = _py_compat.nullcontext()
+            ctx = _null_context
 
         with ctx:
             self._mode = Scheduler._MODE_NORMAL
@@ -354,9 +390,15 @@ class Scheduler:
 
         # start the event loop
         self._is_reacting = True
+        # The simulator waits for this callback to return, so the time cannot change
+        _freeze_sim_time()
         try:
+            if self._stats is not None and isinstance(trigger, GPITrigger):
+                self._stats.crossing(_get_sim_time_cached())
+
             self._event_loop(trigger)
         finally:
+            _thaw_sim_time()
             self._is_reacting = False
 
     def _event_loop(self, trigger):
@@ -372,7 +414,7 @@ class Scheduler:
         if _profiling:
             ctx = profiling_context()
         else:
-            ctx = _py_compat.nullcontext()
+            ctx = _null_context
 
         with ctx:
             # When a trigger fires it is unprimed internally
@@ -396,7 +438,10 @@ class Scheduler:
             is_first = True
             self._pending_triggers.append(trigger)
             while self._pending_triggers:
-                trigger = self._pending_triggers.pop(0)
+                trigger = self._pending_triggers.popleft()
+
+                if self._stats is not None:
+                    self._stats.trigger_fired(trigger)
 
                 if not is_first and isinstance(trigger, GPITrigger):
                     self.log.warning(
@@ -443,13 +488,15 @@ class Scheduler:
                 # This trigger isn't needed any more
                 trigger.unprime()
 
+                # The outcome is the same for all the waiting coroutines
+                send_outcome = trigger._outcome
                 for coro in scheduling:
                     if coro._outcome is not None:
                         # coroutine was killed by another coroutine waiting on the same trigger
                         continue
                     if _debug:
                         self.log.debug("Scheduling coroutine %s" % (coro._coro.__qualname__))
-                    self._schedule(coro, trigger=trigger)
+                    self._schedule(coro, trigger=trigger, send_outcome=send_outcome)
                     if _debug:
                         self.log.debug("Scheduled coroutine %s" % (coro._coro.__qualname__))
 
@@ -463,12 +510,17 @@ class Scheduler:
                     if _debug:
                         self.log.debug("Scheduling pending event %s" %
                                        (str(self._pending_events[0])))
-                    self._pending_events.pop(0).set()
+                    self._pending_events.popleft().set()
+
+                # the list is no longer referenced anywhere, so it can be reused
+                scheduling.clear()
+                self._waiter_list_pool.append(scheduling)
 
                 # remove our reference to the objects at the end of each loop,
                 # to try and avoid them being destroyed at a weird time (as
                 # happened in gh-957)
                 del trigger
+                del send_outcome
                 del scheduling
 
             # no more pending triggers
@@ -488,15 +540,19 @@ class Scheduler:
     def _unschedule(self, coro):
         """Unschedule a coroutine.  Unprime any pending triggers"""
 
+        if self._stats is not None:
+            self._stats.task_done(coro)
+
         # Unprime the trigger this coroutine is waiting on
         trigger = coro._trigger
         if trigger is not None:
             coro._trigger = None
-            if coro in self._trigger2coros.setdefault(trigger, []):
-                self._trigger2coros[trigger].remove(coro)
-            if not self._trigger2coros[trigger]:
+            trigger_coros = self._trigger2coros.get(trigger)
+            if trigger_coros is not None and coro in trigger_coros:
+                trigger_coros.remove(coro)
+            if not trigger_coros:
                 trigger.unprime()
-                del self._trigger2coros[trigger]
+                self._trigger2coros.pop(trigger, None)
 
         assert self._test is not None
 
@@ -525,7 +581,12 @@ class Scheduler:
                 self._test.abort(e)
 
     def _schedule_write(self, handle, write_func, *args):
-        """ Queue `write_func` to be called on the next ReadWrite trigger. """
+        """ Queue `write_func` to be called on the next ReadWrite trigger.
+
+        `write_func` must be one of the ``set_signal_val_*`` methods of the
+        :class:`~cocotb.simulator.gpi_sim_hdl` of `handle`, as the writes are
+        applied in bulk through :func:`cocotb.simulator.set_signal_values`.
+        """
         if self._mode == Scheduler._MODE_READONLY:
             raise Exception("Write to object {0} was scheduled during a read-only sync phase.".format(handle._name))
 
@@ -534,14 +595,21 @@ class Scheduler:
         if self._write_coro_inst is None:
             self._write_coro_inst = self.add(self._do_writes())
 
-        self._write_calls[handle] = (write_func, args)
+        self._write_calls[handle] = (write_func.__self__, _write_kinds[write_func.__name__]) + args
         self._writes_pending.set()
 
     def _resume_coro_upon(self, coro, trigger):
         """Schedule `coro` to be resumed when `trigger` fires."""
         coro._trigger = trigger
 
-        trigger_coros = self._trigger2coros.setdefault(trigger, [])
+        trigger_coros = self._trigger2coros.get(trigger)
+        if trigger_coros is None:
+            if self._waiter_list_pool:
+                trigger_coros = self._waiter_list_pool.pop()
+            else:
+                trigger_coros = []
+            self._trigger2coros[trigger] = trigger_coros
+
         if coro is self._write_coro_inst:
             # Our internal write coroutine always runs before any user coroutines.
             # This preserves the behavior prior to the refactoring of writes to
@@ -553,7 +621,7 @@ class Scheduler:
 
         if not trigger.primed:
 
-            if trigger_coros != [coro]:
+            if len(trigger_coros) != 1:
                 # should never happen
                 raise InternalError(
                     "More than one coroutine waiting on an unprimed trigger")
@@ -817,16 +885,6 @@ class Scheduler:
             .format(type(result), result)
         )
 
-    @contextmanager
-    def _task_context(self, task):
-        """Context manager for the currently running task."""
-        old_task = self._current_task
-        self._current_task = task
-        try:
-            yield
-        finally:
-            self._current_task = old_task
-
     def schedule(self, coroutine, trigger=None):
         """
         .. deprecated:: 1.5
@@ -835,26 +893,35 @@ class Scheduler:
         warnings.warn("This function is now private.", DeprecationWarning, stacklevel=2)
         return self._schedule(coroutine, trigger)
 
-    def _schedule(self, coroutine, trigger=None):
+    def _schedule(self, coroutine, trigger=None, send_outcome=None):
         """Schedule a coroutine by calling the send method.
 
         Args:
             coroutine (cocotb.decorators.coroutine): The coroutine to schedule.
             trigger (cocotb.triggers.Trigger): The trigger that caused this
                 coroutine to be scheduled.
+            send_outcome (cocotb.outcomes.Outcome): The outcome of *trigger*,
+                if it is already known.
         """
-        with self._task_context(coroutine):
-            if trigger is None:
-                send_outcome = outcomes.Value(None)
-            else:
-                send_outcome = trigger._outcome
+        # Not a context manager, as this runs for every wake-up of every task
+        old_task = self._current_task
+        self._current_task = coroutine
+        try:
+            if send_outcome is None:
+                if trigger is None:
+                    send_outcome = outcomes.Value(None)
+                else:
+                    send_outcome = trigger._outcome
             if _debug:
                 self.log.debug("Scheduling with {}".format(send_outcome))
 
             coro_completed = False
             try:
                 coroutine._trigger = None
-                result = coroutine._advance(send_outcome)
+                if self._stats is None:
+                    result = coroutine._advance(send_outcome)
+                else:
+                    result = self._advance_with_stats(coroutine, send_outcome)
                 if _debug:
                     self.log.debug("Coroutine %s yielded %s (mode %d)" %
                                    (coroutine._coro.__qualname__, str(result), self._mode))
@@ -906,7 +973,17 @@ class Scheduler:
 
             # Handle any newly queued coroutines that need to be scheduled
             while self._pending_coros:
-                self.add(self._pending_coros.pop(0))
+                self.add(self._pending_coros.popleft())
+        finally:
+            self._current_task = old_task
+
+    def _advance_with_stats(self, coroutine, send_outcome):
+        """Advance `coroutine`, recording the wake-up and the CPU time it took."""
+        start = time.process_time()
+        try:
+            return coroutine._advance(send_outcome)
+        finally:
+            self._stats.task_woken(coroutine, time.process_time() - start)
 
     def finish_test(self, exc):
         """
@@ -82,9 +82,11 @@ we have to create a process with the signal on the sensitivity list to imitate a
     class GpiObjHdl;
     class GpiCbHdl;
     class GpiIterator;
+    class GpiClockHdl;
     typedef GpiObjHdl *gpi_sim_hdl;
     typedef GpiCbHdl *gpi_cb_hdl;
     typedef GpiIterator *gpi_iterator_hdl;
+    typedef GpiClockHdl *gpi_clk_hdl;
 #else
     /* In C, we declare some incomplete struct types that we never complete.
      * The names of these are irrelevant, but for simplicity they match the C++
@@ -93,9 +95,11 @@ we have to create a process with the signal on the sensitivity list to imitate a
     struct GpiObjHdl;
     struct GpiCbHdl;
     struct GpiIterator;
+    struct GpiClockHdl;
     typedef struct GpiObjHdl *gpi_sim_hdl;
     typedef struct GpiCbHdl *gpi_cb_hdl;
     typedef struct GpiIterator *gpi_iterator_hdl;
+    typedef struct GpiClockHdl *gpi_clk_hdl;
 #endif
 
 #ifdef __cplusplus
@@ -192,6 +196,17 @@ GPI_EXPORT gpi_iterator_hdl gpi_iterate(gpi_sim_hdl base, gpi_iterator_sel_t typ
 // Returns NULL when there are no more objects
 GPI_EXPORT gpi_sim_hdl gpi_next(gpi_iterator_hdl iterator);
 
+// Counters of the store that makes object handles unique, for diagnostics
+typedef struct gpi_handle_store_stats_s {
+    uint64_t handles;           // Unique object handles in the store
+    uint64_t duplicates;        // Handles created again and replaced by the stored one
+    uint64_t index_entries;     // Names in the per-parent child name index
+    uint64_t index_hits;        // Lookups by name answered from the index
+    uint64_t index_misses;      // Lookups by name resolved through the implementations
+} gpi_handle_store_stats_t;
+
+GPI_EXPORT void gpi_get_handle_store_stats(gpi_handle_store_stats_t *stats);
+
 // Returns the number of objects in the collection of the handle
 GPI_EXPORT int gpi_get_num_elems(gpi_sim_hdl gpi_sim_hdl);
 
@@ -209,6 +224,10 @@ GPI_EXPORT const char *gpi_get_signal_value_binstr(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT const char *gpi_get_signal_value_str(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT double gpi_get_signal_value_real(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT long gpi_get_signal_value_long(gpi_sim_hdl gpi_hdl);
+// Get the value of a logic vector as n_words 32-bit words, least significant word first.
+// Bits that are not 0 or 1 are set in unknown and cleared in value.
+// Returns the width of the signal in bits, which may need more than n_words words, or -1 on failure.
+GPI_EXPORT int gpi_get_signal_value_vector(gpi_sim_hdl gpi_hdl, uint32_t *value, uint32_t *unknown, size_t n_words);
 GPI_EXPORT const char *gpi_get_signal_name_str(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT const char *gpi_get_signal_type_str(gpi_sim_hdl gpi_hdl);
 
@@ -230,6 +249,7 @@ GPI_EXPORT void gpi_set_signal_value_real(gpi_sim_hdl gpi_hdl, double value, gpi
 GPI_EXPORT void gpi_set_signal_value_int(gpi_sim_hdl gpi_hdl, int32_t value, gpi_set_action_t action);
 GPI_EXPORT void gpi_set_signal_value_binstr(gpi_sim_hdl gpi_hdl, const char *str, gpi_set_action_t action); // String of binary char(s) [1, 0, x, z]
 GPI_EXPORT void gpi_set_signal_value_str(gpi_sim_hdl gpi_hdl, const char *str, gpi_set_action_t action);    // String of ASCII char(s)
+GPI_EXPORT void gpi_set_signal_value_vector(gpi_sim_hdl gpi_hdl, const uint32_t *value, size_t n_words, gpi_set_action_t action); // 32-bit words, least significant first
 
 typedef enum gpi_edge {
     GPI_RISING = 1,
@@ -239,6 +259,7 @@ typedef enum gpi_edge {
 // The callback registering functions
 GPI_EXPORT gpi_cb_hdl gpi_register_timed_callback                  (int (*gpi_function)(const void *), void *gpi_cb_data, uint64_t time_ps);
 GPI_EXPORT gpi_cb_hdl gpi_register_value_change_callback           (int (*gpi_function)(const void *), void *gpi_cb_data, gpi_sim_hdl gpi_hdl, int edge);
+GPI_EXPORT gpi_cb_hdl gpi_register_edge_count_callback             (int (*gpi_function)(const void *), void *gpi_cb_data, gpi_sim_hdl gpi_hdl, int edge, uint64_t count);  // Fires after count edges
 GPI_EXPORT gpi_cb_hdl gpi_register_readonly_callback               (int (*gpi_function)(const void *), void *gpi_cb_data);
 GPI_EXPORT gpi_cb_hdl gpi_register_nexttime_callback               (int (*gpi_function)(const void *), void *gpi_cb_data);
 GPI_EXPORT gpi_cb_hdl gpi_register_readwrite_callback              (int (*gpi_function)(const void *), void *gpi_cb_data);
@@ -251,6 +272,18 @@ GPI_EXPORT void gpi_deregister_callback(gpi_cb_hdl gpi_hdl);
 // of GPI we provide a convenience function to extract the callback data
 GPI_EXPORT void *gpi_get_callback_data(gpi_cb_hdl gpi_hdl);
 
+// Native clock generator
+//
+// The clock drives the signal from recurring timed callbacks without ever
+// calling back up into Python. Times are in simulator steps.
+// A `cycles` count of 0 makes the clock run until it is stopped.
+GPI_EXPORT gpi_clk_hdl gpi_clock_create(gpi_sim_hdl clk_sig);
+GPI_EXPORT int gpi_clock_start(gpi_clk_hdl clk_hdl, uint64_t period, uint64_t high, bool start_high, uint64_t cycles);
+GPI_EXPORT void gpi_clock_stop(gpi_clk_hdl clk_hdl);
+GPI_EXPORT int gpi_clock_set_period(gpi_clk_hdl clk_hdl, uint64_t period, uint64_t high);
+GPI_EXPORT bool gpi_clock_is_running(gpi_clk_hdl clk_hdl);
+GPI_EXPORT void gpi_clock_destroy(gpi_clk_hdl clk_hdl);
+
 // Print out what implementations are registered. Python needs to be loaded for this,
 // Returns the number of libs
 GPI_EXPORT size_t gpi_print_registered_impl(void);
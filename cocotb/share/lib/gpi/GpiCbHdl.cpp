@@ -27,6 +27,8 @@
 ******************************************************************************/
 
 #include "gpi_priv.h"
+#include <algorithm>
+#include <cstring>
 
 const char * GpiObjHdl::get_name_str()
 {
@@ -78,6 +80,69 @@ const std::string & GpiObjHdl::get_name()
     return m_name;
 }
 
+GpiSignalObjHdl::~GpiSignalObjHdl()
+{
+    delete m_edge_fanout;
+}
+
+GpiEdgeFanout *GpiSignalObjHdl::edge_fanout()
+{
+    if (!m_edge_fanout) {
+        m_edge_fanout = new GpiEdgeFanout(this);
+    }
+    return m_edge_fanout;
+}
+
+GpiCbHdl *GpiSignalObjHdl::edge_cb(int edge)
+{
+    return edge_fanout()->register_edge(edge);
+}
+
+GpiCbHdl *GpiSignalObjHdl::edge_count_cb(int edge, uint64_t count)
+{
+    return edge_fanout()->register_edge_count(edge, count);
+}
+
+int GpiSignalObjHdl::get_signal_value_vector(uint32_t *value, uint32_t *unknown, size_t n_words)
+{
+    const char *binstr = get_signal_value_binstr();
+    if (!binstr) {
+        return -1;
+    }
+
+    std::fill(value, value + n_words, 0);
+    std::fill(unknown, unknown + n_words, 0);
+
+    // The last character of the string is the least significant bit
+    size_t n_bits = strlen(binstr);
+    for (size_t bit = 0; bit < n_bits && bit / 32 < n_words; bit++) {
+        uint32_t mask = 1u << (bit % 32);
+        switch (binstr[n_bits - 1 - bit]) {
+            case '0':
+                break;
+            case '1':
+                value[bit / 32] |= mask;
+                break;
+            default:
+                unknown[bit / 32] |= mask;
+        }
+    }
+    return static_cast<int>(n_bits);
+}
+
+int GpiSignalObjHdl::set_signal_value_vector(const uint32_t *value, size_t n_words, gpi_set_action_t action)
+{
+    size_t n_bits = static_cast<size_t>(get_num_elems());
+    std::string binstr(n_bits, '0');
+
+    for (size_t bit = 0; bit < n_bits && bit / 32 < n_words; bit++) {
+        if (value[bit / 32] & (1u << (bit % 32))) {
+            binstr[n_bits - 1 - bit] = '1';
+        }
+    }
+    return set_signal_value_binstr(binstr, action);
+}
+
 /* Genertic base clss implementations */
 bool GpiHdl::is_this_impl(GpiImplInterface *impl)
 {
@@ -176,3 +241,191 @@ int GpiValueCbHdl::run_callback()
 
     return 0;
 }
+
+int GpiEdgeCbHdl::arm_callback()
+{
+    m_remaining = m_count;
+    m_armed_at = m_fanout->m_dispatch_count;
+    m_state = GPI_PRIMED;
+    return 0;
+}
+
+int GpiEdgeCbHdl::cleanup_callback()
+{
+    m_state = GPI_FREE;
+    m_fanout->waiter_removed();
+    return 0;
+}
+
+bool GpiEdgeCbHdl::count_edge(bool rising, bool falling)
+{
+    if (((m_edge & GPI_RISING) && rising) ||
+        ((m_edge & GPI_FALLING) && falling) ||
+        m_edge == (GPI_RISING | GPI_FALLING)) {
+        return --m_remaining == 0;
+    }
+    return false;
+}
+
+static int edge_fanout_callback(const void *fanout)
+{
+    GpiEdgeFanout *fan = const_cast<GpiEdgeFanout*>(static_cast<const GpiEdgeFanout*>(fanout));
+    return fan->dispatch();
+}
+
+GpiEdgeFanout::GpiEdgeFanout(GpiSignalObjHdl *signal) : m_signal(signal)
+{
+    m_waiters.push_back(new GpiEdgeCbHdl(this, signal->m_impl, GPI_RISING));
+    m_waiters.push_back(new GpiEdgeCbHdl(this, signal->m_impl, GPI_FALLING));
+    m_waiters.push_back(new GpiEdgeCbHdl(this, signal->m_impl, GPI_RISING | GPI_FALLING));
+}
+
+GpiEdgeFanout::~GpiEdgeFanout()
+{
+    for (auto waiter : m_waiters) {
+        delete waiter;
+    }
+}
+
+int GpiEdgeFanout::arm_shared()
+{
+    if (m_armed) {
+        return 0;
+    }
+
+    m_value_cb = m_signal->value_change_cb(GPI_RISING | GPI_FALLING);
+    if (!m_value_cb) {
+        return -1;
+    }
+    m_value_cb->set_user_data(edge_fanout_callback, this);
+    m_armed = true;
+    return 0;
+}
+
+GpiCbHdl *GpiEdgeFanout::register_edge(int edge)
+{
+    GpiEdgeCbHdl *waiter;
+
+    if (edge == (GPI_RISING | GPI_FALLING))
+        waiter = m_waiters[EITHER];
+    else if (edge & GPI_RISING)
+        waiter = m_waiters[RISING];
+    else if (edge & GPI_FALLING)
+        waiter = m_waiters[FALLING];
+    else {
+        LOG_ERROR("Invalid edge %d for a value change callback on %s", edge, m_signal->get_name_str());
+        return NULL;
+    }
+
+    if (arm_shared()) {
+        return NULL;
+    }
+
+    waiter->arm_callback();
+    return waiter;
+}
+
+GpiCbHdl *GpiEdgeFanout::register_edge_count(int edge, uint64_t count)
+{
+    if (!(edge & (GPI_RISING | GPI_FALLING))) {
+        LOG_ERROR("Invalid edge %d for an edge count callback on %s", edge, m_signal->get_name_str());
+        return NULL;
+    }
+    if (count == 0) {
+        LOG_ERROR("Edge count callback on %s must wait for at least one edge", m_signal->get_name_str());
+        return NULL;
+    }
+
+    if (arm_shared()) {
+        return NULL;
+    }
+
+    GpiEdgeCbHdl *waiter = NULL;
+    for (size_t i = N_EDGES; i < m_waiters.size(); i++) {
+        if (m_waiters[i]->get_call_state() == GPI_FREE) {
+            waiter = m_waiters[i];
+            break;
+        }
+    }
+    if (!waiter) {
+        waiter = new GpiEdgeCbHdl(this, m_signal->m_impl, edge);
+        m_waiters.push_back(waiter);
+    }
+
+    waiter->set_edge(edge, count);
+    waiter->arm_callback();
+    return waiter;
+}
+
+bool GpiEdgeFanout::any_waiting()
+{
+    for (auto waiter : m_waiters) {
+        if (waiter->get_call_state() == GPI_PRIMED)
+            return true;
+    }
+    return false;
+}
+
+void GpiEdgeFanout::waiter_removed()
+{
+    // While dispatching the shared callback is re-armed or released afterwards
+    if (m_dispatching || !m_armed || any_waiting())
+        return;
+
+    gpi_deregister_callback(m_value_cb);
+    m_armed = false;
+}
+
+int GpiEdgeFanout::dispatch()
+{
+    // Waiters armed from here on wait for the next value change
+    uint64_t now = ++m_dispatch_count;
+    size_t n_waiters = m_waiters.size();
+
+    bool needs_value = false;
+    for (size_t i = 0; i < n_waiters; i++) {
+        GpiEdgeCbHdl *waiter = m_waiters[i];
+        if (waiter->get_call_state() == GPI_PRIMED && waiter->needs_value()) {
+            needs_value = true;
+            break;
+        }
+    }
+
+    bool rising = false;
+    bool falling = false;
+    if (needs_value) {
+        const char *current_value = m_signal->get_signal_value_binstr();
+        rising = strcmp(current_value, "1") == 0;
+        falling = strcmp(current_value, "0") == 0;
+    }
+
+    m_dispatching = true;
+    for (size_t i = 0; i < n_waiters; i++) {
+        GpiEdgeCbHdl *waiter = m_waiters[i];
+
+        // Earlier waiters may have removed or re-armed this one
+        if (waiter->get_call_state() != GPI_PRIMED || waiter->m_armed_at == now)
+            continue;
+
+        if (!waiter->count_edge(rising, falling))
+            continue;
+
+        waiter->set_call_state(GPI_CALL);
+        waiter->run_callback();
+
+        // Waiters fire once unless they were registered again
+        if (waiter->get_call_state() == GPI_CALL)
+            waiter->set_call_state(GPI_FREE);
+    }
+    m_dispatching = false;
+
+    if (any_waiting()) {
+        // Keeps the implementation from cleaning up the shared callback
+        m_value_cb->set_call_state(GPI_PRIMED);
+    } else {
+        // The implementation cleans up the shared callback on return
+        m_armed = false;
+    }
+
+    return 0;
+}
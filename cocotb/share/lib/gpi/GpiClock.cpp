@@ -0,0 +1,86 @@
+// Copyright cocotb contributors
+// Licensed under the Revised BSD License, see LICENSE for details.
+// SPDX-License-Identifier: BSD-3-Clause
+
+#include "gpi_priv.h"
+
+static int clock_timer_callback(const void *clk_hdl)
+{
+    GpiClockHdl *clk = const_cast<GpiClockHdl*>(static_cast<const GpiClockHdl*>(clk_hdl));
+    return clk->toggle();
+}
+
+GpiClockHdl::~GpiClockHdl()
+{
+    stop();
+}
+
+int GpiClockHdl::start(uint64_t period, uint64_t high, bool start_high, uint64_t cycles)
+{
+    if (is_running()) {
+        LOG_ERROR("Clock on %s is already running", m_clk_hdl->get_name_str());
+        return -1;
+    }
+
+    if (set_period(period, high)) {
+        return -1;
+    }
+
+    m_forever = (cycles == 0);
+    m_cycles = cycles;
+    m_start_value = start_high ? 1 : 0;
+    m_value = m_start_value;
+
+    m_clk_hdl->set_signal_value(m_value, GPI_DEPOSIT);
+    return schedule_next();
+}
+
+void GpiClockHdl::stop()
+{
+    if (m_cb_hdl) {
+        gpi_deregister_callback(m_cb_hdl);
+        m_cb_hdl = nullptr;
+    }
+}
+
+int GpiClockHdl::set_period(uint64_t period, uint64_t high)
+{
+    if (high == 0 || high >= period) {
+        LOG_ERROR("Clock high time must be between 0 and the period (got high=%llu, period=%llu)",
+                  (unsigned long long)high, (unsigned long long)period);
+        return -1;
+    }
+    m_period = period;
+    m_high = high;
+    return 0;
+}
+
+int GpiClockHdl::schedule_next()
+{
+    uint64_t delay = m_value ? m_high : m_period - m_high;
+
+    m_cb_hdl = gpi_register_timed_callback(clock_timer_callback, this, delay);
+    if (!m_cb_hdl) {
+        LOG_ERROR("Unable to schedule the next edge of clock %s", m_clk_hdl->get_name_str());
+        return -1;
+    }
+    return 0;
+}
+
+int GpiClockHdl::toggle()
+{
+    // The implementation cleans up the callback that has just fired
+    m_cb_hdl = nullptr;
+
+    m_value = !m_value;
+
+    if (m_value == m_start_value && !m_forever) {
+        // A full cycle has completed
+        if (--m_cycles == 0) {
+            return 0;
+        }
+    }
+
+    m_clk_hdl->set_signal_value(m_value, GPI_DEPOSIT);
+    return schedule_next();
+}
@@ -32,6 +32,7 @@
 #include <sys/types.h>
 #include <vector>
 #include <map>
+#include <unordered_map>
 #include <algorithm>
 #include <string>
 
@@ -44,53 +45,84 @@ static vector<GpiImplInterface*> registered_impls;
 class GpiHandleStore {
 public:
     GpiObjHdl * check_and_store(GpiObjHdl *hdl) {
-        std::map<std::string, GpiObjHdl*>::iterator it;
-
         const std::string &name = hdl->get_fullname();
 
         LOG_DEBUG("Checking %s exists", name.c_str());
 
-        it = handle_map.find(name);
+        auto it = handle_map.find(name);
         if (it == handle_map.end()) {
             handle_map[name] = hdl;
             return hdl;
         } else {
             LOG_DEBUG("Found duplicate %s", name.c_str());
+            m_stats.duplicates++;
 
             delete hdl;
             return it->second;
         }
     }
 
-    uint64_t handle_count() {
-        return handle_map.size();
+    // Child lookups by name, so a name is only resolved through the
+    // implementations once per parent. Misses are remembered too, as the
+    // hierarchy cannot change after elaboration.
+    bool find_child(GpiObjHdl *parent, const std::string &name, GpiObjHdl **hdl) {
+        auto it = child_index.find(ChildKey(parent, name));
+        if (it == child_index.end()) {
+            m_stats.index_misses++;
+            return false;
+        }
+        m_stats.index_hits++;
+        *hdl = it->second;
+        return true;
     }
 
-    void clear() {
-        std::map<std::string, GpiObjHdl*>::iterator it;
+    void add_child(GpiObjHdl *parent, const std::string &name, GpiObjHdl *hdl) {
+        child_index[ChildKey(parent, name)] = hdl;
+    }
 
+    void get_stats(gpi_handle_store_stats_t *stats) {
+        *stats = m_stats;
+        stats->handles = handle_map.size();
+        stats->index_entries = child_index.size();
+    }
+
+    void clear() {
         // Delete the object handles before clearing the map
-        for (it = handle_map.begin(); it != handle_map.end(); it++)
-        {
-            delete (it->second);
+        for (auto &entry : handle_map) {
+            delete entry.second;
         }
         handle_map.clear();
+        child_index.clear();
+        m_stats = gpi_handle_store_stats_t();
     }
 
 private:
-    std::map<std::string, GpiObjHdl*> handle_map;
+    typedef std::pair<GpiObjHdl*, std::string> ChildKey;
+
+    struct ChildKeyHash {
+        size_t operator()(const ChildKey &key) const {
+            return std::hash<std::string>()(key.second) ^ (std::hash<GpiObjHdl*>()(key.first) << 1);
+        }
+    };
 
+    std::unordered_map<std::string, GpiObjHdl*> handle_map;
+    std::unordered_map<ChildKey, GpiObjHdl*, ChildKeyHash> child_index;
+    gpi_handle_store_stats_t m_stats = gpi_handle_store_stats_t();
 };
 
 static GpiHandleStore unique_handles;
 
 #define CHECK_AND_STORE(_x) unique_handles.check_and_store(_x)
 #define CLEAR_STORE() unique_handles.clear()
+#define FIND_CHILD(_parent, _name, _hdl) unique_handles.find_child(_parent, _name, _hdl)
+#define ADD_CHILD(_parent, _name, _hdl) unique_handles.add_child(_parent, _name, _hdl)
 
 #else
 
 #define CHECK_AND_STORE(_x) _x
 #define CLEAR_STORE() (void)0   // No-op
+#define FIND_CHILD(_parent, _name, _hdl) false
+#define ADD_CHILD(_parent, _name, _hdl) (void)0     // No-op
 
 #endif
 
@@ -298,6 +330,11 @@ static GpiObjHdl* __gpi_get_handle_by_name(GpiObjHdl *parent,
 
     GpiObjHdl *hdl = NULL;
 
+    if (FIND_CHILD(parent, name, &hdl)) {
+        LOG_DEBUG("Found %s in the child index", name.c_str());
+        return hdl;
+    }
+
     LOG_DEBUG("Searching for %s", name.c_str());
 
     for (iter = registered_impls.begin();
@@ -326,10 +363,14 @@ static GpiObjHdl* __gpi_get_handle_by_name(GpiObjHdl *parent,
         }
     }
 
-    if (hdl)
-        return CHECK_AND_STORE(hdl);
-    else
-        return hdl;
+    if (hdl) {
+        hdl = CHECK_AND_STORE(hdl);
+        ADD_CHILD(parent, name, hdl);
+    } else if (!skip_impl) {
+        // Only a search through every implementation proves the name does not exist
+        ADD_CHILD(parent, name, NULL);
+    }
+    return hdl;
 }
 
 static GpiObjHdl* __gpi_get_handle_by_raw(GpiObjHdl *parent,
@@ -445,6 +486,15 @@ gpi_sim_hdl gpi_next(gpi_iterator_hdl iter)
     }
 }
 
+void gpi_get_handle_store_stats(gpi_handle_store_stats_t *stats)
+{
+#ifdef SINGLETON_HANDLES
+    unique_handles.get_stats(stats);
+#else
+    *stats = gpi_handle_store_stats_t();
+#endif
+}
+
 const char* gpi_get_definition_name(gpi_sim_hdl obj_hdl)
 {
     return obj_hdl->get_definition_name();
@@ -479,6 +529,12 @@ long gpi_get_signal_value_long(gpi_sim_hdl sig_hdl)
     return obj_hdl->get_signal_value_long();
 }
 
+int gpi_get_signal_value_vector(gpi_sim_hdl sig_hdl, uint32_t *value, uint32_t *unknown, size_t n_words)
+{
+    GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl*>(sig_hdl);
+    return obj_hdl->get_signal_value_vector(value, unknown, n_words);
+}
+
 const char *gpi_get_signal_name_str(gpi_sim_hdl sig_hdl)
 {
     GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl*>(sig_hdl);
@@ -536,6 +592,12 @@ void gpi_set_signal_value_real(gpi_sim_hdl sig_hdl, double value, gpi_set_action
     obj_hdl->set_signal_value(value, action);
 }
 
+void gpi_set_signal_value_vector(gpi_sim_hdl sig_hdl, const uint32_t *value, size_t n_words, gpi_set_action_t action)
+{
+    GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl*>(sig_hdl);
+    obj_hdl->set_signal_value_vector(value, n_words, action);
+}
+
 int gpi_get_num_elems(gpi_sim_hdl obj_hdl)
 {
     return obj_hdl->get_num_elems();
@@ -559,8 +621,7 @@ gpi_cb_hdl gpi_register_value_change_callback(int (*gpi_function)(const void *),
 
     GpiSignalObjHdl *signal_hdl = static_cast<GpiSignalObjHdl*>(sig_hdl);
 
-    /* Do something based on int & GPI_RISING | GPI_FALLING */
-    GpiCbHdl *gpi_hdl = signal_hdl->value_change_cb(edge);
+    GpiCbHdl *gpi_hdl = signal_hdl->edge_cb(edge);
     if (!gpi_hdl) {
         LOG_ERROR("Failed to register a value change callback");
         return NULL;
@@ -570,6 +631,24 @@ gpi_cb_hdl gpi_register_value_change_callback(int (*gpi_function)(const void *),
     return gpi_hdl;
 }
 
+gpi_cb_hdl gpi_register_edge_count_callback(int (*gpi_function)(const void *),
+                                            void *gpi_cb_data,
+                                            gpi_sim_hdl sig_hdl,
+                                            int edge,
+                                            uint64_t count)
+{
+    GpiSignalObjHdl *signal_hdl = static_cast<GpiSignalObjHdl*>(sig_hdl);
+
+    GpiCbHdl *gpi_hdl = signal_hdl->edge_count_cb(edge, count);
+    if (!gpi_hdl) {
+        LOG_ERROR("Failed to register an edge count callback");
+        return NULL;
+    }
+
+    gpi_hdl->set_user_data(gpi_function, gpi_cb_data);
+    return gpi_hdl;
+}
+
 /* It should not matter which implementation we use for this so just pick the first
    one */
 gpi_cb_hdl gpi_register_timed_callback(int (*gpi_function)(const void *),
@@ -635,6 +714,42 @@ void gpi_deregister_callback(gpi_cb_hdl cb_hdl)
     cb_hdl->m_impl->deregister_callback(cb_hdl);
 }
 
+void *gpi_get_callback_data(gpi_cb_hdl cb_hdl)
+{
+    return const_cast<void *>(cb_hdl->get_user_data());
+}
+
+gpi_clk_hdl gpi_clock_create(gpi_sim_hdl clk_sig)
+{
+    GpiSignalObjHdl *signal_hdl = static_cast<GpiSignalObjHdl*>(clk_sig);
+    return new GpiClockHdl(signal_hdl);
+}
+
+int gpi_clock_start(gpi_clk_hdl clk_hdl, uint64_t period, uint64_t high, bool start_high, uint64_t cycles)
+{
+    return clk_hdl->start(period, high, start_high, cycles);
+}
+
+void gpi_clock_stop(gpi_clk_hdl clk_hdl)
+{
+    clk_hdl->stop();
+}
+
+int gpi_clock_set_period(gpi_clk_hdl clk_hdl, uint64_t period, uint64_t high)
+{
+    return clk_hdl->set_period(period, high);
+}
+
+bool gpi_clock_is_running(gpi_clk_hdl clk_hdl)
+{
+    return clk_hdl->is_running();
+}
+
+void gpi_clock_destroy(gpi_clk_hdl clk_hdl)
+{
+    delete clk_hdl;
+}
+
 const char* GpiImplInterface::get_name_c() {
     return m_name.c_str();
 }
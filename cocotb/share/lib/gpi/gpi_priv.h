@@ -55,6 +55,7 @@ class GpiCbHdl;
 class GpiImplInterface;
 class GpiIterator;
 class GpiCbHdl;
+class GpiEdgeFanout;
 
 /* Base GPI class others are derived from */
 class GPI_EXPORT GpiHdl {
@@ -145,7 +146,7 @@ class GPI_EXPORT GpiSignalObjHdl : public GpiObjHdl {
 public:
     using GpiObjHdl::GpiObjHdl;
 
-    virtual ~GpiSignalObjHdl() = default;
+    virtual ~GpiSignalObjHdl();
     // Provide public access to the implementation (composition vs inheritance)
     virtual const char* get_signal_value_binstr() = 0;
     virtual const char* get_signal_value_str() = 0;
@@ -158,10 +159,25 @@ public:
     virtual int set_signal_value(const double value, gpi_set_action_t action) = 0;
     virtual int set_signal_value_str(std::string &value, gpi_set_action_t action) = 0;
     virtual int set_signal_value_binstr(std::string &value, gpi_set_action_t action) = 0;
+
+    // Access the value of a logic vector as 32-bit words, least significant word first.
+    // get_signal_value_vector returns the width of the signal in bits.
+    // The default implementations go through the binary string accessors.
+    virtual int get_signal_value_vector(uint32_t *value, uint32_t *unknown, size_t n_words);
+    virtual int set_signal_value_vector(const uint32_t *value, size_t n_words, gpi_set_action_t action);
     //virtual GpiCbHdl monitor_value(bool rising_edge) = 0; this was for the triggers
     // but the explicit ones are probably better
 
     virtual GpiCbHdl *value_change_cb(int edge) = 0;
+
+    // Edge callbacks shared by every waiter on this signal, see GpiEdgeFanout
+    GpiCbHdl *edge_cb(int edge);
+    GpiCbHdl *edge_count_cb(int edge, uint64_t count);
+
+private:
+    GpiEdgeFanout *edge_fanout();
+
+    GpiEdgeFanout *m_edge_fanout = nullptr;
 };
 
 
@@ -202,6 +218,89 @@ protected:
     GpiSignalObjHdl *m_signal;
 };
 
+/* GPI edge callback fan-out */
+// Waiters for a rising, falling or either edge of one signal share a single
+// either-edge value change callback from the implementation. The edge is
+// decoded once per value change and only the matching waiters are run, so
+// non-matching edges never leave the GPI and the simulator callback stays
+// registered for as long as anyone is waiting.
+// A waiter can also count edges and only run once the last one is seen.
+class GPI_EXPORT GpiEdgeCbHdl : public GpiCbHdl {
+public:
+    GpiEdgeCbHdl(GpiEdgeFanout *fanout, GpiImplInterface *impl, int edge) : GpiCbHdl(impl),
+                                                                            m_fanout(fanout),
+                                                                            m_edge(edge) { }
+    int arm_callback() override;
+    int cleanup_callback() override;
+
+    void set_edge(int edge, uint64_t count) { m_edge = edge; m_count = count; }
+    bool needs_value() { return m_edge != (GPI_RISING | GPI_FALLING); }
+    bool count_edge(bool rising, bool falling);     // True once the last edge is seen
+
+    uint64_t m_armed_at = 0;        // Dispatch count of the fan-out when armed
+
+private:
+    GpiEdgeFanout *m_fanout;
+    int m_edge;
+    uint64_t m_count = 1;
+    uint64_t m_remaining = 1;
+};
+
+class GPI_EXPORT GpiEdgeFanout {
+public:
+    GpiEdgeFanout(GpiSignalObjHdl *signal);
+    ~GpiEdgeFanout();
+
+    GpiCbHdl *register_edge(int edge);
+    GpiCbHdl *register_edge_count(int edge, uint64_t count);
+    void waiter_removed();
+    int dispatch();     // Entry point from the shared value change callback
+
+    uint64_t m_dispatch_count = 0;
+
+private:
+    // The plain edge waiters come first, counted waiters are pooled after them
+    enum { RISING, FALLING, EITHER, N_EDGES };
+
+    int arm_shared();
+    bool any_waiting();
+
+    GpiSignalObjHdl *m_signal;
+    std::vector<GpiEdgeCbHdl*> m_waiters;
+    GpiCbHdl *m_value_cb = nullptr;     // Shared implementation callback
+    bool m_armed = false;               // m_value_cb is registered with the simulator
+    bool m_dispatching = false;
+};
+
+/* GPI native clock */
+// Toggles a signal from recurring timed callbacks registered through the
+// first registered implementation, so the clock never enters Python.
+// A new period takes effect at the next edge.
+class GPI_EXPORT GpiClockHdl {
+public:
+    GpiClockHdl(GpiSignalObjHdl *clk_hdl) : m_clk_hdl(clk_hdl) { }
+    ~GpiClockHdl();
+
+    int start(uint64_t period, uint64_t high, bool start_high, uint64_t cycles);
+    void stop();
+    int set_period(uint64_t period, uint64_t high);
+    bool is_running() { return m_cb_hdl != nullptr; }
+
+    int toggle();   // Entry point from the timed callback
+
+private:
+    int schedule_next();
+
+    GpiSignalObjHdl *m_clk_hdl;
+    GpiCbHdl *m_cb_hdl = nullptr;
+    uint64_t m_period = 0;
+    uint64_t m_high = 0;
+    uint64_t m_cycles = 0;          // Remaining full cycles, 0 means forever
+    bool m_forever = true;
+    int32_t m_value = 0;            // Value currently driven onto the signal
+    int32_t m_start_value = 1;      // Value driven in the first half of a cycle
+};
+
 class GPI_EXPORT GpiIterator : public GpiHdl {
 public:
     enum Status {
@@ -42,6 +42,9 @@ static int sim_ending = 0;
 #include <cocotb_utils.h>       // COCOTB_UNUSED
 #include <type_traits>
 #include <limits>
+#include <cstring>
+#include <string>
+#include <vector>
 #include <Python.h>
 #include <gpi_logging.h>        // LOG_* macros
 #include <py_gpi_logging.h>     // py_gpi_logger_set_level
@@ -54,16 +57,29 @@ static int sim_ending = 0;
 
 #define MODULE_NAME "simulator"
 
+// The set_signal_val_* method which set_signal_values applies for each write
+enum set_signal_kind {
+    SET_INT,
+    SET_VECTOR,
+    SET_BINSTR,
+    SET_STR,
+    SET_REAL,
+};
+
 // callback user data
 struct callback_data {
     PyThreadState *_saved_thread_state; // Thread state of the calling thread FIXME is this required?
     uint32_t id_value;                  // COCOTB_ACTIVE_ID or COCOTB_INACTIVE_ID
     PyObject *function;                 // Function to call when the callback fires
-    PyObject *args;                     // The arguments to call the function with
-    PyObject *kwargs;                   // Keyword arguments to call the function with
-    gpi_sim_hdl cb_hdl;
+    PyObject *args;                     // The arguments to call the function with, NULL if there is a single one
+    // The single argument is in vectorcall[1], vectorcall[0] is scratch space for the callee
+    PyObject *vectorcall[2];
+    gpi_cb_hdl cb_hdl;
 };
 
+// Callback records are recycled, as one is needed for every callback registration
+static std::vector<callback_data *> callback_data_pool;
+
 /* define the extension types as templates */
 namespace {
     template<typename gpi_hdl>
@@ -150,6 +166,40 @@ namespace {
     PyTypeObject gpi_hdl_Object<gpi_iterator_hdl>::py_type;
     template<>
     PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type;
+    template<>
+    PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type;
+
+    // A callback handle is created for every callback registration, so they are recycled
+    std::vector<gpi_hdl_Object<gpi_cb_hdl> *> cb_hdl_free_list;
+    const size_t cb_hdl_free_list_max = 1024;
+
+    template<>
+    PyObject *gpi_hdl_New<gpi_cb_hdl>(gpi_cb_hdl hdl) {
+        if (hdl == NULL) {
+            Py_RETURN_NONE;
+        }
+        gpi_hdl_Object<gpi_cb_hdl> *obj;
+        if (!cb_hdl_free_list.empty()) {
+            obj = cb_hdl_free_list.back();
+            cb_hdl_free_list.pop_back();
+            PyObject_Init((PyObject *)obj, &gpi_hdl_Object<gpi_cb_hdl>::py_type);
+        } else {
+            obj = PyObject_New(gpi_hdl_Object<gpi_cb_hdl>, &gpi_hdl_Object<gpi_cb_hdl>::py_type);
+            if (obj == NULL) {
+                return NULL;
+            }
+        }
+        obj->hdl = hdl;
+        return (PyObject *)obj;
+    }
+
+    void gpi_cb_hdl_dealloc(PyObject *self) {
+        if (cb_hdl_free_list.size() < cb_hdl_free_list_max) {
+            cb_hdl_free_list.push_back((gpi_hdl_Object<gpi_cb_hdl> *)self);
+        } else {
+            Py_TYPE(self)->tp_free(self);
+        }
+    }
 }
 
 
@@ -175,6 +225,86 @@ struct sim_time {
 
 static struct sim_time cache_time;
 
+/**
+ * Take a callback record from the pool, or allocate a new one.
+ *
+ * The callback calls *func* with the items of *args* from position *first* onwards.
+ * Steals the reference to *func* on success; on failure the caller still owns it.
+ */
+static callback_data *callback_data_new(PyObject *func, PyObject *args, Py_ssize_t first)
+{
+    callback_data *data;
+    if (!callback_data_pool.empty()) {
+        data = callback_data_pool.back();
+        callback_data_pool.pop_back();
+    } else {
+        data = (callback_data *)malloc(sizeof(callback_data));
+        if (data == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+    }
+
+    Py_ssize_t numargs = PyTuple_GET_SIZE(args);
+    if (numargs - first == 1) {
+        // The common case of a single argument needs no tuple
+        data->args = NULL;
+        data->vectorcall[1] = PyTuple_GET_ITEM(args, first);
+        Py_INCREF(data->vectorcall[1]);
+    } else {
+        data->args = PyTuple_GetSlice(args, first, numargs);   // New reference
+        if (data->args == NULL) {
+            callback_data_pool.push_back(data);
+            return NULL;
+        }
+        data->vectorcall[1] = NULL;
+    }
+
+    data->_saved_thread_state = PyThreadState_Get();
+    data->id_value = COCOTB_ACTIVE_ID;
+    data->function = func;
+    data->cb_hdl = NULL;
+
+    return data;
+}
+
+/** Drop the references held by a callback record, and return it to the pool. */
+static void callback_data_release(callback_data *data)
+{
+    PyObject *function = data->function;
+    PyObject *args = data->args;
+    PyObject *arg = data->vectorcall[1];
+
+    data->id_value = COCOTB_INACTIVE_ID;
+    data->function = NULL;
+    data->args = NULL;
+    data->vectorcall[1] = NULL;
+    data->cb_hdl = NULL;
+    callback_data_pool.push_back(data);
+
+    // Releasing the references may run arbitrary code, so this comes last
+    Py_DECREF(function);
+    Py_XDECREF(args);
+    Py_XDECREF(arg);
+}
+
+/** Call the function of a callback record, returning a new reference or NULL. */
+static PyObject *callback_data_call(callback_data *data)
+{
+    if (data->args != NULL) {
+        return PyObject_Call(data->function, data->args, NULL);
+    }
+#if PY_VERSION_HEX >= 0x03090000
+    return PyObject_Vectorcall(data->function, &data->vectorcall[1],
+                               1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif PY_VERSION_HEX >= 0x03080000
+    return _PyObject_Vectorcall(data->function, &data->vectorcall[1],
+                                1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#else
+    return PyObject_CallFunctionObjArgs(data->function, data->vectorcall[1], NULL);
+#endif
+}
+
 /**
  * @name    Callback Handling
  * @brief   Handle a callback coming from GPI
@@ -229,7 +359,7 @@ int handle_gpi_callback(void *user_data)
 
     {
         // Call the callback
-        PyObject *pValue = PyObject_Call(cb_data->function, cb_data->args, cb_data->kwargs);
+        PyObject *pValue = callback_data_call(cb_data);
 
         // If the return value is NULL a Python exception has occurred
         // The best thing to do here is shutdown as any subsequent
@@ -250,11 +380,7 @@ int handle_gpi_callback(void *user_data)
 
     // Callbacks may have been re-enabled
     if (cb_data->id_value == COCOTB_INACTIVE_ID) {
-        Py_DECREF(cb_data->function);
-        Py_DECREF(cb_data->args);
-
-        // Free the callback data
-        free(cb_data);
+        callback_data_release(cb_data);
     }
 
 out:
@@ -291,24 +417,6 @@ static PyObject *log_msg(PyObject *self, PyObject *args)
 }
 
 
-static callback_data *callback_data_new(PyObject *func, PyObject *args, PyObject *kwargs)
-{
-    callback_data *data = (callback_data *)malloc(sizeof(callback_data));
-    if (data == NULL) {
-        PyErr_NoMemory();
-        return NULL;
-    }
-
-    data->_saved_thread_state = PyThreadState_Get();
-    data->id_value = COCOTB_ACTIVE_ID;
-    data->function = func;
-    data->args = args;
-    data->kwargs = kwargs;
-
-    return data;
-}
-
-
 // Register a callback for read-only state of sim
 // First argument is the function to call
 // Remaining arguments are keyword arguments to be passed to the callback
@@ -337,17 +445,18 @@ static PyObject *register_readonly_callback(PyObject *self, PyObject *args)
     Py_INCREF(function);
 
     // Remaining args for function
-    PyObject *fArgs = PyTuple_GetSlice(args, 1, numargs);   // New reference
-    if (fArgs == NULL) {
-        return NULL;
-    }
-
-    callback_data *cb_data = callback_data_new(function, fArgs, NULL);
+    callback_data *cb_data = callback_data_new(function, args, 1);
     if (cb_data == NULL) {
+        Py_DECREF(function);
         return NULL;
     }
 
     gpi_cb_hdl hdl = gpi_register_readonly_callback((gpi_function_t)handle_gpi_callback, cb_data);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
 
     PyObject *rv = gpi_hdl_New(hdl);
 
@@ -380,18 +489,19 @@ static PyObject *register_rwsynch_callback(PyObject *self, PyObject *args)
     Py_INCREF(function);
 
     // Remaining args for function
-    PyObject *fArgs = PyTuple_GetSlice(args, 1, numargs);   // New reference
-    if (fArgs == NULL) {
-        return NULL;
-    }
-
-    callback_data *cb_data = callback_data_new(function, fArgs, NULL);
+    callback_data *cb_data = callback_data_new(function, args, 1);
     if (cb_data == NULL) {
+        Py_DECREF(function);
         return NULL;
     }
 
     gpi_cb_hdl hdl = gpi_register_readwrite_callback(
         (gpi_function_t)handle_gpi_callback, cb_data);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
 
     PyObject *rv = gpi_hdl_New(hdl);
 
@@ -424,18 +534,19 @@ static PyObject *register_nextstep_callback(PyObject *self, PyObject *args)
     Py_INCREF(function);
 
     // Remaining args for function
-    PyObject *fArgs = PyTuple_GetSlice(args, 1, numargs);   // New reference
-    if (fArgs == NULL) {
-        return NULL;
-    }
-
-    callback_data *cb_data = callback_data_new(function, fArgs, NULL);
+    callback_data *cb_data = callback_data_new(function, args, 1);
     if (cb_data == NULL) {
+        Py_DECREF(function);
         return NULL;
     }
 
     gpi_cb_hdl hdl = gpi_register_nexttime_callback(
         (gpi_function_t)handle_gpi_callback, cb_data);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
 
     PyObject *rv = gpi_hdl_New(hdl);
 
@@ -486,18 +597,19 @@ static PyObject *register_timed_callback(PyObject *self, PyObject *args)
     Py_INCREF(function);
 
     // Remaining args for function
-    PyObject *fArgs = PyTuple_GetSlice(args, 2, numargs);   // New reference
-    if (fArgs == NULL) {
-        return NULL;
-    }
-
-    callback_data *cb_data = callback_data_new(function, fArgs, NULL);
+    callback_data *cb_data = callback_data_new(function, args, 2);
     if (cb_data == NULL) {
+        Py_DECREF(function);
         return NULL;
     }
 
     gpi_cb_hdl hdl = gpi_register_timed_callback(
         (gpi_function_t)handle_gpi_callback, cb_data, time_ps);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
 
     // Check success
     PyObject *rv = gpi_hdl_New(hdl);
@@ -545,18 +657,90 @@ static PyObject *register_value_change_callback(PyObject *self, PyObject *args)
     int edge = (int)PyLong_AsLong(pedge);
 
     // Remaining args for function
-    PyObject *fArgs = PyTuple_GetSlice(args, 3, numargs);   // New reference
-    if (fArgs == NULL) {
+    callback_data *cb_data = callback_data_new(function, args, 3);
+    if (cb_data == NULL) {
+        Py_DECREF(function);
+        return NULL;
+    }
+
+    gpi_cb_hdl hdl = gpi_register_value_change_callback(
+        (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
+
+    // Check success
+    PyObject *rv = gpi_hdl_New(hdl);
+
+    return rv;
+}
+
+
+static PyObject *register_edge_count_callback(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    Py_ssize_t numargs = PyTuple_Size(args);
+
+    if (numargs < 4) {
+        PyErr_SetString(PyExc_TypeError, "Attempt to register edge count callback without enough arguments!\n");
+        return NULL;
+    }
+
+    PyObject *pSigHdl = PyTuple_GetItem(args, 0);
+    if (Py_TYPE(pSigHdl) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+        PyErr_SetString(PyExc_TypeError, "First argument must be a gpi_sim_hdl");
+        return NULL;
+    }
+    gpi_sim_hdl sig_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+    if (sig_hdl == NULL) {
+        PyErr_SetString(PyExc_ValueError, "Cannot register edge count callback on a NULL signal handle");
+        return NULL;
+    }
+
+    // Extract the callback function
+    PyObject *function = PyTuple_GetItem(args, 1);
+    if (!PyCallable_Check(function)) {
+        PyErr_SetString(PyExc_TypeError, "Attempt to register edge count callback without passing a callable callback!\n");
         return NULL;
     }
 
-    callback_data *cb_data = callback_data_new(function, fArgs, NULL);
+    int edge = (int)PyLong_AsLong(PyTuple_GetItem(args, 2));
+    if (edge == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    unsigned long long count = PyLong_AsUnsignedLongLong(PyTuple_GetItem(args, 3));
+    if (count == (unsigned long long)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (count == 0) {
+        PyErr_SetString(PyExc_ValueError, "Edge count must be at least 1");
+        return NULL;
+    }
+    Py_INCREF(function);
+
+    // Remaining args for function
+    callback_data *cb_data = callback_data_new(function, args, 4);
     if (cb_data == NULL) {
+        Py_DECREF(function);
         return NULL;
     }
 
-    gpi_cb_hdl hdl = gpi_register_value_change_callback(
-        (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge);
+    gpi_cb_hdl hdl = gpi_register_edge_count_callback(
+        (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge, count);
+    if (hdl == NULL) {
+        callback_data_release(cb_data);
+    } else {
+        cb_data->cb_hdl = hdl;
+    }
 
     // Check success
     PyObject *rv = gpi_hdl_New(hdl);
@@ -663,6 +847,159 @@ static PyObject *set_signal_val_real(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject
     Py_RETURN_NONE;
 }
 
+// Number of 32-bit words needed to hold the value of a logic vector
+static size_t signal_value_words(gpi_sim_hdl hdl)
+{
+    int n_bits = gpi_get_num_elems(hdl);
+    return n_bits > 32 ? (static_cast<size_t>(n_bits) + 31) / 32 : 1;
+}
+
+// Build a Python int from 32-bit words, least significant word first
+static PyObject *long_from_words(const uint32_t *words, size_t n_words)
+{
+    auto chunk = [words, n_words](size_t i) {
+        unsigned long long lo = words[i];
+        unsigned long long hi = i + 1 < n_words ? words[i + 1] : 0;
+        return lo | (hi << 32);
+    };
+
+    if (n_words <= 2) {
+        return PyLong_FromUnsignedLongLong(chunk(0));
+    }
+
+    PyObject *shift = PyLong_FromLong(64);
+    if (!shift) {
+        return NULL;
+    }
+    PyObject *result = PyLong_FromLong(0);
+
+    // Accumulate 64 bits at a time, starting from the most significant end
+    for (size_t i = (n_words - 1) & ~static_cast<size_t>(1); result; i -= 2) {
+        PyObject *part = PyLong_FromUnsignedLongLong(chunk(i));
+        PyObject *shifted = part ? PyNumber_Lshift(result, shift) : NULL;
+        Py_DECREF(result);
+        result = shifted ? PyNumber_Or(shifted, part) : NULL;
+        Py_XDECREF(shifted);
+        Py_XDECREF(part);
+        if (i == 0) {
+            break;
+        }
+    }
+
+    Py_DECREF(shift);
+    return result;
+}
+
+// Split a non-negative Python int into 32-bit words, least significant word first.
+// Bits that do not fit in n_words are discarded.
+static int long_to_words(PyObject *value, uint32_t *words, size_t n_words)
+{
+    PyObject *zero = PyLong_FromLong(0);
+    if (!zero) {
+        return -1;
+    }
+    int sign = PyObject_RichCompareBool(value, zero, Py_LT);
+    Py_DECREF(zero);
+    if (sign < 0) {
+        return -1;
+    }
+    if (sign) {
+        PyErr_SetString(PyExc_ValueError, "Value must not be negative");
+        return -1;
+    }
+
+    PyObject *shift = PyLong_FromLong(64);
+    if (!shift) {
+        return -1;
+    }
+
+    Py_INCREF(value);
+    for (size_t i = 0; i < n_words; i += 2) {
+        unsigned long long part = PyLong_AsUnsignedLongLongMask(value);
+        if (part == static_cast<unsigned long long>(-1) && PyErr_Occurred()) {
+            Py_DECREF(value);
+            Py_DECREF(shift);
+            return -1;
+        }
+        words[i] = static_cast<uint32_t>(part);
+        if (i + 1 < n_words) {
+            words[i + 1] = static_cast<uint32_t>(part >> 32);
+        }
+        if (i + 2 < n_words) {
+            PyObject *next = PyNumber_Rshift(value, shift);
+            Py_DECREF(value);
+            if (!next) {
+                Py_DECREF(shift);
+                return -1;
+            }
+            value = next;
+        }
+    }
+
+    Py_DECREF(value);
+    Py_DECREF(shift);
+    return 0;
+}
+
+static int set_signal_value_from_long(gpi_sim_hdl hdl, PyObject *value, gpi_set_action_t action)
+{
+    std::vector<uint32_t> words(signal_value_words(hdl));
+    if (long_to_words(value, words.data(), words.size()) < 0) {
+        return -1;
+    }
+    gpi_set_signal_value_vector(hdl, words.data(), words.size(), action);
+    return 0;
+}
+
+static PyObject *get_signal_val_vector(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *args)
+{
+    COCOTB_UNUSED(args);
+
+    size_t n_words = signal_value_words(self->hdl);
+    std::vector<uint32_t> value(n_words);
+    std::vector<uint32_t> unknown(n_words);
+
+    int n_bits = gpi_get_signal_value_vector(self->hdl, value.data(), unknown.data(), n_words);
+    if (n_bits > static_cast<int>(32 * n_words)) {
+        // The number of elements does not always match the width, e.g. for integers
+        n_words = (static_cast<size_t>(n_bits) + 31) / 32;
+        value.resize(n_words);
+        unknown.resize(n_words);
+        n_bits = gpi_get_signal_value_vector(self->hdl, value.data(), unknown.data(), n_words);
+    }
+    if (n_bits < 0) {
+        PyErr_Format(PyExc_RuntimeError, "Unable to read the value of %s", gpi_get_signal_name_str(self->hdl));
+        return NULL;
+    }
+
+    PyObject *py_value = long_from_words(value.data(), n_words);
+    if (!py_value) {
+        return NULL;
+    }
+    PyObject *py_unknown = long_from_words(unknown.data(), n_words);
+    if (!py_unknown) {
+        Py_DECREF(py_value);
+        return NULL;
+    }
+
+    return Py_BuildValue("(NNi)", py_value, py_unknown, n_bits);
+}
+
+static PyObject *set_signal_val_vector(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *args)
+{
+    PyObject *value;
+    gpi_set_action_t action;
+
+    if (!PyArg_ParseTuple(args, "iO!:set_signal_val_vector", &action, &PyLong_Type, &value)) {
+        return NULL;
+    }
+
+    if (set_signal_value_from_long(self->hdl, value, action) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 static PyObject *set_signal_val_int(gpi_hdl_Object<gpi_sim_hdl> *self, PyObject *args)
 {
     long long value;
@@ -825,6 +1162,27 @@ static PyObject *get_precision(PyObject *self, PyObject *args)
     return PyLong_FromLong(precision);
 }
 
+static PyObject *get_handle_store_stats(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+    COCOTB_UNUSED(args);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    gpi_handle_store_stats_t stats;
+    gpi_get_handle_store_stats(&stats);
+
+    return Py_BuildValue("{s:K,s:K,s:K,s:K,s:K}",
+        "handles", (unsigned long long)stats.handles,
+        "duplicates", (unsigned long long)stats.duplicates,
+        "index_entries", (unsigned long long)stats.index_entries,
+        "index_hits", (unsigned long long)stats.index_hits,
+        "index_misses", (unsigned long long)stats.index_misses);
+}
+
 static PyObject *get_simulator_product(PyObject *m, PyObject *args)
 {
     COCOTB_UNUSED(m);
@@ -889,17 +1247,438 @@ static PyObject *stop_simulator(PyObject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+// Check that a binary string only contains resolved bits
+static bool check_resolved_binstr(gpi_sim_hdl hdl, const char *binstr)
+{
+    if (binstr[0] == '\0' || binstr[strspn(binstr, "01")] != '\0') {
+        PyErr_Format(PyExc_ValueError,
+            "Value of signal %s is not a resolvable integer: %s",
+            gpi_get_signal_name_str(hdl), binstr);
+        return false;
+    }
+    return true;
+}
+
+static PyObject *get_signal_values(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    PyObject *handles;
+    const char *format = "binstr";
+
+    if (!PyArg_ParseTuple(args, "O|s:get_signal_values", &handles, &format)) {
+        return NULL;
+    }
+
+    enum { FORMAT_BINSTR, FORMAT_INT, FORMAT_BYTES } fmt;
+    if (strcmp(format, "binstr") == 0) {
+        fmt = FORMAT_BINSTR;
+    } else if (strcmp(format, "int") == 0) {
+        fmt = FORMAT_INT;
+    } else if (strcmp(format, "bytes") == 0) {
+        fmt = FORMAT_BYTES;
+    } else {
+        PyErr_Format(PyExc_ValueError,
+            "get_signal_values: format must be 'binstr', 'int' or 'bytes', not '%s'", format);
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(handles, "get_signal_values: handles must be a sequence");
+    if (!seq) {
+        return NULL;
+    }
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    // Check all the handles up front so that no partial result has to be unwound
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (!PyObject_TypeCheck(items[i], &gpi_hdl_Object<gpi_sim_hdl>::py_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "get_signal_values: expected cocotb.simulator.gpi_sim_hdl, not %.200s",
+                Py_TYPE(items[i])->tp_name);
+            Py_DECREF(seq);
+            return NULL;
+        }
+    }
+
+    PyObject *result = NULL;
+
+    if (fmt == FORMAT_BYTES) {
+        // Each value is packed MSB first into a whole number of bytes
+        std::string packed;
+        for (Py_ssize_t i = 0; i < n; i++) {
+            gpi_sim_hdl hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl;
+            const char *binstr = gpi_get_signal_value_binstr(hdl);
+            if (!check_resolved_binstr(hdl, binstr)) {
+                Py_DECREF(seq);
+                return NULL;
+            }
+            size_t n_bits = strlen(binstr);
+            size_t pad = (8 - n_bits % 8) % 8;
+            unsigned char byte = 0;
+            for (size_t bit = 0; bit < pad + n_bits; bit++) {
+                byte = static_cast<unsigned char>((byte << 1) | (bit >= pad && binstr[bit - pad] == '1'));
+                if (bit % 8 == 7) {
+                    packed.push_back(static_cast<char>(byte));
+                    byte = 0;
+                }
+            }
+        }
+        result = PyBytes_FromStringAndSize(packed.data(), static_cast<Py_ssize_t>(packed.size()));
+    } else {
+        result = PyList_New(n);
+        if (!result) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            gpi_sim_hdl hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl;
+            const char *binstr = gpi_get_signal_value_binstr(hdl);
+            PyObject *value;
+            if (fmt == FORMAT_INT) {
+                if (!check_resolved_binstr(hdl, binstr)) {
+                    Py_DECREF(result);
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                value = PyLong_FromString(binstr, NULL, 2);
+            } else {
+                value = PyUnicode_FromString(binstr);
+            }
+            if (!value) {
+                Py_DECREF(result);
+                Py_DECREF(seq);
+                return NULL;
+            }
+            PyList_SET_ITEM(result, i, value);
+        }
+    }
+
+    Py_DECREF(seq);
+    return result;
+}
+
+static PyObject *get_handles(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    PyObject *lookups;
+
+    if (!PyArg_ParseTuple(args, "O:get_handles", &lookups)) {
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(lookups, "get_handles: lookups must be a sequence");
+    if (!seq) {
+        return NULL;
+    }
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    // The handles found so far, as later lookups can start from them
+    std::vector<gpi_sim_hdl> found;
+    found.reserve(static_cast<size_t>(n));
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *parent_obj;
+        PyObject *key;
+        if (!PyArg_ParseTuple(items[i], "OO:get_handles", &parent_obj, &key)) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+
+        gpi_sim_hdl parent;
+        if (PyObject_TypeCheck(parent_obj, &gpi_hdl_Object<gpi_sim_hdl>::py_type)) {
+            parent = ((gpi_hdl_Object<gpi_sim_hdl> *)parent_obj)->hdl;
+        } else if (PyLong_Check(parent_obj)) {
+            Py_ssize_t parent_idx = PyLong_AsSsize_t(parent_obj);
+            if (parent_idx < 0 || parent_idx >= i) {
+                if (!PyErr_Occurred()) {
+                    PyErr_Format(PyExc_ValueError,
+                        "get_handles: lookup %zd refers to lookup %zd, which does not come before it",
+                        i, parent_idx);
+                }
+                Py_DECREF(seq);
+                return NULL;
+            }
+            parent = found[static_cast<size_t>(parent_idx)];
+        } else {
+            PyErr_Format(PyExc_TypeError,
+                "get_handles: expected cocotb.simulator.gpi_sim_hdl or int as parent, not %.200s",
+                Py_TYPE(parent_obj)->tp_name);
+            Py_DECREF(seq);
+            return NULL;
+        }
+
+        gpi_sim_hdl hdl = NULL;
+        if (PyUnicode_Check(key)) {
+            const char *name = PyUnicode_AsUTF8(key);
+            if (!name) {
+                Py_DECREF(seq);
+                return NULL;
+            }
+            if (parent) {
+                hdl = gpi_get_handle_by_name(parent, name);
+            }
+        } else if (PyLong_Check(key)) {
+            long index = PyLong_AsLong(key);
+            if (index == -1 && PyErr_Occurred()) {
+                Py_DECREF(seq);
+                return NULL;
+            }
+            if (index < std::numeric_limits<int32_t>::min() || index > std::numeric_limits<int32_t>::max()) {
+                PyErr_SetString(PyExc_OverflowError, "get_handles: index out of range");
+                Py_DECREF(seq);
+                return NULL;
+            }
+            if (parent) {
+                hdl = gpi_get_handle_by_index(parent, static_cast<int32_t>(index));
+            }
+        } else {
+            PyErr_Format(PyExc_TypeError,
+                "get_handles: expected str or int as key, not %.200s",
+                Py_TYPE(key)->tp_name);
+            Py_DECREF(seq);
+            return NULL;
+        }
+        found.push_back(hdl);
+    }
+
+    Py_DECREF(seq);
+
+    PyObject *result = PyList_New(n);
+    if (!result) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *hdl_obj = gpi_hdl_New(found[static_cast<size_t>(i)]);
+        if (!hdl_obj) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, hdl_obj);
+    }
+    return result;
+}
+
+static PyObject *set_signal_values(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    PyObject *writes;
+
+    if (!PyArg_ParseTuple(args, "O:set_signal_values", &writes)) {
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(writes, "set_signal_values: writes must be a sequence");
+    if (!seq) {
+        return NULL;
+    }
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        gpi_hdl_Object<gpi_sim_hdl> *pSigHdl;
+        int kind;
+        gpi_set_action_t action;
+        PyObject *value;
+
+        if (!PyTuple_Check(items[i])) {
+            PyErr_Format(PyExc_TypeError,
+                "set_signal_values: expected a tuple of (handle, kind, action, value), not %.200s",
+                Py_TYPE(items[i])->tp_name);
+            Py_DECREF(seq);
+            return NULL;
+        }
+
+        if (!PyArg_ParseTuple(items[i], "O!iiO:set_signal_values",
+                              &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl, &kind, &action, &value)) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+
+        // Apply the write like the set_signal_val_* method it was queued with
+        switch (kind) {
+            case SET_INT: {
+                long long int_value = PyLong_AsLongLong(value);
+                if (int_value == -1 && PyErr_Occurred()) {
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                gpi_set_signal_value_int(pSigHdl->hdl, static_cast<int32_t>(int_value), action);
+                break;
+            }
+            case SET_VECTOR:
+                if (!PyLong_Check(value)) {
+                    PyErr_Format(PyExc_TypeError,
+                        "set_signal_values: expected an int for set_signal_val_vector, not %.200s",
+                        Py_TYPE(value)->tp_name);
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                if (set_signal_value_from_long(pSigHdl->hdl, value, action) < 0) {
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                break;
+            case SET_BINSTR: {
+                const char *binstr = PyUnicode_AsUTF8(value);
+                if (!binstr) {
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                gpi_set_signal_value_binstr(pSigHdl->hdl, binstr, action);
+                break;
+            }
+            case SET_STR: {
+                const char *str = PyBytes_AsString(value);
+                if (!str) {
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                gpi_set_signal_value_str(pSigHdl->hdl, str, action);
+                break;
+            }
+            case SET_REAL: {
+                double real_value = PyFloat_AsDouble(value);
+                if (real_value == -1.0 && PyErr_Occurred()) {
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+                gpi_set_signal_value_real(pSigHdl->hdl, real_value, action);
+                break;
+            }
+            default:
+                PyErr_Format(PyExc_ValueError, "set_signal_values: unknown write kind %d", kind);
+                Py_DECREF(seq);
+                return NULL;
+        }
+    }
+
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
 
 static PyObject *deregister(gpi_hdl_Object<gpi_cb_hdl> *self, PyObject *args)
 {
     COCOTB_UNUSED(args);
 
+    callback_data *cb_data = (callback_data *)gpi_get_callback_data(self->hdl);
     gpi_deregister_callback(self->hdl);
 
+    // A callback which is running is released by handle_gpi_callback when it returns
+    if (cb_data != NULL && cb_data->id_value == COCOTB_ACTIVE_ID && cb_data->cb_hdl == self->hdl) {
+        callback_data_release(cb_data);
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+static PyObject *clock_create(PyObject *self, PyObject *args)
+{
+    COCOTB_UNUSED(self);
+
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    gpi_hdl_Object<gpi_sim_hdl> *pSigHdl;
+
+    if (!PyArg_ParseTuple(args, "O!:clock_create", &gpi_hdl_Object<gpi_sim_hdl>::py_type, &pSigHdl)) {
+        return NULL;
+    }
+
+    gpi_clk_hdl hdl = gpi_clock_create(pSigHdl->hdl);
+
+    return gpi_hdl_New(hdl);
+}
+
+
+static PyObject *clock_start(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args)
+{
+    unsigned long long period;
+    unsigned long long high;
+    int start_high;
+    unsigned long long cycles;
+
+    if (!PyArg_ParseTuple(args, "KKpK:start", &period, &high, &start_high, &cycles)) {
+        return NULL;
+    }
+
+    if (gpi_clock_start(self->hdl, period, high, start_high, cycles)) {
+        PyErr_SetString(PyExc_RuntimeError, "Unable to start the clock");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+static PyObject *clock_stop(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args)
+{
+    COCOTB_UNUSED(args);
+
+    gpi_clock_stop(self->hdl);
+
     Py_RETURN_NONE;
 }
 
 
+static PyObject *clock_set_period(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args)
+{
+    unsigned long long period;
+    unsigned long long high;
+
+    if (!PyArg_ParseTuple(args, "KK:set_period", &period, &high)) {
+        return NULL;
+    }
+
+    if (gpi_clock_set_period(self->hdl, period, high)) {
+        PyErr_SetString(PyExc_ValueError, "Clock high time must be between 0 and the period");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+static PyObject *clock_is_running(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args)
+{
+    COCOTB_UNUSED(args);
+
+    return PyBool_FromLong(gpi_clock_is_running(self->hdl));
+}
+
+
+static void clock_dealloc(gpi_hdl_Object<gpi_clk_hdl> *self)
+{
+    gpi_clock_destroy(self->hdl);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+
 static PyObject *log_level(PyObject *self, PyObject *args)
 {
     COCOTB_UNUSED(self);
@@ -935,6 +1714,11 @@ static int add_module_constants(PyObject* simulator)
         PyModule_AddIntConstant(simulator, "OBJECTS",   GPI_OBJECTS   ) < 0 ||
         PyModule_AddIntConstant(simulator, "DRIVERS",   GPI_DRIVERS   ) < 0 ||
         PyModule_AddIntConstant(simulator, "LOADS",     GPI_LOADS     ) < 0 ||
+        PyModule_AddIntConstant(simulator, "SET_INT",    SET_INT      ) < 0 ||
+        PyModule_AddIntConstant(simulator, "SET_VECTOR", SET_VECTOR   ) < 0 ||
+        PyModule_AddIntConstant(simulator, "SET_BINSTR", SET_BINSTR   ) < 0 ||
+        PyModule_AddIntConstant(simulator, "SET_STR",    SET_STR      ) < 0 ||
+        PyModule_AddIntConstant(simulator, "SET_REAL",   SET_REAL     ) < 0 ||
         false
     ) {
         return -1;
@@ -969,6 +1753,13 @@ static int add_module_types(PyObject* simulator)
         return -1;
     }
 
+    typ = (PyObject *)&gpi_hdl_Object<gpi_clk_hdl>::py_type;
+    Py_INCREF(typ);
+    if (PyModule_AddObject(simulator, "gpi_clk_hdl", typ) < 0) {
+        Py_DECREF(typ);
+        return -1;
+    }
+
     return 0;
 }
 
@@ -1005,6 +1796,16 @@ static PyMethodDef SimulatorMethods[] = {
         "register_value_change_callback(signal: cocotb.simulator.gpi_sim_hdl, func: Callable[..., None], edge: int, *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
         "Register a signal change callback."
     )},
+    {"register_edge_count_callback", register_edge_count_callback, METH_VARARGS, PyDoc_STR(
+        "register_edge_count_callback(signal, func, edge, count, /, *args)\n"
+        "--\n\n"
+        "register_edge_count_callback(signal: cocotb.simulator.gpi_sim_hdl, func: Callable[..., None], edge: int, count: int, *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
+        "Register a callback that fires once *count* edges of *signal* have been seen.\n"
+        "\n"
+        "*edge* selects the edges that are counted, as for :func:`register_value_change_callback`.\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
     {"register_readonly_callback", register_readonly_callback, METH_VARARGS, PyDoc_STR(
         "register_readonly_callback(func, /, *args)\n"
         "--\n\n"
@@ -1023,12 +1824,67 @@ static PyMethodDef SimulatorMethods[] = {
         "register_rwsynch_callback(func: Callable[..., None], *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
         "Register a callback for the read-write section."
     )},
+    {"clock_create", clock_create, METH_VARARGS, PyDoc_STR(
+        "clock_create(signal, /)\n"
+        "--\n\n"
+        "clock_create(signal: cocotb.simulator.gpi_sim_hdl) -> cocotb.simulator.gpi_clk_hdl\n"
+        "Create a native clock generator driving *signal*.\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
     {"stop_simulator", stop_simulator, METH_VARARGS, PyDoc_STR(
         "stop_simulator()\n"
         "--\n\n"
         "stop_simulator() -> None\n"
         "Instruct the attached simulator to stop. Users should not call this function."
     )},
+    {"get_signal_values", get_signal_values, METH_VARARGS, PyDoc_STR(
+        "get_signal_values(handles, format='binstr', /)\n"
+        "--\n\n"
+        "get_signal_values(handles: Sequence[cocotb.simulator.gpi_sim_hdl], format: str = 'binstr') -> Union[List[str], List[int], bytes]\n"
+        "Read the values of several signals at once.\n"
+        "\n"
+        "With *format* ``'binstr'``, return a list of binary strings as from\n"
+        ":meth:`gpi_sim_hdl.get_signal_val_binstr`.\n"
+        "With *format* ``'int'``, return a list of unsigned integers.\n"
+        "With *format* ``'bytes'``, return a single buffer in which each value is packed\n"
+        "big-endian into a whole number of bytes, in the order of *handles*.\n"
+        "The ``'int'`` and ``'bytes'`` formats raise :exc:`ValueError` if a value\n"
+        "contains any bits other than ``0`` and ``1``.\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
+    {"get_handles", get_handles, METH_VARARGS, PyDoc_STR(
+        "get_handles(lookups, /)\n"
+        "--\n\n"
+        "get_handles(lookups: Sequence[Tuple[Union[cocotb.simulator.gpi_sim_hdl, int], Union[str, int]]]) -> List[Optional[cocotb.simulator.gpi_sim_hdl]]\n"
+        "Look up several handles at once.\n"
+        "\n"
+        "Each lookup is a ``(parent, key)`` tuple. *parent* is either a handle or the\n"
+        "position of an earlier lookup in *lookups*, whose result is used as the parent.\n"
+        "A :class:`str` *key* is looked up as by :meth:`gpi_sim_hdl.get_handle_by_name`,\n"
+        "an :class:`int` *key* as by :meth:`gpi_sim_hdl.get_handle_by_index`.\n"
+        "The result of each lookup is a handle, or ``None`` if the object was not found\n"
+        "or its parent was not found.\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
+    {"set_signal_values", set_signal_values, METH_VARARGS, PyDoc_STR(
+        "set_signal_values(writes, /)\n"
+        "--\n\n"
+        "set_signal_values(writes: Sequence[Tuple[cocotb.simulator.gpi_sim_hdl, int, int, Union[int, str, bytes, float]]]) -> None\n"
+        "Apply a batch of signal writes in order.\n"
+        "\n"
+        "Each write is a ``(handle, kind, action, value)`` tuple. *kind* selects\n"
+        "the equivalent of :meth:`gpi_sim_hdl.set_signal_val_int` (:data:`SET_INT`),\n"
+        ":meth:`gpi_sim_hdl.set_signal_val_vector` (:data:`SET_VECTOR`),\n"
+        ":meth:`gpi_sim_hdl.set_signal_val_binstr` (:data:`SET_BINSTR`),\n"
+        ":meth:`gpi_sim_hdl.set_signal_val_str` (:data:`SET_STR`) or\n"
+        ":meth:`gpi_sim_hdl.set_signal_val_real` (:data:`SET_REAL`).\n"
+        "If a write is invalid, the writes before it have already been applied.\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
     {"log_level", log_level, METH_VARARGS, PyDoc_STR(
         "log_level(level, /)\n"
         "--\n\n"
@@ -1059,6 +1915,19 @@ static PyMethodDef SimulatorMethods[] = {
         "\n"
         "For example, if ``-12`` is returned, the simulator's time precision is 10**-12 or 1 ps."
     )},
+    {"get_handle_store_stats", get_handle_store_stats, METH_NOARGS, PyDoc_STR(
+        "get_handle_store_stats()\n"
+        "--\n\n"
+        "get_handle_store_stats() -> Dict[str, int]\n"
+        "Get the counters of the GPI object handle store, for diagnostics.\n"
+        "\n"
+        "The counters are the number of unique ``handles``, the number of handles created again and "
+        "replaced by the stored one (``duplicates``), the number of names in the per-parent child "
+        "name index (``index_entries``), and how many lookups by name were answered from the index "
+        "(``index_hits``) or resolved through the simulator (``index_misses``).\n"
+        "\n"
+        ".. versionadded:: 1.5"
+    )},
     {"get_simulator_product", get_simulator_product, METH_NOARGS, PyDoc_STR(
         "get_simulator_product()\n"
         "--\n\n"
@@ -1105,6 +1974,9 @@ PyMODINIT_FUNC PyInit_simulator(void)
     if (PyType_Ready(&gpi_hdl_Object<gpi_iterator_hdl>::py_type) < 0) {
         return NULL;
     }
+    if (PyType_Ready(&gpi_hdl_Object<gpi_clk_hdl>::py_type) < 0) {
+        return NULL;
+    }
 
     PyObject* simulator = PyModule_Create(&moduledef);
     if (simulator == NULL) {
@@ -1140,6 +2012,19 @@ static PyMethodDef gpi_sim_hdl_methods[] = {
             "Get the value of a signal as an integer."
         )
     },
+    {"get_signal_val_vector",
+        (PyCFunction)get_signal_val_vector, METH_NOARGS, PyDoc_STR(
+            "get_signal_val_vector($self)\n"
+            "--\n\n"
+            "get_signal_val_vector() -> Tuple[int, int, int]\n"
+            "Get the value of a logic vector of any width as an unsigned integer,\n"
+            "together with a mask of the bits that are not ``0`` or ``1``\n"
+            "and the width of the vector in bits.\n"
+            "The bits that are not ``0`` or ``1`` are cleared in the value.\n"
+            "\n"
+            ".. versionadded:: 1.5"
+        )
+    },
     {"get_signal_val_str",
         (PyCFunction)get_signal_val_str, METH_NOARGS, PyDoc_STR(
             "get_signal_val_str($self)\n"
@@ -1195,6 +2080,16 @@ static PyMethodDef gpi_sim_hdl_methods[] = {
             "Set the value of a signal using a float."
         )
     },
+    {"set_signal_val_vector",
+        (PyCFunction)set_signal_val_vector, METH_VARARGS, PyDoc_STR(
+            "set_signal_val_vector($self, action, value, /)\n"
+            "--\n\n"
+            "set_signal_val_vector(action: int, value: int) -> None\n"
+            "Set the value of a logic vector of any width using a non-negative integer.\n"
+            "\n"
+            ".. versionadded:: 1.5"
+        )
+    },
     {"get_definition_name",
         (PyCFunction)get_definition_name, METH_NOARGS, PyDoc_STR(
             "get_definition_name($self)\n"
@@ -1323,7 +2218,53 @@ template<>
 PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type = []() -> PyTypeObject {
     auto type = fill_common_slots<gpi_cb_hdl>();
     type.tp_name = "cocotb.simulator.gpi_cb_hdl";
+    type.tp_dealloc = gpi_cb_hdl_dealloc;
     type.tp_doc = "GPI callback handle";
     type.tp_methods = gpi_cb_hdl_methods;
     return type;
 }();
+
+static PyMethodDef gpi_clk_hdl_methods[] = {
+    {"start",
+        (PyCFunction)clock_start, METH_VARARGS, PyDoc_STR(
+            "start($self, period, high, start_high, cycles, /)\n"
+            "--\n\n"
+            "start(period: int, high: int, start_high: bool, cycles: int) -> None\n"
+            "Start driving the clock signal.\n"
+            "\n"
+            "*period* and *high* are in simulator steps. "
+            "A *cycles* count of ``0`` runs the clock until :meth:`stop` is called."
+        )},
+    {"stop",
+        (PyCFunction)clock_stop, METH_NOARGS, PyDoc_STR(
+            "stop($self)\n"
+            "--\n\n"
+            "stop() -> None\n"
+            "Stop driving the clock signal."
+        )},
+    {"set_period",
+        (PyCFunction)clock_set_period, METH_VARARGS, PyDoc_STR(
+            "set_period($self, period, high, /)\n"
+            "--\n\n"
+            "set_period(period: int, high: int) -> None\n"
+            "Change the clock period, taking effect at the next edge."
+        )},
+    {"is_running",
+        (PyCFunction)clock_is_running, METH_NOARGS, PyDoc_STR(
+            "is_running($self)\n"
+            "--\n\n"
+            "is_running() -> bool\n"
+            "Return ``True`` if the clock is currently being driven."
+        )},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+template<>
+PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type = []() -> PyTypeObject {
+    auto type = fill_common_slots<gpi_clk_hdl>();
+    type.tp_name = "cocotb.simulator.gpi_clk_hdl";
+    type.tp_doc = "GPI native clock handle";
+    type.tp_methods = gpi_clk_hdl_methods;
+    type.tp_dealloc = (destructor)clock_dealloc;
+    return type;
+}();
@@ -375,6 +375,52 @@ int VpiSignalObjHdl::set_signal_value_str(std::string &value, gpi_set_action_t a
     return set_signal_value(value_s, action);
 }
 
+int VpiSignalObjHdl::get_signal_value_vector(uint32_t *value, uint32_t *unknown, size_t n_words)
+{
+    vpiHandle hdl = GpiObjHdl::get_handle<vpiHandle>();
+    s_vpi_value value_s = {vpiVectorVal, {NULL}};
+
+    vpi_get_value(hdl, &value_s);
+    check_vpi_error();
+    if (!value_s.value.vector) {
+        return -1;
+    }
+
+    // aval/bval encode each bit as 0: 0/0, 1: 1/0, z: 0/1, x: 1/1
+    size_t n_bits = static_cast<size_t>(vpi_get(vpiSize, hdl));
+    size_t n_vec = (n_bits + 31) / 32;
+    for (size_t i = 0; i < n_words; i++) {
+        if (i < n_vec) {
+            uint32_t aval = static_cast<uint32_t>(value_s.value.vector[i].aval);
+            uint32_t bval = static_cast<uint32_t>(value_s.value.vector[i].bval);
+            uint32_t mask = (i == n_vec - 1 && n_bits % 32) ? (1u << (n_bits % 32)) - 1 : ~0u;
+            value[i] = aval & ~bval & mask;
+            unknown[i] = bval & mask;
+        } else {
+            value[i] = 0;
+            unknown[i] = 0;
+        }
+    }
+    return static_cast<int>(n_bits);
+}
+
+int VpiSignalObjHdl::set_signal_value_vector(const uint32_t *value, size_t n_words, gpi_set_action_t action)
+{
+    size_t n_bits = static_cast<size_t>(vpi_get(vpiSize, GpiObjHdl::get_handle<vpiHandle>()));
+    std::vector<s_vpi_vecval> vector((n_bits + 31) / 32);
+
+    for (size_t i = 0; i < vector.size(); i++) {
+        vector[i].aval = static_cast<PLI_INT32>(i < n_words ? value[i] : 0);
+        vector[i].bval = 0;
+    }
+
+    s_vpi_value value_s;
+    value_s.value.vector = vector.data();
+    value_s.format = vpiVectorVal;
+
+    return set_signal_value(value_s, action);
+}
+
 int VpiSignalObjHdl::set_signal_value(s_vpi_value value_s, gpi_set_action_t action)
 {
     PLI_INT32 vpi_put_flag = -1;
@@ -183,6 +183,8 @@ public:
     int set_signal_value(const double value, gpi_set_action_t action) override;
     int set_signal_value_binstr(std::string &value, gpi_set_action_t action) override;
     int set_signal_value_str(std::string &value, gpi_set_action_t action) override;
+    int get_signal_value_vector(uint32_t *value, uint32_t *unknown, size_t n_words) override;
+    int set_signal_value_vector(const uint32_t *value, size_t n_words, gpi_set_action_t action) override;
 
     /* Value change callback accessor */
     GpiCbHdl *value_change_cb(int edge) override;
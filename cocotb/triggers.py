@@ -28,14 +28,17 @@
 """A collections of triggers which a testbench can await."""
 
 import abc
+import heapq
+import itertools
 import warnings
 from collections.abc import Awaitable
 
 from cocotb import simulator
+from cocotb.handle import _gpi_handle
 from cocotb.log import SimLog
 from cocotb.utils import (
     get_sim_steps, get_time_from_sim_steps, ParametrizedSingleton,
-    lazy_property, remove_traceback_frames,
+    lazy_property, remove_traceback_frames, _get_sim_time_cached,
 )
 from cocotb import outcomes
 import cocotb
@@ -155,8 +158,124 @@ class GPITrigger(Trigger):
         Trigger.unprime(self)
 
 
+class _TimerEntry:
+    """A :class:`Timer` waiting in the :class:`_TimerQueue`.
+
+    This takes the place of the simulator callback handle of the timer.
+    """
+    __slots__ = ('timer', 'callback')
+
+    def __init__(self, timer, callback):
+        self.timer = timer
+        self.callback = callback
+
+    def deregister(self):
+        if self.timer is not None:
+            self.timer = self.callback = None
+            _timer_queue.removed()
+
+
+class _TimerQueue:
+    """The primed :class:`Timer` triggers, ordered by the time at which they expire.
+
+    Only the earliest expiry time has a callback registered with the simulator.
+    The timers which expire at the same time all fire from that one callback,
+    in the order in which they were primed, which is the order in which the
+    simulator would have called their own callbacks.
+    """
+
+    def __init__(self):
+        self._heap = []  # (expiry time in steps, sequence number, _TimerEntry)
+        self._sequence = itertools.count()
+        self._n_entries = 0  # entries in the heap which have not been deregistered
+        self._cbhdl = None
+        self._cb_time = None  # the time at which _cbhdl fires
+        self._firing = False
+
+    def add(self, timer, callback):
+        """Return the entry of *timer*, which calls *callback* when it expires."""
+        now = _sim_steps_now()
+        entry = _TimerEntry(timer, callback)
+        heapq.heappush(self._heap, (now + timer.sim_steps, next(self._sequence), entry))
+        self._n_entries += 1
+        if not self._firing:
+            self._arm(now)
+        return entry
+
+    def removed(self):
+        """Called when an entry is deregistered, it stays in the heap until it comes to the front."""
+        self._n_entries -= 1
+        if self._n_entries == 0 and not self._firing:
+            self._heap.clear()
+            self._disarm()
+
+    def _arm(self, now):
+        """Make sure that the simulator calls back at the earliest expiry time."""
+        heap = self._heap
+        while heap and heap[0][2].timer is None:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+
+        expiry = heap[0][0]
+        if self._cbhdl is not None:
+            if self._cb_time <= expiry:
+                return
+            self._cbhdl.deregister()
+        self._cbhdl = simulator.register_timed_callback(expiry - now, self._fire)
+        if self._cbhdl is None:
+            raise TriggerException("Unable set up %s Trigger" % (str(heap[0][2].timer)))
+        self._cb_time = expiry
+
+    def _disarm(self):
+        if self._cbhdl is not None:
+            self._cbhdl.deregister()
+            self._cbhdl = None
+
+    def _fire(self):
+        self._cbhdl = None
+        now = _sim_steps_now()
+
+        # Timers primed by the callbacks expire in a later simulator callback
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expired.append(heapq.heappop(heap)[2])
+
+        self._firing = True
+        try:
+            for entry in expired:
+                timer, callback = entry.timer, entry.callback
+                if timer is None:
+                    # deregistered, possibly by an earlier callback
+                    continue
+                entry.timer = entry.callback = None
+                self._n_entries -= 1
+                timer.cbhdl = None
+                callback(timer)
+        finally:
+            self._firing = False
+
+        if self._n_entries == 0:
+            heap.clear()
+        else:
+            self._arm(now)
+
+
+def _sim_steps_now():
+    return _get_sim_time_cached()
+
+
+_timer_queue = _TimerQueue()
+
+
 class Timer(GPITrigger):
-    """Fires after the specified simulation time period has elapsed."""
+    """Fires after the specified simulation time period has elapsed.
+
+    The simulator only calls back at the earliest time at which a timer
+    expires, so any number of timers can be pending at little cost.
+    """
 
     def __init__(self, time_ps, units="step"):
         """
@@ -227,10 +346,7 @@ class Timer(GPITrigger):
     def prime(self, callback):
         """Register for a timed callback."""
         if self.cbhdl is None:
-            self.cbhdl = simulator.register_timed_callback(self.sim_steps,
-                                                           callback, self)
-            if self.cbhdl is None:
-                raise TriggerException("Unable set up %s Trigger" % (str(self)))
+            self.cbhdl = _timer_queue.add(self, callback)
         GPITrigger.prime(self, callback)
 
     def __repr__(self):
@@ -343,7 +459,7 @@ class _EdgeBase(GPITrigger, metaclass=_ParameterizedSingletonAndABC):
         """Register notification of a value change via a callback"""
         if self.cbhdl is None:
             self.cbhdl = simulator.register_value_change_callback(
-                self.signal._handle, callback, type(self)._edge_type, self
+                _gpi_handle(self.signal), callback, type(self)._edge_type, self
             )
             if self.cbhdl is None:
                 raise TriggerException("Unable set up %s Trigger" % (str(self)))
@@ -842,6 +958,34 @@ class First(_AggregateWaitable):
         return await first_trigger  # the first of multiple triggers that fired
 
 
+class _EdgeCount(GPITrigger):
+    """Fires once *count* edges of type *edge_type* of *signal* have been seen.
+
+    The edges are counted in the GPI, so the edges before the last one never
+    enter Python.
+    """
+    __slots__ = ('signal', 'count', 'edge_type')
+
+    def __init__(self, signal, count, edge_type):
+        super().__init__()
+        self.signal = signal
+        self.count = count
+        self.edge_type = edge_type
+
+    def prime(self, callback):
+        if self.cbhdl is None:
+            self.cbhdl = simulator.register_edge_count_callback(
+                _gpi_handle(self.signal), callback, self.edge_type, self.count, self
+            )
+            if self.cbhdl is None:
+                raise TriggerException("Unable set up %s Trigger" % (str(self)))
+        super().prime(callback)
+
+    def __repr__(self):
+        return "{}({!r}, {!r}, {!r})".format(
+            type(self).__qualname__, self.signal, self.count, self.edge_type)
+
+
 class ClockCycles(Waitable):
     """Fires after *num_cycles* transitions of *signal* from ``0`` to ``1``."""
 
@@ -861,9 +1005,8 @@ class ClockCycles(Waitable):
             self._type = FallingEdge
 
     async def _wait(self):
-        trigger = self._type(self.signal)
-        for _ in range(self.num_cycles):
-            await trigger
+        if self.num_cycles > 0:
+            await _EdgeCount(self.signal, self.num_cycles, self._type._edge_type)
         return self
 
     def __repr__(self):
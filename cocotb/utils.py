@@ -77,6 +77,34 @@ def get_sim_time(units=None):
     return result
 
 
+# While the scheduler reacts to a simulator callback the time cannot change, so
+# it is fetched at most once. _UNKNOWN_TIME until then, None outside of callbacks.
+_UNKNOWN_TIME = object()
+_cached_sim_time = None
+
+
+def _freeze_sim_time():
+    """Called by the scheduler when it starts reacting to a simulator callback."""
+    global _cached_sim_time
+    _cached_sim_time = _UNKNOWN_TIME
+
+
+def _thaw_sim_time():
+    """Called by the scheduler when it hands control back to the simulator."""
+    global _cached_sim_time
+    _cached_sim_time = None
+
+
+def _get_sim_time_cached():
+    """Like :func:`get_sim_time`, without calling into the simulator more than once per callback."""
+    global _cached_sim_time
+    if _cached_sim_time is None:
+        return get_sim_time()
+    if _cached_sim_time is _UNKNOWN_TIME:
+        _cached_sim_time = get_sim_time()
+    return _cached_sim_time
+
+
 def _ldexp10(frac, exp):
     """ Like math.ldexp, but base 10 """
     # using * or / separately prevents rounding errors if `frac` is a
@@ -439,6 +439,7 @@ def _get_common_lib_ext(include_dir, share_lib_dir):
     #
     libgpi_sources=[
         os.path.join(share_lib_dir, "gpi", "GpiCbHdl.cpp"),
+        os.path.join(share_lib_dir, "gpi", "GpiClock.cpp"),
         os.path.join(share_lib_dir, "gpi", "GpiCommon.cpp"),
     ]
     if os.name == "nt":
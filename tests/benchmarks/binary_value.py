@@ -0,0 +1,60 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Micro-benchmark of :class:`~cocotb.binary.BinaryValue` conversions.
+
+This does not need a simulator::
+
+    python tests/benchmarks/binary_value.py [--json FILE]
+"""
+import random
+
+from cocotb.binary import BinaryValue, BinaryRepresentation
+
+from results import Results, rate
+
+WIDTHS = [8, 64, 1024]
+
+
+def _repeat(n, func):
+    for _ in range(n):
+        func()
+
+
+def run(results, n_ops=20000):
+    rng = random.Random(0)
+    for n_bits in WIDTHS:
+        value = rng.getrandbits(n_bits)
+        binstr = format(value, "0{}b".format(n_bits))
+        buff = value.to_bytes(n_bits // 8, "big")
+        bv = BinaryValue(value, n_bits=n_bits)
+        signed = BinaryValue(value >> 1, n_bits=n_bits,
+                             binaryRepresentation=BinaryRepresentation.TWOS_COMPLEMENT)
+
+        cases = [
+            ("from_int", lambda: BinaryValue(value, n_bits=n_bits)),
+            ("from_binstr", lambda: BinaryValue(binstr, n_bits=n_bits)),
+            ("from_buff", lambda: BinaryValue(buff, n_bits=n_bits)),
+            ("to_int", lambda: bv.integer),
+            ("to_signed_int", lambda: signed.integer),
+            ("to_binstr", lambda: BinaryValue(value, n_bits=n_bits).binstr),
+            ("to_buff", lambda: bv.buff),
+            ("is_resolvable", lambda: bv.is_resolvable),
+        ]
+        for name, func in cases:
+            results.add(name, rate(n_ops, _repeat, n_ops, func), "ops/s", n_bits=n_bits)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="append the results to this file as JSON lines")
+    args = parser.parse_args()
+
+    results = Results("binary_value", args.json)
+    run(results)
+
+
+if __name__ == "__main__":
+    main()
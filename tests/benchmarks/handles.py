@@ -0,0 +1,138 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Micro-benchmark of handle discovery on a large hierarchy.
+
+The GPI handles are replaced by mocks, so this measures the cost of the Python
+handle objects alone, in time and in memory::
+
+    python tests/benchmarks/handles.py [--json FILE]
+
+``discover_cached`` walks the same hierarchy when it is read from a
+:envvar:`COCOTB_HIERARCHY_CACHE` file. As the mocked GPI calls cost next to
+nothing, this only shows the overhead of the cache in Python.
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import cocotb.handle
+from cocotb import simulator
+from cocotb._hierarchy_cache import HierarchyCache
+from cocotb.handle import SimHandle
+
+from hierarchy import _walk
+from results import Results
+
+
+class _MockGpiHandle:
+    """Stands in for a :class:`~cocotb.simulator.gpi_sim_hdl`."""
+
+    def __init__(self, name, gpi_type, children=()):
+        self._name = name
+        self._type = gpi_type
+        self._children = children
+
+    def get_name_string(self):
+        return self._name
+
+    def get_type_string(self):
+        return "GPI_MODULE" if self._type == simulator.MODULE else "GPI_NET"
+
+    def get_type(self):
+        return self._type
+
+    def get_const(self):
+        return False
+
+    def get_definition_name(self):
+        return ""
+
+    def get_definition_file(self):
+        return ""
+
+    def get_range(self):
+        return (7, 0)
+
+    def get_num_elems(self):
+        return 8
+
+    def iterate(self, mode):
+        return iter(self._children)
+
+    def get_handle_by_name(self, name):
+        for child in self._children:
+            if child._name == name:
+                return child
+        return None
+
+
+def _make_design(n_modules, n_signals):
+    modules = [
+        _MockGpiHandle("u_%d" % m, simulator.MODULE, [
+            _MockGpiHandle("sig_%d" % s, simulator.NET) for s in range(n_signals)
+        ])
+        for m in range(n_modules)
+    ]
+    return _MockGpiHandle("top", simulator.MODULE, modules)
+
+
+def bench_discovery(n_modules, n_signals):
+    """Return the handles discovered per second and the bytes allocated per handle."""
+    start = time.perf_counter()
+    n_handles = _walk(SimHandle(_make_design(n_modules, n_signals)))
+    elapsed = time.perf_counter() - start
+
+    design = _make_design(n_modules, n_signals)
+    tracemalloc.start()
+    _walk(SimHandle(design))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return n_handles / elapsed, allocated / n_handles
+
+
+def bench_cached_discovery(n_modules, n_signals):
+    """Return the handles discovered per second from a hierarchy cache."""
+    key = {"toplevel": "top"}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "hierarchy.json")
+        try:
+            cocotb.handle._hierarchy_cache = HierarchyCache(filename, key)
+            _walk(SimHandle(_make_design(n_modules, n_signals)))
+            cocotb.handle._hierarchy_cache.save()
+
+            cocotb.handle._hierarchy_cache = HierarchyCache.load(filename, key)
+            root = SimHandle(_make_design(n_modules, n_signals))
+            start = time.perf_counter()
+            n_handles = _walk(root)
+            elapsed = time.perf_counter() - start
+        finally:
+            cocotb.handle._hierarchy_cache = None
+
+    return n_handles / elapsed
+
+
+def run(results, sizes=((10, 100), (100, 1000))):
+    for n_modules, n_signals in sizes:
+        rate, size = bench_discovery(n_modules, n_signals)
+        params = dict(modules=n_modules, signals=n_signals)
+        results.add("discover", rate, "handles/s", **params)
+        results.add("memory", size, "B/handle", **params)
+        results.add("discover_cached", bench_cached_discovery(n_modules, n_signals),
+                    "handles/s", **params)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="append the results to this file as JSON lines")
+    args = parser.parse_args()
+
+    run(Results("handles", args.json))
+
+
+if __name__ == "__main__":
+    main()
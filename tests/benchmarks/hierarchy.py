@@ -0,0 +1,41 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Measurement of handle discovery, shared by the simulator benchmarks."""
+import resource
+import time
+
+from cocotb.handle import HierarchyObject, HierarchyArrayObject
+
+
+def _walk(handle):
+    """Return the number of handles below *handle*, discovering all of them."""
+    count = 0
+    for child in handle:
+        count += 1
+        if isinstance(child, (HierarchyObject, HierarchyArrayObject)):
+            count += _walk(child)
+    return count
+
+
+def measure_discovery(dut, results):
+    """Walk the whole hierarchy of *dut* twice, first discovering it and then from the cache.
+
+    The growth of the peak resident set size during the discovery is reported
+    too, as it includes the memory allocated by the GPI.
+    """
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    n_handles = _walk(dut)
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    params = dict(toplevel=dut._name, handles=n_handles)
+    results.add("hierarchy_discover", n_handles / elapsed, "handles/s", **params)
+    # ru_maxrss is in KiB on Linux
+    results.add("hierarchy_rss_growth", rss_after - rss_before, "KiB", **params)
+
+    start = time.perf_counter()
+    _walk(dut)
+    elapsed = time.perf_counter() - start
+    results.add("hierarchy_cached", n_handles / elapsed, "handles/s", **params)
@@ -0,0 +1,65 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Collection of benchmark results.
+
+Every result is printed as it is measured. If a file name is given, either
+through ``--json FILE`` on the command line of the standalone benchmarks or the
+``COCOTB_BENCHMARK_RESULTS`` environment variable, the results are also
+appended to it as JSON lines, one object per result::
+
+    {"suite": "binary_value", "benchmark": "from_int", "params": {"n_bits": 64},
+     "value": 1234567.0, "unit": "ops/s", "cocotb": "1.5.0.dev0", "python": "3.8.5",
+     "simulator": null, "time": 1601234567.0}
+
+Higher values are better for the rates (units ending in ``/s``) and lower
+values are better for the memory sizes (``KiB`` and ``B/handle``).
+"""
+import json
+import os
+import platform
+import sys
+import time
+
+import cocotb
+
+
+class Results:
+    """Results of one benchmark suite."""
+
+    def __init__(self, suite, filename=None):
+        self.suite = suite
+        self.filename = filename or os.getenv("COCOTB_BENCHMARK_RESULTS")
+        self.rows = []
+
+    def add(self, benchmark, value, unit, **params):
+        """Record the *value* measured by *benchmark* with the given parameters."""
+        row = {
+            "suite": self.suite,
+            "benchmark": benchmark,
+            "params": params,
+            "value": value,
+            "unit": unit,
+            "cocotb": cocotb.__version__,
+            "python": platform.python_version(),
+            "simulator": cocotb.SIM_NAME,
+            "time": time.time(),
+        }
+        self.rows.append(row)
+        param_str = " ".join("{}={}".format(k, v) for k, v in params.items())
+        print("{:<16} {:<24} {:<32} {:>16.1f} {}".format(
+            self.suite, benchmark, param_str, value, unit))
+        sys.stdout.flush()
+
+        # Appended straight away, so the results survive a crashing simulator
+        if self.filename:
+            with open(self.filename, "a") as f:
+                f.write(json.dumps(row) + "\n")
+
+
+def rate(n_ops, func, *args):
+    """Return how many operations per second *func* performs, when a call does *n_ops*."""
+    start = time.perf_counter()
+    func(*args)
+    return n_ops / (time.perf_counter() - start)
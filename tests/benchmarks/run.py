@@ -0,0 +1,40 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Run all the benchmarks that do not need a simulator::
+
+    python tests/benchmarks/run.py [--json FILE]
+
+The benchmarks that run in a simulator live in the ``sim_*`` directories
+next to this file and are run with ``make`` like the tests in ``tests/test_cases``::
+
+    make -C tests/benchmarks/sim_runtime SIM=icarus COCOTB_BENCHMARK_RESULTS=$PWD/results.json
+"""
+import argparse
+
+import binary_value
+import handles
+import scheduler_gpi
+import scheduler_waiters
+from results import Results
+
+SUITES = [
+    ("binary_value", binary_value),
+    ("handles", handles),
+    ("scheduler_gpi", scheduler_gpi),
+    ("scheduler_waiters", scheduler_waiters),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="append the results to this file as JSON lines")
+    args = parser.parse_args()
+
+    for name, module in SUITES:
+        module.run(Results(name, args.json))
+
+
+if __name__ == "__main__":
+    main()
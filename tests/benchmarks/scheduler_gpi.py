@@ -0,0 +1,198 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Micro-benchmark of the Python side of GPI triggers and signal writes.
+
+The ``simulator`` module is replaced by a mock that only records the callbacks
+and writes, so this measures the cost of the scheduler alone::
+
+    python tests/benchmarks/scheduler_gpi.py [--json FILE]
+
+The cases are:
+
+* ``timer_wakes``: tasks repeatedly awaiting a :class:`~cocotb.triggers.Timer`.
+* ``edge_wakes``: tasks waiting on the same :class:`~cocotb.triggers.RisingEdge`.
+* ``write_flush``: values written to signals and applied in one flush in the read-write phase.
+"""
+import contextlib
+import importlib
+
+import cocotb.triggers
+import cocotb.utils
+from cocotb.scheduler import Scheduler
+from cocotb.triggers import RisingEdge, Timer
+
+from results import Results, rate
+
+
+class _CallbackHandle:
+    def __init__(self, sim, kind, func, args):
+        self._sim = sim
+        self._kind = kind
+        self.func = func
+        self.args = args
+        self.time = None
+
+    def deregister(self):
+        # Triggers deregister the callbacks that have just fired too
+        self._sim.pending[self._kind].pop(self, None)
+
+
+class _MockSimulator:
+    """Stands in for :mod:`cocotb.simulator`, callbacks only fire when asked to."""
+
+    def __init__(self):
+        # Registered callback handles of each kind, dictionaries are used as ordered sets
+        self.pending = {"timed": {}, "rw": {}, "ro": {}, "next": {}, "value": {}}
+        self.n_writes = 0
+        self.time = 0
+
+    def _register(self, kind, func, args):
+        hdl = _CallbackHandle(self, kind, func, args)
+        self.pending[kind][hdl] = None
+        return hdl
+
+    def register_timed_callback(self, time_ps, func, *args):
+        hdl = self._register("timed", func, args)
+        hdl.time = self.time + time_ps
+        return hdl
+
+    def register_rwsynch_callback(self, func, *args):
+        return self._register("rw", func, args)
+
+    def register_readonly_callback(self, func, *args):
+        return self._register("ro", func, args)
+
+    def register_nextstep_callback(self, func, *args):
+        return self._register("next", func, args)
+
+    def register_value_change_callback(self, signal, func, edge, *args):
+        return self._register("value", func, args)
+
+    def set_signal_values(self, writes):
+        self.n_writes += len(writes)
+
+    def get_sim_time(self):
+        return (self.time >> 32, self.time & 0xFFFFFFFF)
+
+    def get_precision(self):
+        return -12
+
+    def fire(self, kind):
+        """Run the callbacks of *kind* that are registered at this point.
+
+        Timed callbacks advance the time to the earliest of them.
+        """
+        callbacks, self.pending[kind] = self.pending[kind], {}
+        if kind == "timed" and callbacks:
+            self.time = min(hdl.time for hdl in callbacks)
+        for hdl in callbacks:
+            hdl.func(*hdl.args)
+
+
+@contextlib.contextmanager
+def mock_scheduler():
+    """Yield a new scheduler and the mock simulator it runs on."""
+    # cocotb.scheduler is the scheduler instance, not the module
+    scheduler_module = importlib.import_module("cocotb.scheduler")
+    sim = _MockSimulator()
+    saved = scheduler_module.simulator, cocotb.triggers.simulator, cocotb.utils.simulator
+    scheduler_module.simulator = cocotb.triggers.simulator = cocotb.utils.simulator = sim
+    scheduler = Scheduler()
+    try:
+        yield scheduler, sim
+    finally:
+        # Some triggers are singletons, which must not stay primed on this mock
+        for trigger in scheduler._trigger2coros:
+            trigger.unprime()
+        scheduler_module.simulator, cocotb.triggers.simulator, cocotb.utils.simulator = saved
+
+
+class _MockSignalHandle:
+    """Stands in for a :class:`~cocotb.simulator.gpi_sim_hdl`."""
+
+    def set_signal_val_int(self, action, value):
+        pass
+
+
+class _MockSignal:
+    """Stands in for a :class:`~cocotb.handle.ModifiableObject`."""
+
+    def __init__(self):
+        self._handle = _MockSignalHandle()
+        self._name = "signal"
+
+
+def _fire_rounds(sim, kind, n_rounds):
+    for _ in range(n_rounds):
+        sim.fire(kind)
+
+
+def bench_timer_wakes(n_tasks, n_rounds):
+    with mock_scheduler() as (scheduler, sim):
+
+        async def waiter():
+            while True:
+                await Timer(1)
+
+        for _ in range(n_tasks):
+            scheduler.add(waiter())
+        return rate(n_tasks * n_rounds, _fire_rounds, sim, "timed", n_rounds)
+
+
+def bench_edge_wakes(n_tasks, n_rounds):
+    with mock_scheduler() as (scheduler, sim):
+        edge = RisingEdge(_MockSignal())
+
+        async def waiter():
+            while True:
+                await edge
+
+        for _ in range(n_tasks):
+            scheduler.add(waiter())
+        return rate(n_tasks * n_rounds, _fire_rounds, sim, "value", n_rounds)
+
+
+def bench_write_flush(n_signals, n_rounds):
+    with mock_scheduler() as (scheduler, sim):
+        signals = [_MockSignal() for _ in range(n_signals)]
+
+        async def writer():
+            while True:
+                for i, signal in enumerate(signals):
+                    scheduler._schedule_write(signal, signal._handle.set_signal_val_int, 0, i)
+                await Timer(1)
+
+        scheduler.add(writer())
+
+        def rounds():
+            for _ in range(n_rounds):
+                sim.fire("rw")
+                sim.fire("timed")
+
+        value = rate(n_signals * n_rounds, rounds)
+        assert sim.n_writes == n_signals * n_rounds
+        return value
+
+
+def run(results, counts=(1, 100, 10000)):
+    for n in counts:
+        n_rounds = max(1, 200000 // n)
+        results.add("timer_wakes", bench_timer_wakes(n, n_rounds), "wakes/s", tasks=n)
+        results.add("edge_wakes", bench_edge_wakes(n, n_rounds), "wakes/s", tasks=n)
+        results.add("write_flush", bench_write_flush(n, n_rounds), "writes/s", signals=n)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="append the results to this file as JSON lines")
+    args = parser.parse_args()
+
+    results = Results("scheduler_gpi", args.json)
+    run(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Micro-benchmark of the scheduler dispatching many waiting tasks.
+
+This runs the scheduler on pure-Python triggers, so it does not need a simulator::
+
+    python tests/benchmarks/scheduler_waiters.py [--json FILE] [N_WAITERS ...]
+
+Two cases are measured for each number of waiting tasks:
+
+* ``shared``: all tasks wait on one trigger, which is fired repeatedly.
+* ``events``: each task waits on its own :class:`~cocotb.triggers.Event`,
+  and all the events are set from within the scheduler, queueing one trigger per task.
+"""
+import time
+
+from cocotb.scheduler import Scheduler
+from cocotb.triggers import Event, PythonTrigger, Trigger
+
+from results import Results
+
+
+class _SharedTrigger(PythonTrigger):
+    """A trigger that many tasks wait on, fired explicitly."""
+
+    def prime(self, callback):
+        self._callback = callback
+        Trigger.prime(self, callback)
+
+    def fire(self):
+        self._callback(self)
+
+
+def bench_shared(n_waiters, n_rounds):
+    """Wake *n_waiters* tasks waiting on the same trigger, *n_rounds* times."""
+    scheduler = Scheduler()
+    trigger = _SharedTrigger()
+
+    async def waiter():
+        while True:
+            await trigger
+
+    for _ in range(n_waiters):
+        scheduler.add(waiter())
+
+    start = time.perf_counter()
+    for _ in range(n_rounds):
+        trigger.fire()
+    return n_waiters * n_rounds / (time.perf_counter() - start)
+
+
+def bench_events(n_waiters, n_rounds):
+    """Wake *n_waiters* tasks waiting on their own event, *n_rounds* times."""
+    scheduler = Scheduler()
+    trigger = _SharedTrigger()
+    events = [Event() for _ in range(n_waiters)]
+
+    async def waiter(event):
+        while True:
+            await event.wait()
+            event.clear()
+
+    async def setter():
+        while True:
+            await trigger
+            for event in events:
+                event.set()
+
+    scheduler.add(setter())
+    for event in events:
+        scheduler.add(waiter(event))
+
+    start = time.perf_counter()
+    for _ in range(n_rounds):
+        trigger.fire()
+    return n_waiters * n_rounds / (time.perf_counter() - start)
+
+
+def run(results, counts=(1000, 10000, 100000)):
+    for n_waiters in counts:
+        n_rounds = max(1, 1000000 // n_waiters)
+        for name, bench in [("shared", bench_shared), ("events", bench_events)]:
+            results.add(name, bench(n_waiters, n_rounds), "wakes/s", waiters=n_waiters)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="append the results to this file as JSON lines")
+    parser.add_argument("counts", metavar="N_WAITERS", type=int, nargs="*",
+                        help="numbers of waiting tasks to measure")
+    args = parser.parse_args()
+
+    results = Results("scheduler_waiters", args.json)
+    if args.counts:
+        run(results, args.counts)
+    else:
+        run(results)
+
+
+if __name__ == "__main__":
+    main()
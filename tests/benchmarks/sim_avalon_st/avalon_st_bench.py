@@ -0,0 +1,53 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Benchmark of the Avalon-ST driver and monitor, run with ``make``.
+
+The results are printed and, if ``COCOTB_BENCHMARK_RESULTS`` is set, appended
+to that file as JSON lines.
+"""
+import time
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.drivers.avalon import AvalonST as AvalonSTDriver
+from cocotb.monitors.avalon import AvalonST as AvalonSTMonitor
+from cocotb.triggers import ClockCycles, Event
+
+from results import Results
+
+results = Results("sim_avalon_st")
+
+N_TRANSACTIONS = 5000
+
+
+@cocotb.test()
+async def transactions(dut):
+    """Transactions per second through the driver, the design and the monitor"""
+    cocotb.fork(Clock(dut.clk, 10, "ns", impl="gpi").start())
+    dut.reset <= 0
+    dut.aso_ready <= 1
+    await ClockCycles(dut.clk, 3)
+    dut.reset <= 1
+    await ClockCycles(dut.clk, 1)
+
+    driver = AvalonSTDriver(dut, "asi", dut.clk)
+    done = Event()
+    received = 0
+
+    def count(transaction):
+        nonlocal received
+        received += 1
+        if received == N_TRANSACTIONS:
+            done.set()
+
+    AvalonSTMonitor(dut, "aso", dut.clk, callback=count)
+
+    start = time.perf_counter()
+    for i in range(N_TRANSACTIONS):
+        driver.append(i & 0x7f)
+    await done.wait()
+    elapsed = time.perf_counter() - start
+
+    results.add("transactions", N_TRANSACTIONS / elapsed, "transactions/s")
@@ -0,0 +1,63 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Benchmark of the AXI4 master driver, run with ``make``.
+
+The results are printed and, if ``COCOTB_BENCHMARK_RESULTS`` is set, appended
+to that file as JSON lines.
+"""
+import time
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.drivers.amba import AXI4Master
+from cocotb.triggers import ClockCycles
+
+from hierarchy import measure_discovery
+from results import Results
+
+results = Results("sim_axi4")
+
+AXI_PREFIX = "S_AXI"
+N_TRANSACTIONS = 500
+
+
+async def setup_dut(dut):
+    cocotb.fork(Clock(dut.clk, 10, "ns", impl="gpi").start())
+    dut.rstn <= 0
+    await ClockCycles(dut.clk, 2)
+    dut.rstn <= 1
+    await ClockCycles(dut.clk, 2)
+
+
+@cocotb.test()
+async def transactions(dut):
+    """Single-beat and burst transactions per second"""
+    axim = AXI4Master(dut, AXI_PREFIX, dut.clk)
+    data_width = len(axim.bus.WDATA) // 8
+    address = dut.RAM_BASE_ADDRESS.value
+    await setup_dut(dut)
+
+    for burst_length in (1, 16):
+        values = list(range(burst_length))
+
+        start = time.perf_counter()
+        for _ in range(N_TRANSACTIONS):
+            await axim.write(address, values)
+        elapsed = time.perf_counter() - start
+        results.add("write", N_TRANSACTIONS / elapsed, "transactions/s",
+                    beats=burst_length, bytes_per_beat=data_width)
+
+        start = time.perf_counter()
+        for _ in range(N_TRANSACTIONS):
+            await axim.read(address, burst_length)
+        elapsed = time.perf_counter() - start
+        results.add("read", N_TRANSACTIONS / elapsed, "transactions/s",
+                    beats=burst_length, bytes_per_beat=data_width)
+
+
+@cocotb.test()
+async def discovery(dut):
+    """Handles discovered per second when walking the whole design"""
+    measure_discovery(dut, results)
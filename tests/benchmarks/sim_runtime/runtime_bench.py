@@ -0,0 +1,105 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Benchmarks of the cocotb runtime in a simulator, run with ``make``.
+
+The results are printed and, if ``COCOTB_BENCHMARK_RESULTS`` is set, appended
+to that file as JSON lines.
+"""
+import time
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer, ReadOnly
+
+from hierarchy import measure_discovery
+from results import Results
+
+results = Results("sim_runtime")
+
+N_CYCLES = 10000
+CLK_PERIOD_NS = 10
+
+
+@cocotb.test()
+async def clock_toggle(dut):
+    """Clock edges generated per second of wall time, by each clock implementation"""
+    for impl in ("py", "gpi"):
+        clk = cocotb.fork(Clock(dut.clk, CLK_PERIOD_NS, "ns", impl=impl).start())
+        await Timer(1, "ns")
+
+        start = time.perf_counter()
+        await Timer(N_CYCLES * CLK_PERIOD_NS, "ns")
+        elapsed = time.perf_counter() - start
+        clk.kill()
+
+        results.add("clock_toggle", 2 * N_CYCLES / elapsed, "edges/s", impl=impl)
+
+
+@cocotb.test()
+async def edge_wakes(dut):
+    """Wake-ups per second of tasks waiting on the rising edge of the same clock"""
+    clk = cocotb.fork(Clock(dut.clk, CLK_PERIOD_NS, "ns", impl="gpi").start())
+
+    for n_waiters in (1, 10, 100, 1000):
+        n_cycles = max(10, N_CYCLES // n_waiters)
+
+        async def waiter():
+            edge = RisingEdge(dut.clk)
+            for _ in range(n_cycles):
+                await edge
+
+        await RisingEdge(dut.clk)
+        start = time.perf_counter()
+        tasks = [cocotb.fork(waiter()) for _ in range(n_waiters)]
+        for task in tasks:
+            await task.join()
+        elapsed = time.perf_counter() - start
+
+        results.add("edge_wakes", n_waiters * n_cycles / elapsed, "wakes/s", waiters=n_waiters)
+
+    clk.kill()
+
+
+@cocotb.test()
+async def write_flush(dut):
+    """Signal writes applied per second when all inputs are written every time step"""
+    signals = [
+        dut.stream_in_valid, dut.stream_in_data, dut.stream_in_data_dword,
+        dut.stream_in_data_39bit, dut.stream_in_data_wide, dut.stream_in_data_dqword,
+        dut.stream_out_ready, dut.stream_in_int,
+    ]
+
+    start = time.perf_counter()
+    for i in range(N_CYCLES):
+        for signal in signals:
+            signal <= i & 1
+        await Timer(1, "ns")
+    elapsed = time.perf_counter() - start
+
+    results.add("write_flush", N_CYCLES * len(signals) / elapsed, "writes/s", signals=len(signals))
+
+
+@cocotb.test()
+async def value_reads(dut):
+    """Signal values read per second, as BinaryValue and as int"""
+    dut.stream_in_data_wide <= 0x0123456789abcdef
+    dut.stream_in_data_dqword <= (1 << 127) | 0x0123456789abcdef
+    await ReadOnly()
+
+    for signal in (dut.stream_in_data, dut.stream_in_data_wide, dut.stream_in_data_dqword):
+        n_bits = len(signal)
+        for name, read in (("value_read", lambda: signal.value.integer),
+                           ("value_int_read", lambda: signal.value_int)):
+            start = time.perf_counter()
+            for _ in range(N_CYCLES):
+                read()
+            elapsed = time.perf_counter() - start
+            results.add(name, N_CYCLES / elapsed, "reads/s", n_bits=n_bits)
+
+
+@cocotb.test()
+async def discovery(dut):
+    """Handles discovered per second when walking the whole design"""
+    measure_discovery(dut, results)
@@ -0,0 +1,24 @@
+// Copyright cocotb contributors
+// Licensed under the Revised BSD License, see LICENSE for details.
+// SPDX-License-Identifier: BSD-3-Clause
+
+// The signals of an Avalon-MM interface with single-word accesses, with no
+// logic, so that a testbench can drive the accesses to an AvalonMemory.
+
+`timescale 1 ns / 1 ps
+
+module avalon_memory #(
+    parameter DATA_WIDTH = 32,
+    parameter ADDR_WIDTH = 16
+) (
+    input  wire                   clk
+);
+
+    reg [ADDR_WIDTH-1:0]     mem_address;
+    reg                      mem_read;
+    reg [DATA_WIDTH-1:0]     mem_readdata;
+    reg                      mem_write;
+    reg [DATA_WIDTH-1:0]     mem_writedata;
+    reg [(DATA_WIDTH/8)-1:0] mem_byteenable;
+
+endmodule
@@ -0,0 +1,55 @@
+// Copyright cocotb contributors
+// Licensed under the Revised BSD License, see LICENSE for details.
+// SPDX-License-Identifier: BSD-3-Clause
+
+// The signals of an AXI4 interface, with no logic, so that a testbench can
+// connect a master and a slave which are both written in Python.
+
+`timescale 1 ns / 1 ps
+
+module axi4_loopback #(
+    parameter DATA_WIDTH = 32,
+    parameter ADDR_WIDTH = 32,
+    parameter STRB_WIDTH = (DATA_WIDTH/8),
+    parameter ID_WIDTH = 4
+) (
+    input  wire                   clk
+);
+
+    reg [ID_WIDTH-1:0]    AXI_AWID;
+    reg [ADDR_WIDTH-1:0]  AXI_AWADDR;
+    reg [7:0]             AXI_AWLEN;
+    reg [2:0]             AXI_AWSIZE;
+    reg [1:0]             AXI_AWBURST;
+    reg [2:0]             AXI_AWPROT;
+    reg                   AXI_AWVALID;
+    reg                   AXI_AWREADY;
+
+    reg [DATA_WIDTH-1:0]  AXI_WDATA;
+    reg [STRB_WIDTH-1:0]  AXI_WSTRB;
+    reg                   AXI_WLAST;
+    reg                   AXI_WVALID;
+    reg                   AXI_WREADY;
+
+    reg [ID_WIDTH-1:0]    AXI_BID;
+    reg [1:0]             AXI_BRESP;
+    reg                   AXI_BVALID;
+    reg                   AXI_BREADY;
+
+    reg [ID_WIDTH-1:0]    AXI_ARID;
+    reg [ADDR_WIDTH-1:0]  AXI_ARADDR;
+    reg [7:0]             AXI_ARLEN;
+    reg [2:0]             AXI_ARSIZE;
+    reg [1:0]             AXI_ARBURST;
+    reg [2:0]             AXI_ARPROT;
+    reg                   AXI_ARVALID;
+    reg                   AXI_ARREADY;
+
+    reg [ID_WIDTH-1:0]    AXI_RID;
+    reg [DATA_WIDTH-1:0]  AXI_RDATA;
+    reg [1:0]             AXI_RRESP;
+    reg                   AXI_RLAST;
+    reg                   AXI_RVALID;
+    reg                   AXI_RREADY;
+
+endmodule
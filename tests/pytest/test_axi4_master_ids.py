@@ -0,0 +1,46 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import pytest
+
+from cocotb.drivers.amba import AXIBurst, AXITransaction, AXITransferStatistics, _InFlight
+
+
+@pytest.fixture(autouse=True)
+def sim_time(monkeypatch):
+    monkeypatch.setattr("cocotb.drivers.amba.get_sim_time", lambda: 0)
+
+
+def _add(in_flight):
+    transaction = AXITransaction(False, 0, 1, AXIBurst.INCR, 4)
+    in_flight.add(transaction)
+    return transaction
+
+
+def test_single_outstanding_uses_id_0():
+    in_flight = _InFlight("reads", 1, 4, AXITransferStatistics())
+    for _ in range(5):
+        transaction = _add(in_flight)
+        assert transaction.id == 0
+        in_flight.remove(transaction)
+
+
+def test_lowest_free_id():
+    in_flight = _InFlight("reads", 8, 2, AXITransferStatistics())
+    transactions = [_add(in_flight) for _ in range(3)]
+    assert [t.id for t in transactions] == [0, 1, 2]
+
+    in_flight.remove(transactions[1])
+    assert _add(in_flight).id == 1
+
+    # With every ID in use, the ID with the fewest bursts is shared
+    assert [_add(in_flight).id for _ in range(3)] == [3, 0, 1]
+    assert in_flight.first(0) is transactions[0]
+
+
+def test_remove_all():
+    in_flight = _InFlight("writes", 4, 1, AXITransferStatistics())
+    transactions = [_add(in_flight) for _ in range(3)]
+    assert sorted(in_flight.remove_all(), key=transactions.index) == transactions
+    assert in_flight.count == 0
+    assert _add(in_flight).id == 0
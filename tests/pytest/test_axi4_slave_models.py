@@ -0,0 +1,148 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import itertools
+
+import pytest
+
+from cocotb.drivers.amba import (
+    AXI4Slave, AXI4SlaveStatistics, AXIBurst, _OnOff, _SlaveBurst, load_trace, random_backpressure, random_latency
+)
+from cocotb.drivers.memory import SparseMemory
+
+
+def test_load_trace(tmp_path):
+    filename = tmp_path / "trace.txt"
+    filename.write_text("# latencies\n5\n\n12\n3 4\n")
+    assert load_trace(str(filename)) == [5, 12, (3, 4)]
+
+
+def test_on_off():
+    on_off = _OnOff([(2, 1), (0, 0), (1, 2)])
+    assert [on_off() for _ in range(8)] == [True, True, False, True, False, False, True, True]
+    assert all(_OnOff(None)() for _ in range(3))
+
+
+def test_random_models():
+    latencies = list(itertools.islice(random_latency(2, 5, seed=1), 100))
+    assert min(latencies) >= 2 and max(latencies) <= 5
+    assert latencies == list(itertools.islice(random_latency(2, 5, seed=1), 100))
+
+    for on, off in itertools.islice(random_backpressure(3, 2, seed=1), 100):
+        assert 1 <= on <= 3 and 0 <= off <= 2
+
+
+def _beat_addresses(address, length, size, burst):
+    slave_burst = _SlaveBurst(0, address, length, size, burst)
+    addresses = []
+    for beat in range(length):
+        slave_burst.beat = beat
+        addresses.append(slave_burst.beat_address())
+    return addresses
+
+
+def test_beat_address():
+    assert _beat_addresses(0x1002, 3, 4, AXIBurst.INCR) == [0x1002, 0x1004, 0x1008]
+    assert _beat_addresses(0x1002, 3, 4, AXIBurst.FIXED) == [0x1002] * 3
+    assert _beat_addresses(0x1038, 4, 8, AXIBurst.WRAP) == [0x1038, 0x1020, 0x1028, 0x1030]
+
+
+def test_next_ready():
+    def burst(txn_id, ready_cycle):
+        slave_burst = _SlaveBurst(txn_id, 0, 1, 4, AXIBurst.INCR)
+        slave_burst.ready_cycle = ready_cycle
+        return slave_burst
+
+    a0, b0, a1, c0 = burst(1, 5), burst(2, 3), burst(1, 1), burst(3, 3)
+    bursts = [a0, b0, a1, c0]
+    assert AXI4Slave._next_ready(bursts, 2) is None
+    # Of the bursts ready at the same cycle, the first accepted
+    assert AXI4Slave._next_ready(bursts, 3) is b0
+    # a1 is ready first, but must wait for a0 with the same ID
+    bursts.remove(b0)
+    assert AXI4Slave._next_ready(bursts, 4) is c0
+    assert AXI4Slave._next_ready([a0, a1], 4) is None
+    assert AXI4Slave._next_ready([a0, a1], 5) is a0
+
+
+def test_beat_bytes():
+    assert AXI4Slave._beat_bytes(0x1000, 4, 4) == 0b1111
+    assert AXI4Slave._beat_bytes(0x1002, 2, 4) == 0b1100
+    assert AXI4Slave._beat_bytes(0x1005, 1, 8) == 0b00100000
+    # An unaligned beat starts at its address
+    assert AXI4Slave._beat_bytes(0x1001, 4, 4) == 0b1110
+    assert AXI4Slave._beat_bytes(0x1006, 4, 8) == 0b11000000
+
+
+class _Signal:
+    def __init__(self, n_bits):
+        self.n_bits = n_bits
+
+    def __len__(self):
+        return self.n_bits
+
+
+class _Bus:
+    WDATA = RDATA = _Signal(32)
+
+
+def _slave(big_endian):
+    slave = AXI4Slave.__new__(AXI4Slave)
+    slave.bus = _Bus()
+    slave.big_endian = big_endian
+    slave._byteorder = "big" if big_endian else "little"
+    slave._memory = SparseMemory(size=0x100)
+    slave.stats = AXI4SlaveStatistics()
+    slave._busy_locks = {}
+    return slave
+
+
+@pytest.mark.parametrize("big_endian, wdata, wstrb, contents", [
+    (False, 0xaabb0000, 0b1100, b"\x00\x00\xbb\xaa"),
+    (True, 0x0000aabb, 0b0011, b"\x00\x00\xaa\xbb"),
+    # The lanes outside the beat are not written, whatever WSTRB says
+    (False, 0xaabbccdd, 0b1111, b"\x00\x00\xbb\xaa"),
+    (True, 0xaabbccdd, 0b1111, b"\x00\x00\xcc\xdd"),
+    (False, 0xaabb0000, 0b1000, b"\x00\x00\x00\xaa"),
+    (True, 0x0000aabb, 0b0001, b"\x00\x00\x00\xbb"),
+])
+def test_narrow_beat_lanes(big_endian, wdata, wstrb, contents):
+    slave = _slave(big_endian)
+    slave._write_beat(_SlaveBurst(0, 0x12, 1, 2, AXIBurst.INCR), wdata, wstrb)
+    assert slave._memory.read(0x10, 4) == contents
+    assert slave.stats.bytes_written == bin(wstrb & (0b0011 if big_endian else 0b1100)).count("1")
+
+    # A read of the same beat returns the bytes in the same lanes
+    mask = 0xffff if big_endian else 0xffff0000
+    written = int.from_bytes(contents, slave._byteorder)
+    assert slave._read_beat(_SlaveBurst(0, 0x12, 1, 2, AXIBurst.INCR)) == written & mask
+
+
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_narrow_burst_round_trip(big_endian):
+    slave = _slave(big_endian)
+    data = [0x11, 0x22, 0x33, 0x44, 0x55, 0x66]
+    burst = _SlaveBurst(0, 0x21, len(data), 1, AXIBurst.INCR)
+    for value in data:
+        lane = burst.beat_address() % 4
+        if big_endian:
+            lane = 3 - lane
+        slave._write_beat(burst, value << 8 * lane, 1 << lane)
+    assert slave._memory.read(0x21, len(data)) == bytes(data)
+
+    burst.beat = 0
+    for value in data:
+        lane = burst.beat_address() % 4
+        if big_endian:
+            lane = 3 - lane
+        assert slave._read_beat(burst) == value << 8 * lane
+        burst.beat += 1
+
+
+@pytest.mark.parametrize("attribute", ["write_address_busy", "read_address_busy", "write_data_busy"])
+def test_deprecated_busy_locks(attribute):
+    slave = _slave(False)
+    with pytest.warns(DeprecationWarning):
+        lock = getattr(slave, attribute)
+    with pytest.warns(DeprecationWarning):
+        assert getattr(slave, attribute) is lock
@@ -317,3 +317,32 @@ def test_bad_binstr():
 
     with pytest.raises(ValueError, match=r'Attempting to assign character % to a BinaryValue'):
         BinaryValue(value="Uu%")
+
+
+def test_slots():
+    v = BinaryValue(value=5, n_bits=8)
+    with pytest.raises(AttributeError):
+        v.foo = 1
+
+
+def test_wide_value_from_int():
+    n_bits = 1024
+    value = (1 << 1023) | 0xDEADBEEF
+    v = BinaryValue(value=value, n_bits=n_bits, bigEndian=False)
+    assert v.integer == value
+    assert v.signed_integer == value - (1 << n_bits)
+    assert len(v) == n_bits
+    assert v.buff == value.to_bytes(n_bits // 8, "little")
+    assert v[31:0].integer == 0xDEADBEEF
+    assert v[1023].integer == 1
+    assert v.binstr == format(value, "01024b")
+
+
+def test_unknown_bits_preserved():
+    v = BinaryValue(value="1x0z01", n_bits=6, bigEndian=False)
+    assert not v.is_resolvable
+    assert v[1:0].integer == 1
+    assert v[4:3].binstr == "x0"
+    assert v.binstr == "1x0z01"
+    with pytest.raises(ValueError):
+        v.integer
@@ -0,0 +1,181 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import os
+
+import pytest
+
+import cocotb.handle
+from cocotb import simulator
+from cocotb._hierarchy_cache import HierarchyCache, cache_key
+from cocotb.handle import SimHandle, HierarchyObject, ModifiableObject
+
+
+class _GpiHandle:
+    """Stands in for a :class:`~cocotb.simulator.gpi_sim_hdl`, counting the lookups."""
+
+    lookups = 0
+
+    def __init__(self, name, gpi_type, children=(), width=4, value=5):
+        self._name = name
+        self._type = gpi_type
+        self._children = list(children)
+        self._width = width
+        self._value = value
+
+    def get_name_string(self):
+        return self._name
+
+    def get_type_string(self):
+        return "GPI_MODULE" if self._type == simulator.MODULE else "GPI_NET"
+
+    def get_type(self):
+        return self._type
+
+    def get_definition_file(self):
+        return ""
+
+    def get_const(self):
+        return self._type == simulator.INTEGER
+
+    def get_range(self):
+        return (self._width - 1, 0)
+
+    def get_num_elems(self):
+        return self._width
+
+    def iterate(self, mode):
+        _GpiHandle.lookups += 1
+        return iter(self._children)
+
+    def get_handle_by_name(self, name):
+        _GpiHandle.lookups += 1
+        for child in self._children:
+            if child._name == name:
+                return child
+        return None
+
+    def get_signal_val_vector(self):
+        return self._value, 0, 4
+
+    def get_signal_val_long(self):
+        return self._value
+
+
+def _design(sig_type=simulator.REG, width=4, depth=16):
+    return _GpiHandle("top", simulator.MODULE, [
+        _GpiHandle("u_sub", simulator.MODULE, [_GpiHandle("data", sig_type, width=width)]),
+        _GpiHandle("clk", simulator.REG),
+        _GpiHandle("DEPTH", simulator.INTEGER, value=depth),
+    ])
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    yield str(tmp_path / "hierarchy.json")
+    cocotb.handle._hierarchy_cache = None
+    cocotb.handle._unresolved.clear()
+
+
+def _build(filename, key):
+    cocotb.handle._hierarchy_cache = HierarchyCache(filename, key)
+    top = SimHandle(_design())
+    dir(top)
+    dir(top.u_sub)
+    cocotb.handle._hierarchy_cache.save()
+
+
+def test_cached_hierarchy(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+
+    cocotb.handle._hierarchy_cache = HierarchyCache.load(cache_file, {"toplevel": "top"})
+    top = SimHandle(_design())
+    _GpiHandle.lookups = 0
+    assert sorted(h._name for h in top) == ["DEPTH", "clk", "u_sub"]
+    assert isinstance(top.u_sub, HierarchyObject)
+    data = top.u_sub.data
+    assert isinstance(data, ModifiableObject)
+    assert len(data) == 4
+    assert data._range == (3, 0)
+    assert _GpiHandle.lookups == 0
+
+    # The handle is looked up on first use
+    assert data.value == 5
+    assert _GpiHandle.lookups == 2
+
+
+def test_stale_cache(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+
+    cocotb.handle._hierarchy_cache = HierarchyCache.load(cache_file, {"toplevel": "top"})
+    top = SimHandle(_design(sig_type=simulator.INTEGER))
+    with pytest.raises(RuntimeError):
+        top.u_sub.data.value
+    assert not os.path.exists(cache_file)
+
+
+def test_width_changed(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+
+    cocotb.handle._hierarchy_cache = HierarchyCache.load(cache_file, {"toplevel": "top"})
+    top = SimHandle(_design(width=8))
+    with pytest.raises(RuntimeError):
+        top.u_sub.data.value
+    assert not os.path.exists(cache_file)
+
+
+def test_singleton_before_resolve(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+
+    cocotb.handle._hierarchy_cache = HierarchyCache.load(cache_file, {"toplevel": "top"})
+    design = _design()
+    top = SimHandle(design)
+    data = top.u_sub.data
+    # As if the signal was looked up again
+    assert SimHandle(design._children[0]._children[0], "top.u_sub.data") is data
+
+
+def test_other_path_not_resolved(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+
+    cocotb.handle._hierarchy_cache = HierarchyCache.load(cache_file, {"toplevel": "top"})
+    top = SimHandle(_design())
+    clk = top.clk
+    _GpiHandle.lookups = 0
+    # An object with the same name elsewhere leaves the cached one alone
+    other = SimHandle(_GpiHandle("clk", simulator.REG), "top.u_sub.clk")
+    assert other is not clk
+    assert type(clk._handle) is cocotb.handle._CachedGpiHandle
+    assert _GpiHandle.lookups == 0
+
+
+@pytest.mark.parametrize("depth, cached", [(16, True), (32, False)])
+def test_parameter_changed(cache_file, monkeypatch, depth, cached):
+    for design in (_design(), _design(depth=depth)):
+        monkeypatch.setattr(cocotb, "top", SimHandle(design))
+        cocotb._load_hierarchy_cache(cache_file)
+        dir(cocotb.top.u_sub)
+        cocotb.handle._hierarchy_cache.save()
+    from_cache = type(cocotb.top.u_sub._sub_handles["data"]._handle) is cocotb.handle._CachedGpiHandle
+    assert from_cache == cached
+
+
+def test_key_mismatch(cache_file):
+    _build(cache_file, {"toplevel": "top"})
+    cache = HierarchyCache.load(cache_file, {"toplevel": "other"})
+    assert cache.children("top") is None
+
+
+def test_cache_key_sources(tmp_path):
+    source = tmp_path / "top.v"
+    source.write_text("module top; endmodule")
+    key = cache_key("top", "sim", "1.0", [str(source)])
+    assert key == cache_key("top", "sim", "1.0", [str(source)])
+    source.write_text("module top; wire a; endmodule")
+    assert key != cache_key("top", "sim", "1.0", [str(source)])
+
+
+def test_cache_key_arguments():
+    key = cache_key("top", "sim", "1.0", [], {"COMPILE_ARGS": "-Ptop.WIDTH=8"})
+    assert key == cache_key("top", "sim", "1.0", [], {"COMPILE_ARGS": "-Ptop.WIDTH=8"})
+    assert key != cache_key("top", "sim", "1.0", [], {"COMPILE_ARGS": "-Ptop.WIDTH=16"})
@@ -0,0 +1,114 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import gzip
+import logging
+
+import pytest
+
+import cocotb.log
+import cocotb.utils
+from cocotb.log import SimLogFormatter, SimTimeContextFilter
+
+
+class _Simulator:
+    def __init__(self):
+        self.time = 0
+        self.n_calls = 0
+
+    def get_sim_time(self):
+        self.n_calls += 1
+        return (self.time >> 32, self.time & 0xFFFFFFFF)
+
+    @staticmethod
+    def get_precision():
+        return -12
+
+
+@pytest.fixture
+def sim(monkeypatch):
+    sim = _Simulator()
+    monkeypatch.setattr(cocotb.utils, "simulator", sim)
+    # The precision is cached by the first call
+    monkeypatch.setattr(cocotb.utils, "_get_simulator_precision", sim.get_precision)
+    return sim
+
+
+def _record(msg="message", name="cocotb.test", lineno=10):
+    return logging.LogRecord(name, logging.INFO, "/path/to/test_file.py", lineno, msg, None, None, "my_test")
+
+
+def test_sim_time_frozen(sim):
+    sim_filter = SimTimeContextFilter()
+    cocotb.utils._freeze_sim_time()
+    try:
+        sim.time = 5
+        records = [_record() for _ in range(3)]
+        for record in records:
+            sim_filter.filter(record)
+        sim.time = 6
+        sim_filter.filter(records[-1])
+    finally:
+        cocotb.utils._thaw_sim_time()
+
+    assert [r.created_sim_time for r in records] == [5, 5, 5]
+    assert sim.n_calls == 1
+
+    # Outside of callbacks the time is read every time
+    record = _record()
+    sim_filter.filter(record)
+    assert record.created_sim_time == 6
+    assert sim.n_calls == 2
+
+
+def test_format(sim, monkeypatch):
+    formatter = SimLogFormatter()
+    record = _record("line 1\nline 2")
+    record.created_sim_time = 1500
+    lines = formatter.format(record).split("\n")
+    assert lines[0].startswith("     1.50ns INFO     cocotb.test")
+    assert "test_file.py:10   in my_test" in lines[0]
+    assert lines[0].endswith(" line 1")
+    assert lines[1] == " " * (len(lines[0]) - len("line 1")) + "line 2"
+
+    # The cached location follows the record
+    record = _record(lineno=11)
+    record.created_sim_time = None
+    line = formatter.format(record)
+    assert line.startswith("     -.--ns INFO     ")
+    assert "test_file.py:11   in my_test" in line
+
+    monkeypatch.setattr(cocotb.log, "_suppress", True)
+    assert formatter.format(record) == "     -.--ns INFO     message"
+
+
+def _async_handler(*args, **kwargs):
+    handler = cocotb.log.SimAsyncLogHandler(*args, **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def test_async_handler(tmp_path):
+    filename = str(tmp_path / "sim.log")
+    handler = _async_handler(filename)
+    for i in range(1000):
+        handler.handle(_record("message {}".format(i)))
+    handler.flush()
+    with open(filename) as f:
+        assert f.read().splitlines() == ["message {}".format(i) for i in range(1000)]
+    handler.close()
+
+
+def test_async_handler_rotation(tmp_path):
+    filename = str(tmp_path / "sim.log.gz")
+    handler = _async_handler(filename, max_bytes=100, backup_count=2)
+    for i in range(6):
+        handler.handle(_record("{:049}".format(i)))
+        # One record per batch, so that the files are rotated at known points
+        handler.flush()
+    handler.close()
+
+    for name, expected in (("sim.log.gz", [4, 5]), ("sim.log.1.gz", [2, 3]), ("sim.log.2.gz", [0, 1])):
+        with gzip.open(str(tmp_path / name), "rt") as f:
+            assert [int(line) for line in f] == expected
+    assert not (tmp_path / "sim.log.3.gz").exists()
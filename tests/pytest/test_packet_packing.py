@@ -0,0 +1,45 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import pytest
+
+from cocotb.binary import BinaryValue
+from cocotb.drivers.avalon import AvalonSTPkts
+from cocotb.drivers.xgmii import _XGMIIBus
+
+
+class _Bus:
+    pass
+
+
+@pytest.mark.parametrize("first_symbol_high", [True, False])
+@pytest.mark.parametrize("n_bits", [8, 64, 512])
+def test_avalon_st_pack_words(n_bits, first_symbol_high):
+    driver = AvalonSTPkts.__new__(AvalonSTPkts)
+    driver.bus = _Bus()
+    driver.bus.data = [0] * n_bits
+    driver.config = {"firstSymbolInHighOrderBits": first_symbol_high}
+    bus_width = n_bits // 8
+
+    for length in (0, 1, bus_width, 3 * bus_width + 1):
+        packet = bytes(range(1, length + 1))
+        expected = []
+        word = BinaryValue(n_bits=n_bits, bigEndian=first_symbol_high)
+        for start in range(0, length, bus_width):
+            word.buff = packet[start:start + bus_width]
+            expected.append((word.integer, max(0, start + bus_width - length)))
+        assert driver._pack_words(packet) == expected
+
+
+@pytest.mark.parametrize("interleaved", [True, False])
+def test_xgmii_pack(interleaved):
+    bus = _XGMIIBus(4, interleaved=interleaved)
+    lanes = bytes(range(0xF0, 0xF8))
+    ctrl = 0b10000101
+
+    expected = []
+    for offset in (0, 4):
+        for i in range(4):
+            bus[i] = (lanes[offset + i], bool(ctrl >> (offset + i) & 1))
+        expected.append(bus.value.integer)
+    assert bus.pack(lanes, ctrl) == expected
@@ -0,0 +1,71 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import csv
+import json
+
+from cocotb._scheduler_stats import SchedulerStats, write_report
+
+
+class _Coro:
+    def __init__(self):
+        self.__qualname__ = "my_coro"
+
+
+class _Task:
+    def __init__(self):
+        self.__qualname__ = "Task 0"
+        self._coro = _Coro()
+
+
+class _Trigger:
+    pass
+
+
+def _collect():
+    stats = SchedulerStats()
+    task = _Task()
+    stats.task_woken(task, 0.5)
+    stats.task_woken(task, 0.25)
+    stats.task_done(task)
+    stats.trigger_fired(_Trigger())
+    stats.trigger_fired(_Trigger())
+    for sim_time in [(0, 0), (0, 0), (0, 10)]:
+        stats.crossing(sim_time)
+    stats.writes_flushed(3, 0.125)
+    return stats
+
+
+def test_report():
+    report = _collect().report("mod.test")
+    assert report["tasks"] == [{"name": "Task 0 (my_coro)", "wakes": 2, "cpu_s": 0.75}]
+    assert report["triggers"] == {"_Trigger": 2}
+    assert report["crossings"] == {
+        "total": 3, "timesteps": 2, "max_per_timestep": 2, "mean_per_timestep": 1.5}
+    assert report["writes"] == {"flushes": 1, "values": 3, "time_s": 0.125}
+
+
+def test_reset():
+    stats = _collect()
+    stats.reset()
+    report = stats.report("mod.test")
+    assert report["tasks"] == []
+    assert report["triggers"] == {}
+    assert report["crossings"]["total"] == 0
+
+
+def test_write_report(tmp_path):
+    reports = [_collect().report("mod.test")]
+
+    json_file = str(tmp_path / "stats.json")
+    write_report(json_file, reports)
+    with open(json_file) as f:
+        assert json.load(f) == reports
+
+    csv_file = str(tmp_path / "stats.csv")
+    write_report(csv_file, reports)
+    with open(csv_file, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["test", "section", "name", "count", "time_s"]
+    assert ["mod.test", "task", "Task 0 (my_coro)", "2", "0.75"] in rows
+    assert ["mod.test", "writes", "flushes", "1", "0.125"] in rows
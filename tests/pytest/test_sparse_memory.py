@@ -0,0 +1,149 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import array
+import struct
+
+import pytest
+
+from cocotb.drivers.memory import SparseMemory
+
+
+def test_sparse():
+    mem = SparseMemory(size=1 << 32, page_size=256)
+    assert mem.read(0xFFFF0000, 4) == bytes(4)
+    assert not mem.is_initialized(0xFFFF0000)
+    assert mem.pages_allocated == 0
+
+    # Across two pages
+    mem.write(0x1FE, b"\x01\x02\x03\x04")
+    assert mem.pages_allocated == 2
+    assert mem.read(0x1FC, 8) == b"\x00\x00\x01\x02\x03\x04\x00\x00"
+    assert mem.read_word(0x1FE, 4) == 0x04030201
+    assert mem.read_word(0x1FE, 4, "big") == 0x01020304
+    assert mem.is_initialized(0x1FE, 4)
+
+    assert mem[0x1FF] == 2
+    assert mem[0x1FE:0x200] == b"\x01\x02"
+    mem[0x100:0x102] = b"\xAA\xBB"
+    assert mem.read(0x100, 2) == b"\xAA\xBB"
+
+    assert mem.stats.bytes_written == 6
+
+    with pytest.raises(IndexError):
+        mem.read(0xFFFFFFFF, 2)
+
+
+def test_byteenable():
+    mem = SparseMemory()
+    mem.write_word(0, 0x11223344, 4)
+    mem.write_word(0, 0xAABBCCDD, 4, byteenable=0b1010)
+    assert mem.read_word(0, 4) == 0xAA22CC44
+
+
+def test_view():
+    mem = SparseMemory(page_size=16)
+    mem.write(0, bytes(range(32)))
+    view = mem.view(4, 4)
+    view[0] = 0xFF
+    assert mem[4] == 0xFF
+    # Across pages, a copy
+    assert mem.view(14, 4).tobytes() == bytes([14, 15, 16, 17])
+
+
+def test_map():
+    backing = array.array("B", range(16))
+    mem = SparseMemory(page_size=8)
+    mem.map(backing, base=0x10)
+
+    mem.write(0x0E, b"\x01\x02\x03\x04")
+    assert backing[0:2].tobytes() == b"\x03\x04"
+    assert mem.read(0x0C, 8) == b"\x00\x00\x01\x02\x03\x04\x02\x03"
+    assert mem.is_initialized(0x10, 16)
+
+    with pytest.raises(ValueError):
+        mem.map(bytearray(4), base=0x1E)
+
+
+def test_map_file(tmp_path):
+    filename = tmp_path / "image.bin"
+    filename.write_bytes(bytes(range(8)))
+
+    mem = SparseMemory()
+    mem.map_file(str(filename), base=0x1000, writable=False)
+    assert mem.read_word(0x1000, 4) == 0x03020100
+    mem.write(0x1000, b"\xFF")
+    assert filename.read_bytes()[0] == 0
+
+    mem = SparseMemory()
+    mm = mem.map_file(str(filename), base=0x1000)
+    mem.write(0x1000, b"\xFF")
+    mm.flush()
+    assert filename.read_bytes()[0] == 0xFF
+
+
+def _elf32(segments):
+    """Return a little-endian ELF32 file with a PT_LOAD program header per (paddr, data, memsz)."""
+    phoff = 52
+    data_offset = phoff + 32 * len(segments)
+    header = b"\x7fELF" + bytes([1, 1, 1]) + bytes(9)
+    header += struct.pack("<HHIIIIIHHHHHH", 2, 0, 1, 0, phoff, 0, 0, 52, 32, len(segments), 0, 0, 0)
+    program_headers = b""
+    contents = b""
+    for paddr, data, memsz in segments:
+        program_headers += struct.pack("<IIIIIIII", 1, data_offset + len(contents), paddr, paddr,
+                                       len(data), memsz, 5, 4)
+        contents += data
+    return header + program_headers + contents
+
+
+def test_load_elf(tmp_path):
+    filename = tmp_path / "firmware.elf"
+    filename.write_bytes(_elf32([(0x1000, b"\x01\x02\x03\x04", 8), (0x80000000, b"data", 4)]))
+
+    mem = SparseMemory.from_image(str(filename))
+    assert mem.read(0x1000, 8) == b"\x01\x02\x03\x04\x00\x00\x00\x00"
+    assert mem.read(0x80000000, 4) == b"data"
+    assert mem.pages_allocated == 0
+
+
+def test_ihex_round_trip(tmp_path):
+    mem = SparseMemory()
+    mem.write(0x1FFF8, bytes(range(32)))
+    mem.write(0x80000000, b"\xDE\xAD\xBE\xEF")
+
+    filename = str(tmp_path / "dump.hex")
+    mem.dump(filename, format="ihex")
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == ":020000040001F9"
+    assert lines[-1] == ":00000001FF"
+
+    loaded = SparseMemory.from_image(filename)
+    assert loaded.read(0x1FFF8, 32) == bytes(range(32))
+    assert loaded.read(0x80000000, 4) == b"\xDE\xAD\xBE\xEF"
+    assert loaded.modified_ranges() == []
+
+
+def test_dump_modified(tmp_path):
+    image = tmp_path / "image.bin"
+    image.write_bytes(bytes(range(256)) * 64)
+
+    mem = SparseMemory(page_size=4096)
+    mem.load(str(image))
+    mem.write(0x2001, b"\xFF")
+    mem.write(0x10000, b"\xAA")
+    assert mem.modified_ranges() == [(0x2000, 0x3000), (0x10000, 0x11000)]
+
+    dump = tmp_path / "dump.bin"
+    mem.dump(str(dump))
+    contents = dump.read_bytes()
+    assert len(contents) == 0x11000
+    assert contents[:0x2000] == bytes(0x2000)
+    assert contents[0x2000:0x2003] == b"\x00\xFF\x02"
+    assert contents[0x10000] == 0xAA
+
+    mem.clear_modified()
+    assert mem.modified_ranges() == []
+    # The image was not changed
+    assert image.read_bytes()[1] == 1
@@ -0,0 +1,108 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import pytest
+
+import cocotb.triggers
+import cocotb.utils
+from cocotb.triggers import Timer
+
+
+class _CallbackHandle:
+    def __init__(self, sim, time, func, args):
+        self.sim = sim
+        self.time = time
+        self.func = func
+        self.args = args
+
+    def deregister(self):
+        self.sim.callbacks.remove(self)
+
+
+class _Simulator:
+    """Just enough of :mod:`cocotb.simulator` for timed callbacks."""
+
+    def __init__(self):
+        self.time = 0
+        self.callbacks = []
+
+    def get_sim_time(self):
+        return (self.time >> 32, self.time & 0xFFFFFFFF)
+
+    def register_timed_callback(self, steps, func, *args):
+        hdl = _CallbackHandle(self, self.time + steps, func, args)
+        self.callbacks.append(hdl)
+        return hdl
+
+    def run_next(self):
+        hdl = min(self.callbacks, key=lambda h: h.time)
+        self.callbacks.remove(hdl)
+        self.time = hdl.time
+        hdl.func(*hdl.args)
+
+
+@pytest.fixture
+def sim(monkeypatch):
+    sim = _Simulator()
+    monkeypatch.setattr(cocotb.triggers, "simulator", sim)
+    monkeypatch.setattr(cocotb.utils, "simulator", sim)
+    monkeypatch.setattr(cocotb.triggers, "_timer_queue", cocotb.triggers._TimerQueue())
+    return sim
+
+
+def test_order(sim):
+    fired = []
+
+    def callback(timer):
+        fired.append((sim.time, timer))
+
+    timers = [Timer(steps) for steps in (30, 10, 20, 10)]
+    for timer in timers:
+        timer.prime(callback)
+    assert len(sim.callbacks) == 1
+
+    sim.run_next()
+    assert fired == [(10, timers[1]), (10, timers[3])]
+    assert len(sim.callbacks) == 1
+
+    sim.run_next()
+    sim.run_next()
+    assert fired[2:] == [(20, timers[2]), (30, timers[0])]
+    assert sim.callbacks == []
+
+
+def test_unprime(sim):
+    fired = []
+    first, second = Timer(10), Timer(20)
+    first.prime(fired.append)
+    second.prime(fired.append)
+    first.unprime()
+
+    sim.run_next()
+    assert fired == []
+    sim.run_next()
+    assert fired == [second]
+
+    # Nothing stays registered once no timer is pending
+    third = Timer(5)
+    third.prime(fired.append)
+    assert len(sim.callbacks) == 1
+    third.unprime()
+    assert sim.callbacks == []
+
+
+def test_primed_while_firing(sim):
+    fired = []
+    later = Timer(5)
+
+    def callback(timer):
+        fired.append((sim.time, timer))
+        if timer is not later:
+            later.prime(callback)
+
+    first = Timer(10)
+    first.prime(callback)
+    sim.run_next()
+    assert fired == [(10, first)]
+    sim.run_next()
+    assert fired == [(10, first), (15, later)]
@@ -0,0 +1,84 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import pytest
+
+import cocotb.utils
+from cocotb.binary import BinaryValue
+from cocotb.monitors.recorder import TransactionRecorder, TransactionReader
+
+
+@pytest.fixture(autouse=True)
+def precision(monkeypatch):
+    monkeypatch.setattr(cocotb.utils, "_get_simulator_precision", lambda: -12)
+    monkeypatch.setattr("cocotb.monitors.recorder._get_simulator_precision", lambda: -12)
+
+
+def _write(filename, **kwargs):
+    expected = []
+    with TransactionRecorder(filename, block_size=256, **kwargs) as recorder:
+        for time in range(0, 100000, 1000):
+            for monitor, data in (("mon.a", b"\x00\x01" * (time // 1000)),
+                                  ("mon.b", "text {}".format(time)),
+                                  ("mon.c", {"data": b"pkt", "channel": time})):
+                recorder.record(monitor, data, time=time)
+                expected.append((time, monitor, data))
+    return expected
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_round_trip(tmp_path, compression):
+    filename = str(tmp_path / "txns.bin")
+    expected = _write(filename, compression=compression)
+    with TransactionReader(filename) as reader:
+        assert reader.precision == -12
+        assert [tuple(t) for t in reader] == expected
+
+
+def test_seek(tmp_path):
+    filename = str(tmp_path / "txns.bin")
+    expected = _write(filename)
+    with TransactionReader(filename) as reader:
+        found = list(reader.transactions(start=50, end=60, units="ns", monitor="mon.b"))
+        assert [tuple(t) for t in found] == [
+            t for t in expected if 50000 <= t[0] <= 60000 and t[1] == "mon.b"]
+
+        assert list(reader.transactions(start=100, units="ns")) == []
+
+
+def test_truncated(tmp_path):
+    filename = str(tmp_path / "txns.bin")
+    with TransactionRecorder(filename) as recorder:
+        recorder.record("mon", BinaryValue("0101"), time=1)
+        recorder.flush()
+        recorder.record("mon", b"lost", time=2)
+        recorder.flush()
+
+    with open(filename, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 1)
+
+    with TransactionReader(filename) as reader:
+        (transaction,) = reader
+    assert transaction.time == 1
+    assert transaction.data.binstr == "0101"
+
+
+def test_not_a_log(tmp_path):
+    filename = tmp_path / "other.bin"
+    filename.write_bytes(b"something else")
+    with pytest.raises(ValueError):
+        TransactionReader(str(filename))
+
+
+def test_unpicklable(tmp_path, caplog):
+    filename = str(tmp_path / "txns.bin")
+    with TransactionRecorder(filename) as recorder:
+        for time in range(3):
+            recorder.record("mon", {"callback": lambda: None, "time": time}, time=time)
+        recorder.record("mon", {"time": 3}, time=3)
+
+    assert len([r for r in caplog.records if r.levelname == "WARNING"]) == 1
+    with TransactionReader(filename) as reader:
+        found = [t.data for t in reader]
+    assert all(isinstance(data, str) and "callback" in data for data in found[:3])
+    assert found[3] == {"time": 3}
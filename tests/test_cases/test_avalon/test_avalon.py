@@ -31,8 +31,11 @@ A set of tests that demonstrate cocotb functionality
 Also used as regression test of cocotb capabilities
 """
 
+import warnings
+
 import cocotb
 from cocotb.drivers.avalon import AvalonMemory
+from cocotb.drivers.memory import SparseMemory
 from cocotb.triggers import Timer, RisingEdge
 from cocotb.clock import Clock
 from cocotb.result import TestFailure
@@ -41,7 +44,7 @@ from cocotb.result import TestFailure
 class BurstAvlReadTest(object):
     """ class to test avalon burst """
 
-    def __init__(self, dut, avlproperties={}):
+    def __init__(self, dut, avlproperties={}, sparse_memory=False):
         self.dut = dut
         # Launch clock
         dut.reset = 1
@@ -50,10 +53,22 @@ class BurstAvlReadTest(object):
         # Bytes aligned memory
         self.memdict = {value: value for value in range(0x1000)}
 
-        self.avl32 = AvalonMemory(dut, "master", dut.clk,
-                                  memory=self.memdict,
-                                  readlatency_min=0,
-                                  avl_properties=avlproperties)
+        if sparse_memory:
+            memory = SparseMemory()
+            memory.write(0, bytes(value & 0xFF for value in self.memdict.values()))
+            self.avl32 = AvalonMemory(dut, "master", dut.clk,
+                                      memory=memory,
+                                      readlatency_min=0,
+                                      avl_properties=avlproperties)
+        else:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                self.avl32 = AvalonMemory(dut, "master", dut.clk,
+                                          memory=self.memdict,
+                                          readlatency_min=0,
+                                          avl_properties=avlproperties)
+            if not any(issubclass(warning.category, DeprecationWarning) for warning in w):
+                raise TestFailure("Passing a dict as the memory did not raise a DeprecationWarning")
 
     async def init_sig(self, burstcount_w, address):
         """ Initialize all signals """
@@ -67,13 +82,11 @@ class BurstAvlReadTest(object):
         self.dut.master_waitrequest = 0
 
 
-@cocotb.test()
-async def test_burst_read(dut):
-    """ Testing burst read """
+async def burst_read(dut, sparse_memory):
     wordburstcount = 16
     address = 10*wordburstcount
 
-    bart = BurstAvlReadTest(dut, {"readLatency": 10})
+    bart = BurstAvlReadTest(dut, {"readLatency": 10}, sparse_memory)
     await bart.init_sig(wordburstcount, address)
     await Timer(100, "ns")
     # Begin master burst read
@@ -118,3 +131,15 @@ async def test_burst_read(dut):
     await Timer(1, "ns")
     dut.user_read_buffer = 0
     await Timer(1, "ns")
+
+
+@cocotb.test()
+async def test_burst_read(dut):
+    """ Testing burst read """
+    await burst_read(dut, sparse_memory=False)
+
+
+@cocotb.test()
+async def test_burst_read_sparse_memory(dut):
+    """ Testing burst read from a SparseMemory """
+    await burst_read(dut, sparse_memory=True)
@@ -0,0 +1,109 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the single-word accesses to AvalonMemory"""
+
+import warnings
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.drivers.avalon import AvalonMemory
+from cocotb.drivers.memory import SparseMemory
+from cocotb.result import TestFailure
+from cocotb.triggers import ClockCycles, RisingEdge
+
+# Different in every byte, so that overlapping words are noticed
+WORDS = [0x03020100, 0x07060504, 0x0b0a0908, 0x0f0e0d0c]
+
+
+def setup_dut(dut, **kwargs):
+    cocotb.fork(Clock(dut.clk, 10, "ns").start())
+    dut.mem_read <= 0
+    dut.mem_write <= 0
+    dut.mem_byteenable <= (1 << len(dut.mem_byteenable)) - 1
+    return AvalonMemory(dut, "mem", dut.clk, **kwargs)
+
+
+async def write(dut, address, value):
+    await RisingEdge(dut.clk)
+    dut.mem_address <= address
+    dut.mem_writedata <= value
+    dut.mem_write <= 1
+    await RisingEdge(dut.clk)
+    dut.mem_write <= 0
+
+
+async def read(dut, address):
+    await RisingEdge(dut.clk)
+    dut.mem_address <= address
+    dut.mem_read <= 1
+    await RisingEdge(dut.clk)
+    dut.mem_read <= 0
+    # With no readdatavalid, readdata keeps the last response
+    await ClockCycles(dut.clk, 4)
+    return dut.mem_readdata.value.integer
+
+
+async def write_and_read(dut, addresses):
+    for address, value in zip(addresses, WORDS):
+        await write(dut, address, value)
+    for address, value in zip(addresses, WORDS):
+        data = await read(dut, address)
+        if data != value:
+            raise TestFailure("Read {:#x} at address {:#x}, but was expecting {:#x}"
+                              .format(data, address, value))
+
+
+@cocotb.test()
+async def test_word_addresses(dut):
+    """Test single-word accesses at consecutive addresses"""
+    memory = SparseMemory(size=1 << 16)
+    setup_dut(dut, memory=memory)
+    await write_and_read(dut, range(len(WORDS)))
+
+    word_bytes = len(dut.mem_writedata) // 8
+    for address, value in enumerate(WORDS):
+        data = memory.read_word(address * word_bytes, word_bytes)
+        if data != value:
+            raise TestFailure("Word {} of the memory is {:#x}, but was expecting {:#x}"
+                              .format(address, data, value))
+
+
+@cocotb.test()
+async def test_byte_addresses(dut):
+    """Test single-word accesses at consecutive word addresses with byte_addressed"""
+    memory = SparseMemory(size=1 << 16)
+    setup_dut(dut, memory=memory, byte_addressed=True)
+    word_bytes = len(dut.mem_writedata) // 8
+    addresses = [address * word_bytes for address in range(len(WORDS))]
+    await write_and_read(dut, addresses)
+
+    for address, value in zip(addresses, WORDS):
+        data = memory.read_word(address, word_bytes)
+        if data != value:
+            raise TestFailure("The word at {:#x} of the memory is {:#x}, but was expecting {:#x}"
+                              .format(address, data, value))
+
+
+@cocotb.test()
+async def test_dict_is_shared(dut):
+    """Test that a dict passed as the memory is used in place, a word per address"""
+    memdict = {}
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        setup_dut(dut, memory=memdict)
+    if not any(issubclass(warning.category, DeprecationWarning) for warning in w):
+        raise TestFailure("Passing a dict as the memory did not raise a DeprecationWarning")
+
+    await write_and_read(dut, range(len(WORDS)))
+    if memdict != dict(enumerate(WORDS)):
+        raise TestFailure("The dict is {}, but was expecting a word per address"
+                          .format(memdict))
+
+    # Back-door writes are seen by the bus
+    memdict[7] = 0x12345678
+    data = await read(dut, 7)
+    if data != 0x12345678:
+        raise TestFailure("Read {:#x} after a back-door write of 0x12345678"
+                          .format(data))
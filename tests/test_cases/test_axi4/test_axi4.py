@@ -434,6 +434,56 @@ async def test_simultaneous(dut, sync, num=5):
                               .format(i, written, read.integer))
 
 
+@cocotb.test()
+async def test_outstanding(dut, num=8, burst_length=4, max_outstanding=4):
+    """Test pipelined reads/writes with several bursts in flight"""
+
+    axim = AXI4Master(dut, AXI_PREFIX, dut.clk,
+                      max_outstanding_reads=max_outstanding,
+                      max_outstanding_writes=max_outstanding)
+    _, data_width, ram_start, _ = get_parameters(dut)
+
+    await setup_dut(dut)
+
+    addresses = [ram_start + i * burst_length * data_width
+                 for i in range(num)]
+    write_values = [[randrange(0, 2**(data_width * 8))
+                     for i in range(burst_length)] for address in addresses]
+
+    writes = [axim.issue_write(address, values)
+              for address, values in zip(addresses, write_values)]
+    for write in writes:
+        await write
+
+    reads = [axim.issue_read(address, burst_length) for address in addresses]
+    for address, expected_values, read in zip(addresses, write_values, reads):
+        compare_read_values(expected_values, await read, AXIBurst.INCR,
+                            burst_length, address)
+
+    first_ids = [read.id for read in reads[:max_outstanding]]
+    if len(set(first_ids)) != max_outstanding:
+        raise TestFailure("Bursts in flight at once were not given distinct "
+                          "IDs: {}".format(first_ids))
+
+    for name, stats in (("read", axim.stats.reads),
+                        ("write", axim.stats.writes)):
+        if stats.transactions != num or stats.errors:
+            raise TestFailure("Completed {} {} bursts with {} errors, but "
+                              "was expecting {}"
+                              .format(stats.transactions, name, stats.errors,
+                                      num))
+        if stats.max_outstanding != max_outstanding:
+            raise TestFailure("Up to {} {} bursts were in flight, but was "
+                              "expecting {}"
+                              .format(stats.max_outstanding, name,
+                                      max_outstanding))
+        if not 0 < stats.min_latency <= stats.mean_latency <= stats.max_latency:
+            raise TestFailure("Inconsistent {} latencies: min {}, mean {}, "
+                              "max {}"
+                              .format(name, stats.min_latency,
+                                      stats.mean_latency, stats.max_latency))
+
+
 @cocotb.test()
 async def test_axi4lite_write_burst(dut):
     """Test that write bursts are correctly refused by the AXI4-Lite driver"""
@@ -0,0 +1,137 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the AXI4 slave model, driven by the AXI4 master"""
+
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.drivers.amba import (AXI4Master, AXI4Slave, random_backpressure,
+                                 random_latency)
+from cocotb.drivers.memory import SparseMemory
+from cocotb.regression import TestFactory
+from cocotb.result import TestFailure
+from cocotb.triggers import ClockCycles
+
+
+CLK_PERIOD = (10, "ns")
+AXI_PREFIX = "AXI"
+MEMORY_SIZE = 1 << 16
+
+
+def setup_dut(dut, max_outstanding, **slave_kwargs):
+    cocotb.fork(Clock(dut.clk, *CLK_PERIOD).start())
+    axim = AXI4Master(dut, AXI_PREFIX, dut.clk,
+                      max_outstanding_reads=max_outstanding,
+                      max_outstanding_writes=max_outstanding)
+    axis = AXI4Slave(dut, AXI_PREFIX, dut.clk,
+                     memory=SparseMemory(size=MEMORY_SIZE), **slave_kwargs)
+    return axim, axis
+
+
+async def write_and_read(axim, axis, rng, sizes, num=32, byteorder="little"):
+    """Write random bursts, check the memory of the slave, then read them back"""
+    data_width = len(axim.bus.WDATA) // 8
+    expected = {}
+    writes = []
+    for _ in range(num):
+        size = rng.choice(sizes)
+        length = rng.randint(1, 8)
+        address = rng.randrange(0, 4096 - 8 * data_width, size) + \
+            4096 * rng.randrange(MEMORY_SIZE // 4096)
+        values = [rng.randrange(2**(size * 8)) for _ in range(length)]
+        writes.append(axim.issue_write(address, values, size=size))
+        for beat, value in enumerate(values):
+            for offset, byte in enumerate(value.to_bytes(size, byteorder)):
+                expected[address + beat * size + offset] = byte
+
+    for write in writes:
+        await write
+
+    for address, byte in expected.items():
+        if axis.memory[address] != byte:
+            raise TestFailure("Byte {:#x} of the slave memory is {:#x}, but "
+                              "was expecting {:#x}"
+                              .format(address, axis.memory[address], byte))
+
+    reads = []
+    for _ in range(num):
+        size = rng.choice(sizes)
+        length = rng.randint(1, 8)
+        address = rng.randrange(0, 4096 - 8 * data_width, size) + \
+            4096 * rng.randrange(MEMORY_SIZE // 4096)
+        reads.append((address, size, axim.issue_read(address, length, size=size)))
+
+    for address, size, read in reads:
+        values = [value.integer for value in await read]
+        for beat, value in enumerate(values):
+            beat_address = address + beat * size
+            expected_value = int.from_bytes(
+                bytes(expected.get(beat_address + offset, 0)
+                      for offset in range(size)),
+                byteorder)
+            if value != expected_value:
+                raise TestFailure("Read {:#x} at {:#x}, but was expecting {:#x}"
+                                  .format(value, beat_address, expected_value))
+
+    return [read for _, _, read in reads]
+
+
+async def test_master_slave(dut, max_outstanding, latency, backpressure):
+    """Test the slave with several bursts in flight, latency and backpressure"""
+
+    seed = random.getrandbits(32)
+    dut._log.info("Using seed %d for the latencies and backpressure", seed)
+    slave_kwargs = {}
+    if latency:
+        slave_kwargs["read_latency"] = random_latency(0, 20, seed=seed)
+        slave_kwargs["write_latency"] = random_latency(0, 10, seed=seed + 1)
+    if backpressure:
+        slave_kwargs["backpressure"] = {
+            channel: random_backpressure(4, 3, seed=seed + i)
+            for i, channel in enumerate(("AR", "AW", "W", "R"))}
+
+    axim, axis = setup_dut(dut, max_outstanding, **slave_kwargs)
+    await ClockCycles(dut.clk, 2)
+
+    reads = await write_and_read(axim, axis, random.Random(seed), (1, 2, 4))
+
+    if axis.stats.read_bursts != len(reads) or axis.stats.write_bursts != len(reads):
+        raise TestFailure("The slave counted {} reads and {} writes, but was "
+                          "expecting {}"
+                          .format(axis.stats.read_bursts,
+                                  axis.stats.write_bursts, len(reads)))
+
+    if axis.stats.max_outstanding_reads > max_outstanding:
+        raise TestFailure("The slave accepted {} reads at once, but the master "
+                          "sends at most {}"
+                          .format(axis.stats.max_outstanding_reads,
+                                  max_outstanding))
+
+    if max_outstanding > 1:
+        if len({read.id for read in reads[:max_outstanding]}) == 1:
+            raise TestFailure("Bursts in flight at once used the same ID")
+        if latency and [read.end_time for read in reads] == \
+                sorted(read.end_time for read in reads):
+            raise TestFailure("With random latencies, the responses were "
+                              "expected out of order")
+
+
+@cocotb.test()
+async def test_big_endian(dut):
+    """Test full-width bursts with a big-endian slave"""
+
+    axim, axis = setup_dut(dut, 4, big_endian=True)
+    await ClockCycles(dut.clk, 2)
+
+    await write_and_read(axim, axis, random.Random(), (len(axim.bus.WDATA) // 8,),
+                         byteorder="big")
+
+
+master_slave = TestFactory(test_master_slave)
+master_slave.add_option('max_outstanding', (1, 4))
+master_slave.add_option('latency', (False, True))
+master_slave.add_option('backpressure', (False, True))
+master_slave.generate_tests()
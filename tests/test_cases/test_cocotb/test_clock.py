@@ -68,3 +68,54 @@ async def test_external_clock(dut):
         await RisingEdge(dut.clk)
         count += 1
     clk_gen.kill()
+
+
+@cocotb.test()
+async def test_clock_gpi(dut):
+    """Test the native GPI clock implementation"""
+    clk = Clock(dut.clk, 10, "ns", impl="gpi")
+    clk_gen = cocotb.fork(clk.start())
+
+    await Timer(1, "ns")
+    await RisingEdge(dut.clk)
+    start_time_ns = get_sim_time(units='ns')
+    await RisingEdge(dut.clk)
+    edge_time_ns = get_sim_time(units='ns')
+    assert isclose(edge_time_ns, start_time_ns + 10.0), "Expected a period of 10 ns"
+
+    # the new period applies from the next edge on
+    clk.set_period(20, "ns")
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+    start_time_ns = get_sim_time(units='ns')
+    await RisingEdge(dut.clk)
+    edge_time_ns = get_sim_time(units='ns')
+    assert isclose(edge_time_ns, start_time_ns + 20.0), "Expected a period of 20 ns"
+
+    clk_gen.kill()
+    value = dut.clk.value
+    await Timer(100, "ns")
+    assert dut.clk.value == value, "Clock kept toggling after being killed"
+
+
+@cocotb.test()
+async def test_clock_gpi_cycles(dut):
+    """Test that the native GPI clock honours the cycles and start_high arguments"""
+    edges = 0
+
+    async def count_edges():
+        nonlocal edges
+        while True:
+            await RisingEdge(dut.clk)
+            edges += 1
+
+    counter = cocotb.fork(count_edges())
+    start_time_ns = get_sim_time(units='ns')
+    await Clock(dut.clk, 10, "ns", impl="gpi").start(cycles=5, start_high=False)
+    assert isclose(get_sim_time(units='ns'), start_time_ns + 50.0)
+    assert edges == 5
+    assert dut.clk.value == 1
+
+    await Timer(100, "ns")
+    assert edges == 5
+    counter.kill()
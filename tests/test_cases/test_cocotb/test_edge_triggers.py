@@ -10,8 +10,9 @@ Tests for edge triggers
 * ClockCycles
 """
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge, Edge, Timer, ClockCycles, First
+from cocotb.triggers import RisingEdge, FallingEdge, Edge, Timer, ClockCycles, First, ReadOnly
 from cocotb.clock import Clock
+from cocotb.utils import get_sim_time
 
 
 async def count_edges_cycles(signal, edges):
@@ -208,3 +209,64 @@ async def test_clock_cycles_forked(dut):
     b = cocotb.fork(wait_ten())
     await a.join()
     await b.join()
+
+
+@cocotb.test()
+async def test_mixed_edges_same_signal(dut):
+    """ Test that rising, falling and any-edge waiters on one signal all see their edges """
+    clk_gen = cocotb.fork(Clock(dut.clk, 10, "ns").start())
+    await Timer(1, "ns")
+
+    async def count(trigger, n):
+        for _ in range(n):
+            await trigger
+        return get_sim_time("ns")
+
+    rising = cocotb.fork(count(RisingEdge(dut.clk), 5))
+    falling = cocotb.fork(count(FallingEdge(dut.clk), 5))
+    either = cocotb.fork(count(Edge(dut.clk), 10))
+
+    t_rising = await rising.join()
+    t_falling = await falling.join()
+    t_either = await either.join()
+    clk_gen.kill()
+
+    assert t_either == max(t_rising, t_falling)
+    assert abs(t_rising - t_falling) == 5
+
+
+@cocotb.test()
+async def test_clock_cycles_count(dut):
+    """ Test that ClockCycles waits for exactly the requested number of edges """
+    clk_gen = cocotb.fork(Clock(dut.clk, 10, "ns").start())
+
+    await RisingEdge(dut.clk)
+    start = get_sim_time("ns")
+    await ClockCycles(dut.clk, 10)
+    assert get_sim_time("ns") - start == 100
+
+    await FallingEdge(dut.clk)
+    start = get_sim_time("ns")
+    await ClockCycles(dut.clk, 3, rising=False)
+    assert get_sim_time("ns") - start == 30
+
+    # Counting runs alongside plain edge waiters on the same signal
+    edges = 0
+
+    async def count_rising():
+        nonlocal edges
+        while True:
+            await RisingEdge(dut.clk)
+            edges += 1
+
+    counter = cocotb.fork(count_rising())
+    await ClockCycles(dut.clk, 5)
+    await ReadOnly()
+    counter.kill()
+    assert edges == 5
+
+    start = get_sim_time("ns")
+    cycles = ClockCycles(dut.clk, 0)
+    assert await cycles is cycles
+    assert get_sim_time("ns") == start
+    clk_gen.kill()
@@ -7,6 +7,9 @@ Tests for handles
 import logging
 import random
 import cocotb
+from cocotb import simulator
+from cocotb.binary import BinaryValue
+from cocotb.bus import Bus
 from cocotb.triggers import Timer
 
 from common import assert_raises
@@ -316,3 +319,100 @@ async def test_access_underscore_name(dut):
     dut._id("_underscore_name", extended=False) <= 0
     await Timer(1, 'ns')
     assert dut._id("_underscore_name", extended=False).value == 0
+
+
+@cocotb.test()
+async def test_batched_writes(dut):
+    """Writes of different kinds scheduled in the same step are all applied"""
+    dut.stream_in_data <= 0x5A
+    dut.stream_in_data_dqword <= 2**100 + 3
+    dut.stream_in_int <= 12345
+    dut.stream_in_data <= 0xA5  # the last write to a handle wins
+    await Timer(1, "ns")
+    assert dut.stream_in_data.value == 0xA5
+    assert dut.stream_in_data_dqword.value == 2**100 + 3
+    assert dut.stream_in_int.value == 12345
+
+
+@cocotb.test()
+async def test_bulk_reads(dut):
+    """Read several signals with a single simulator call"""
+    dut.stream_in_data <= 0x5A
+    dut.stream_in_data_dword <= 0x12345
+    await Timer(1, "ns")
+
+    handles = [dut.stream_in_data._handle, dut.stream_in_data_dword._handle]
+    assert simulator.get_signal_values(handles) == ["01011010", format(0x12345, "032b")]
+    assert simulator.get_signal_values(handles, "int") == [0x5A, 0x12345]
+    assert simulator.get_signal_values(handles, "bytes") == b"\x5a" + (0x12345).to_bytes(4, "big")
+
+    bus = Bus(dut, "stream_in", ["data", "data_dword"])
+    capture = bus.capture()
+    assert capture.data == 0x5A
+    assert capture.data_dword == 0x12345
+
+
+@cocotb.test()
+async def test_value_int(dut):
+    """Read and write wide signals as integers"""
+    dut.stream_in_data_dqword <= 2**127 + 5
+    await Timer(1, "ns")
+    assert dut.stream_in_data_dqword.value_int == 2**127 + 5
+    assert dut.stream_in_data_dqword._handle.get_signal_val_vector() == (2**127 + 5, 0, 128)
+
+    dut.stream_in_data_dqword <= -2
+    await Timer(1, "ns")
+    assert dut.stream_in_data_dqword.value_int == 2**128 - 2
+
+    dut.stream_in_data_dqword <= BinaryValue("x" + "0" * 126 + "1")
+    await Timer(1, "ns")
+    assert dut.stream_in_data_dqword._handle.get_signal_val_vector() == (1, 2**127, 128)
+    with assert_raises(ValueError):
+        dut.stream_in_data_dqword.value_int
+
+
+@cocotb.test()
+async def test_handle_store_stats(dut):
+    """Repeated lookups by name are answered from the GPI child name index"""
+    before = simulator.get_handle_store_stats()
+    first = dut._handle.get_handle_by_name("stream_in_data")
+    assert not dut._handle.get_handle_by_name("does_not_exist")
+    after_first = simulator.get_handle_store_stats()
+
+    assert dut._handle.get_handle_by_name("stream_in_data") == first
+    assert not dut._handle.get_handle_by_name("does_not_exist")
+    after = simulator.get_handle_store_stats()
+
+    assert after["index_hits"] - after_first["index_hits"] == 2
+    assert after["index_misses"] == after_first["index_misses"]
+    assert after["handles"] >= before["handles"]
+
+
+@cocotb.test()
+async def test_resolve_many(dut):
+    """Several paths are resolved at once, and the handles are cached as by attribute access"""
+    handles = dut._resolve_many([
+        "stream_in_data", "does_not_exist", "array_7_downto_4[5]",
+        "stream_in_data.does_not_exist", "array_7_downto_4[5]",
+    ])
+    assert handles[0] is dut.stream_in_data
+    assert handles[1] is None
+    assert handles[2] is dut.array_7_downto_4[5]
+    assert handles[3] is None
+    assert handles[4] is handles[2]
+    assert "does_not_exist" in dut._invalid_sub_handles
+
+    with assert_raises(ValueError):
+        dut._resolve_many(["stream_in_data[x]"])
+
+
+@cocotb.test()
+async def test_bus_optional_signals(dut):
+    """A Bus looks up its required and optional signals in one go"""
+    bus = Bus(dut, "stream_in", ["valid", "data"], optional_signals=["does_not_exist", "ready"])
+    assert bus.valid is dut.stream_in_valid
+    assert bus.ready is dut.stream_in_ready
+    assert not hasattr(bus, "does_not_exist")
+
+    with assert_raises(AttributeError):
+        Bus(dut, "stream_in", ["does_not_exist"])
@@ -0,0 +1,74 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests of the receive queue of cocotb.monitors.Monitor
+"""
+import cocotb
+from cocotb.monitors import Monitor, MonitorOverflowError
+from cocotb.triggers import Timer
+
+
+class CountingMonitor(Monitor):
+    """Receives the numbers 0 to 9, one every nanosecond."""
+
+    def __init__(self, **kwargs):
+        self.sent = 0
+        super().__init__(**kwargs)
+
+    async def _monitor_recv(self):
+        for i in range(10):
+            await Timer(1, "ns")
+            self.sent += 1
+            self._recv(i)
+
+
+@cocotb.test()
+async def test_drop_oldest(dut):
+    monitor = CountingMonitor(maxlen=3)
+    await Timer(20, "ns")
+    assert list(monitor._recvQ) == [7, 8, 9]
+    assert monitor.stats.dropped_transactions == 7
+    assert monitor.stats.max_queue_length == 3
+
+
+@cocotb.test()
+async def test_drop_newest(dut):
+    monitor = CountingMonitor(maxlen=3, overflow="drop_newest")
+    await Timer(20, "ns")
+    assert list(monitor._recvQ) == [0, 1, 2]
+    assert monitor.stats.dropped_transactions == 7
+
+
+@cocotb.test(expect_error=MonitorOverflowError)
+async def test_raise(dut):
+    CountingMonitor(maxlen=3, overflow="raise")
+    await Timer(20, "ns")
+
+
+@cocotb.test()
+async def test_block(dut):
+    monitor = CountingMonitor(maxlen=2, overflow="block")
+    await Timer(20, "ns")
+    # Paused before its third Timer
+    assert monitor.sent == 2
+
+    received = []
+    async for transaction in monitor:
+        received.append(transaction)
+        if transaction == 9:
+            break
+    assert received == list(range(10))
+    assert monitor.stats.dropped_transactions == 0
+    assert monitor.stats.max_queue_length == 2
+
+
+@cocotb.test()
+async def test_async_iteration(dut):
+    monitor = CountingMonitor()
+    received = []
+    async for transaction in monitor:
+        received.append(transaction)
+    # The iteration ends with the monitor coroutine
+    assert received == list(range(10))
+    assert len(monitor) == 0